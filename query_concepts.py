@@ -4,6 +4,7 @@
 import argparse
 import logging
 import os
+import re
 import sys
 
 # Configure logging
@@ -17,6 +18,8 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 try:
     # Import required modules
+    from neo4j.exceptions import ClientError
+
     from src.database.neo4j_db import Neo4jDatabase
 except ImportError as e:
     logger.error(f"Failed to import required modules: {e}")
@@ -24,6 +27,71 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Full-text index over concept names, created by Neo4jDatabase.create_schema
+CONCEPT_NAME_INDEX = "concept_name_ft"
+
+# Queries made only of ASCII words are tokenized the same way by the index
+# analyzer, so every name containing them is among the full-text hits; other
+# queries (e.g. "c++") go straight to the CONTAINS scan
+_PLAIN_QUERY_RE = re.compile(r"[A-Za-z0-9_]+(?:\s+[A-Za-z0-9_]+)*")
+
+# Top related concepts of each matched concept ``c``, returned with it
+_RELATED_CONCEPTS = """
+        WITH c
+        ORDER BY size(c.name) ASC
+        LIMIT $limit
+        CALL {
+            WITH c
+            OPTIONAL MATCH (c)-[r:RELATED_TO]-(related:Concept)
+            WITH related, r
+            ORDER BY r.strength DESC
+            LIMIT 5
+            RETURN collect(
+                CASE WHEN related IS NOT NULL
+                THEN {id: related.id, name: related.name, strength: r.strength}
+                END
+            ) AS related
+        }
+        RETURN c.id AS id, c.name AS name, c.type AS type,
+               c.description AS description, related
+        ORDER BY size(name) ASC
+"""
+
+# Case-insensitive substring match on concept names (label scan)
+CONTAINS_QUERY = (
+    """
+        MATCH (c:Concept)
+        WHERE toLower(c.name) CONTAINS toLower($query)
+"""
+    + _RELATED_CONCEPTS
+)
+
+# Same match, with candidates narrowed by the full-text index first
+FULLTEXT_QUERY = (
+    """
+        CALL db.index.fulltext.queryNodes($index, $lucene_query)
+        YIELD node AS c
+        WHERE toLower(c.name) CONTAINS toLower($query)
+"""
+    + _RELATED_CONCEPTS
+)
+
+
+def _fulltext_query(query: str) -> str | None:
+    """Build a Lucene query matching names that contain every term of ``query``.
+
+    Args:
+        query: Free-text search query
+
+    Returns:
+        Lucene query string, or None if ``query`` is not made of plain words
+
+    """
+    if not _PLAIN_QUERY_RE.fullmatch(query.strip()):
+        return None
+    return " AND ".join(f"*{term}*" for term in query.lower().split())
+
+
 def find_concepts(query: str, limit: int = 10) -> None:
     """Find concepts in Neo4j that match the query.
 
@@ -43,16 +111,26 @@ def find_concepts(query: str, limit: int = 10) -> None:
     logger.info(f"Searching for concepts matching: '{query}'")
 
     try:
-        # Find concepts by name (case-insensitive)
-        cypher_query = """
-        MATCH (c:Concept)
-        WHERE toLower(c.name) CONTAINS toLower($query)
-        RETURN c.id AS id, c.name AS name, c.type AS type, c.description AS description
-        ORDER BY size(c.name) ASC
-        LIMIT $limit
-        """
-
-        results = neo4j_db.run_query(cypher_query, {"query": query, "limit": limit})
+        # Names are matched with a case-insensitive CONTAINS either way; for
+        # plain-word queries the full-text index narrows the candidates first
+        parameters = {"query": query, "limit": limit}
+        lucene_query = _fulltext_query(query)
+        results = None
+        if lucene_query:
+            try:
+                results = neo4j_db.run_query(
+                    FULLTEXT_QUERY,
+                    {
+                        **parameters,
+                        "index": CONCEPT_NAME_INDEX,
+                        "lucene_query": lucene_query,
+                    },
+                )
+            except ClientError as e:
+                # Typically the index has not been created yet
+                logger.debug(f"Full-text search unavailable, scanning names: {e}")
+        if results is None:
+            results = neo4j_db.run_query(CONTAINS_QUERY, parameters)
 
         if not results:
             logger.info(f"No concepts found matching '{query}'")
@@ -73,17 +151,7 @@ def find_concepts(query: str, limit: int = 10) -> None:
             if description:
                 logger.info(f"  Description: {description}")
 
-            # Find related concepts
-            related_query = """
-            MATCH (c:Concept {id: $concept_id})-[r:RELATED_TO]-(related:Concept)
-            RETURN related.id AS id, related.name AS name, r.strength AS strength
-            ORDER BY r.strength DESC
-            LIMIT 5
-            """
-
-            related_results = neo4j_db.run_query(
-                related_query, {"concept_id": concept_id}
-            )
+            related_results = result.get("related", [])
 
             if related_results:
                 logger.info("  Related concepts:")
@@ -36,41 +36,50 @@ def query_neo4j() -> None:
     logger.info(f"Successfully connected to Neo4j at {neo4j_db.uri}")
 
     try:
-        # Get node count
-        result = neo4j_db.run_query("MATCH (n) RETURN count(n) as count")
-        node_count = result[0]["count"]
-        logger.info(f"Total nodes in Neo4j: {node_count}")
-
-        # Get node counts by label
-        result = neo4j_db.run_query(
-            "MATCH (n) RETURN labels(n) as label, count(*) as count"
+        # Gather every statistic in one round-trip
+        stats = neo4j_db.run_query_and_return_single(
+            """
+            CALL { MATCH (n) RETURN count(n) AS node_count }
+            CALL {
+                MATCH (n)
+                WITH labels(n) AS label, count(*) AS count
+                RETURN collect({label: label, count: count}) AS label_counts
+            }
+            CALL { MATCH ()-[r]->() RETURN count(r) AS rel_count }
+            CALL {
+                MATCH ()-[r]->()
+                WITH type(r) AS type, count(*) AS count
+                RETURN collect({type: type, count: count}) AS type_counts
+            }
+            CALL {
+                MATCH (c:Concept)
+                WITH c.name AS name
+                LIMIT 10
+                RETURN collect(name) AS sample_concepts
+            }
+            RETURN node_count, label_counts, rel_count, type_counts, sample_concepts
+            """
         )
+
+        logger.info(f"Total nodes in Neo4j: {stats['node_count']}")
+
         logger.info("Node counts by label:")
-        for row in result:
+        for row in stats["label_counts"]:
             label = row["label"][0] if row["label"] else "No Label"
             count = row["count"]
             logger.info(f"  - {label}: {count}")
 
-        # Get relationship count
-        result = neo4j_db.run_query("MATCH ()-[r]->() RETURN count(r) as count")
-        rel_count = result[0]["count"]
-        logger.info(f"Total relationships in Neo4j: {rel_count}")
+        logger.info(f"Total relationships in Neo4j: {stats['rel_count']}")
 
-        # Get relationship counts by type
-        result = neo4j_db.run_query(
-            "MATCH ()-[r]->() RETURN type(r) as type, count(*) as count"
-        )
         logger.info("Relationship counts by type:")
-        for row in result:
+        for row in stats["type_counts"]:
             rel_type = row["type"]
             count = row["count"]
             logger.info(f"  - {rel_type}: {count}")
 
-        # Get sample concepts
-        result = neo4j_db.run_query("MATCH (c:Concept) RETURN c.name as name LIMIT 10")
         logger.info("Sample concepts:")
-        for row in result:
-            logger.info(f"  - {row['name']}")
+        for name in stats["sample_concepts"]:
+            logger.info(f"  - {name}")
 
     finally:
         # Close connection
@@ -95,7 +104,8 @@ def query_chromadb() -> None:
 
         # Get sample documents
         if count > 0:
-            results = vector_db.get(limit=5)
+            # Only metadata is printed, so skip documents and embeddings
+            results = vector_db.get(limit=5, include=["metadatas"])
 
             logger.info("Sample documents:")
             for i, doc_id in enumerate(results.get("ids", [])):
@@ -2,8 +2,12 @@
 """Script to check relationship types in Neo4j."""
 
 import logging
+import math
 import os
 import sys
+from collections.abc import Iterable
+from itertools import groupby
+from operator import itemgetter
 
 # Configure logging
 logging.basicConfig(
@@ -16,13 +20,118 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
 try:
     # Import required modules
+    from neo4j import Record
+
     from src.database.neo4j_db import Neo4jDatabase
 except ImportError as e:
-    logger.error(f"Failed to import required modules: {e}")
+    logger.error("Failed to import required modules: %s", e)
     logger.info("Make sure you're running this script from the project root directory")
     sys.exit(1)
 
 
+# Count for one relationship type. With the type fixed in the pattern, Neo4j
+# answers from its counts store instead of scanning every relationship.
+RELATIONSHIP_COUNT_BRANCH = """
+    MATCH ()-[r:`{rel_type}`]->()
+    RETURN 'counts' AS section, $types[{index}] AS type, count(r) AS count,
+        null AS source, null AS target, null AS strength
+"""
+
+# Relationship strengths rounded up to the nearest tenth, with their counts.
+# Grouping on a number keeps the server-side work to one cheap aggregation;
+# the tenths are summed into STRENGTH_RANGES in Python.
+STRENGTH_DISTRIBUTION_BRANCH = """
+    MATCH ()-[r]->()
+    WHERE r.strength IS NOT NULL
+    WITH ceil(r.strength * 10) / 10.0 AS strength, count(*) AS count
+    RETURN 'strengths' AS section, null AS type, count,
+        null AS source, null AS target, strength
+"""
+
+SAMPLE_RELATIONSHIPS_BRANCH = """
+    MATCH (c1:Concept)-[r]->(c2:Concept)
+    WITH type(r) AS type, c1.name AS source, c2.name AS target, r.strength AS strength
+    ORDER BY type, strength DESC
+    LIMIT 20
+    RETURN 'samples' AS section, type, null AS count,
+        source, target, strength
+"""
+
+
+# Upper bound (inclusive) and label of each reported strength range
+STRENGTH_RANGES = (
+    (0.3, "Low (0.0-0.3)"),
+    (0.6, "Medium (0.3-0.6)"),
+    (0.9, "High (0.6-0.9)"),
+    (math.inf, "Very High (0.9-1.0)"),
+)
+
+# Report sections in the order the overview query returns them
+SECTION_HEADERS = {
+    "counts": "Relationship counts by type:",
+    "strengths": "\nRelationship strength distribution:",
+    "samples": "\nSample relationships:",
+}
+
+
+def _relationship_overview_query(rel_types: list[str]) -> str:
+    """Build the query for relationship counts, strengths and samples.
+
+    The report sections are UNION ALL branches of one subquery, so they are
+    fetched in a single round-trip and arrive in report order. Every branch
+    returns the same columns, and "section" says which part of the report a
+    row belongs to.
+
+    Args:
+        rel_types: Relationship types to count, passed to the query as $types
+
+    Returns:
+        Cypher query
+
+    """
+    columns = "section, type, count, source, target, strength"
+    branches = [STRENGTH_DISTRIBUTION_BRANCH, SAMPLE_RELATIONSHIPS_BRANCH]
+    if rel_types:
+        count_branches = [
+            RELATIONSHIP_COUNT_BRANCH.replace(
+                "{rel_type}", rel_type.replace("`", "``")
+            ).replace("{index}", str(index))
+            for index, rel_type in enumerate(rel_types)
+        ]
+        # Types stay listed after their last relationship is deleted
+        branches.insert(
+            0,
+            "\n    CALL {"
+            + "  UNION ALL".join(count_branches)
+            + "    }\n"
+            + "    WITH * WHERE count > 0\n"
+            + f"    RETURN {columns}\n"
+            + "    ORDER BY count DESC\n",
+        )
+    return "CALL {" + "  UNION ALL".join(branches) + f"}}\nRETURN {columns}"
+
+
+def _log_strength_distribution(rows: Iterable[Record]) -> None:
+    """Log how many relationships fall in each of STRENGTH_RANGES.
+
+    Args:
+        rows: Overview rows with a strength rounded up to a tenth and a count
+
+    """
+    range_counts = [0] * len(STRENGTH_RANGES)
+    for row in rows:
+        index = next(
+            i
+            for i, (upper, _) in enumerate(STRENGTH_RANGES)
+            if row["strength"] <= upper
+        )
+        range_counts[index] += row["count"]
+
+    for (_, label), count in zip(STRENGTH_RANGES, range_counts, strict=True):
+        if count:
+            logger.info("  - %s: %s", label, count)
+
+
 def check_relationship_types() -> None:
     """Check relationship types in Neo4j."""
     # Initialize Neo4j database
@@ -33,93 +142,73 @@ def check_relationship_types() -> None:
         logger.error("Failed to connect to Neo4j database")
         return
 
-    logger.info(f"Successfully connected to Neo4j at {neo4j_db.uri}")
+    logger.info("Successfully connected to Neo4j at %s", neo4j_db.uri)
 
     try:
-        # Get relationship counts by type
-        query = """
-        MATCH ()-[r]->()
-        RETURN type(r) as type, count(*) as count
-        ORDER BY count DESC
-        """
-
-        results = neo4j_db.run_query(query)
-
-        logger.info("Relationship counts by type:")
-        for row in results:
-            rel_type = row["type"]
-            count = row["count"]
-            logger.info(f"  - {rel_type}: {count}")
-
-        # Get relationship strength distribution
-        query = """
-        MATCH ()-[r]->()
-        WHERE r.strength IS NOT NULL
-        RETURN
-            CASE
-                WHEN r.strength <= 0.3 THEN 'Low (0.0-0.3)'
-                WHEN r.strength <= 0.6 THEN 'Medium (0.3-0.6)'
-                WHEN r.strength <= 0.9 THEN 'High (0.6-0.9)'
-                ELSE 'Very High (0.9-1.0)'
-            END as strength_range,
-            count(*) as count
-        ORDER BY
-            CASE strength_range
-                WHEN 'Low (0.0-0.3)' THEN 1
-                WHEN 'Medium (0.3-0.6)' THEN 2
-                WHEN 'High (0.6-0.9)' THEN 3
-                WHEN 'Very High (0.9-1.0)' THEN 4
-            END
-        """
-
-        results = neo4j_db.run_query(query)
-
-        logger.info("\nRelationship strength distribution:")
-        for row in results:
-            strength_range = row["strength_range"]
-            count = row["count"]
-            logger.info(f"  - {strength_range}: {count}")
-
-        # Get sample relationships for each type
-        query = """
-        MATCH (c1:Concept)-[r]->(c2:Concept)
-        RETURN type(r) as type, c1.name as source, c2.name as target, r.strength as strength
-        ORDER BY type, r.strength DESC
-        LIMIT 20
-        """
-
-        results = neo4j_db.run_query(query)
-
-        logger.info("\nSample relationships:")
-        current_type = None
-        for row in results:
-            rel_type = row["type"]
-            source = row["source"]
-            target = row["target"]
-            strength = row["strength"]
-
-            if rel_type != current_type:
-                logger.info(f"\n  {rel_type}:")
-                current_type = rel_type
-
-            logger.info(f"    - {source} -> {target} (Strength: {strength:.2f})")
-
-        # Check for concept reuse across documents
-        query = """
-        MATCH (d1:Document)-[:MENTIONS]->(c:Concept)<-[:MENTIONS]-(d2:Document)
-        WHERE d1.id < d2.id
-        RETURN c.name as concept, count(DISTINCT d1) as document_count
-        ORDER BY document_count DESC
-        LIMIT 10
-        """
-
-        results = neo4j_db.run_query(query)
-
-        logger.info("\nConcepts shared across documents:")
-        for row in results:
-            concept = row["concept"]
-            doc_count = row["document_count"]
-            logger.info(f"  - {concept}: mentioned in {doc_count} documents")
+        # All queries run in one session and one read transaction, so the
+        # report is taken from a single snapshot of the graph. Records are
+        # consumed as the driver fetches them.
+        with neo4j_db.session() as session, session.begin_transaction() as tx:
+            # Counts, strength distribution and samples come back from one query
+            # in report order, each row tagged with the section it belongs to.
+            # Rows are logged as they are streamed rather than collected first.
+            rel_types = [
+                row["relationshipType"]
+                for row in tx.run("CALL db.relationshipTypes() YIELD relationshipType")
+            ]
+            sections = groupby(
+                tx.run(_relationship_overview_query(rel_types), {"types": rel_types}),
+                key=itemgetter("section"),
+            )
+            section, rows = next(sections, (None, iter(())))
+            for name, header in SECTION_HEADERS.items():
+                logger.info(header)
+                if name != section:
+                    # No rows for this section
+                    continue
+
+                if section == "counts":
+                    for row in rows:
+                        logger.info("  - %s: %s", row["type"], row["count"])
+                elif section == "strengths":
+                    _log_strength_distribution(rows)
+                else:
+                    current_type = None
+                    for row in rows:
+                        rel_type = row["type"]
+                        source = row["source"]
+                        target = row["target"]
+                        strength = row["strength"]
+
+                        if rel_type != current_type:
+                            logger.info("\n  %s:", rel_type)
+                            current_type = rel_type
+
+                        logger.info(
+                            "    - %s -> %s (Strength: %.2f)", source, target, strength
+                        )
+
+                section, rows = next(sections, (None, iter(())))
+
+            # Check for concept reuse across documents. Counting each concept's
+            # mentions once avoids expanding every pair of documents that
+            # share it.
+            query = """
+            MATCH (c:Concept)
+            WITH c, size([(d:Document)-[:MENTIONS]->(c) | d]) AS document_count
+            WHERE document_count > 1
+            RETURN c.name as concept, document_count
+            ORDER BY document_count DESC
+            LIMIT 10
+            """
+
+            logger.info("\nConcepts shared across documents:")
+            for row in tx.run(query):
+                concept = row["concept"]
+                doc_count = row["document_count"]
+                logger.info("  - %s: mentioned in %s documents", concept, doc_count)
+
+            tx.commit()
 
     finally:
         # Close Neo4j connection
@@ -9,25 +9,51 @@ This script:
 import argparse
 import os
 import shutil
+import socket
 import subprocess
 import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 # Add the project root directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.append(PROJECT_ROOT)
 
 from dotenv import load_dotenv
 
 from src.database.neo4j_db import Neo4jDatabase
 from src.database.vector_db import VectorDatabase
 
-
-def clean_neo4j(neo4j_db: Neo4jDatabase, confirm: bool = False) -> bool:
+# Neo4j service scripts and the locations probed for a Neo4j installation.
+# Environment variables are still read per call, after main() loads .env.
+STOP_NEO4J_SCRIPT = os.path.join(
+    PROJECT_ROOT, "scripts", "service_management", "stop_neo4j.sh"
+)
+START_NEO4J_SCRIPT = os.path.join(
+    PROJECT_ROOT, "scripts", "service_management", "start_neo4j.sh"
+)
+HOMEBREW_NEO4J_DIR = "/opt/homebrew"
+GRAPHRAG_NEO4J_DIR = os.path.join(os.path.expanduser("~"), ".graphrag", "neo4j")
+PROJECT_NEO4J_DIR = os.path.join(PROJECT_ROOT, "neo4j")
+
+# How long the stop script may run, and how long to wait afterwards for
+# Neo4j to stop accepting connections
+NEO4J_STOP_SCRIPT_TIMEOUT = 30
+NEO4J_STOP_TIMEOUT = 5.0
+NEO4J_STOP_POLL_INTERVAL = 0.2
+
+
+def clean_neo4j(
+    neo4j_db: Neo4jDatabase, confirm: bool = False, threads: int = 1
+) -> bool:
     """Clear all data from Neo4j.
 
     Args:
         neo4j_db: Neo4j database instance
         confirm: Whether to skip confirmation prompt
+        threads: Number of concurrent transactions deleting relationships
 
     Returns:
         True if successful, False otherwise
@@ -40,15 +66,16 @@ def clean_neo4j(neo4j_db: Neo4jDatabase, confirm: bool = False) -> bool:
         print("❌ Neo4j connection failed!")
         return False
 
-    # Get node count
-    query = "MATCH (n) RETURN count(n) as count"
-    result = neo4j_db.run_query_and_return_single(query)
-    node_count = result.get("count", 0)
-
-    # Get relationship count
-    query = "MATCH ()-[r]->() RETURN count(r) as count"
+    # Get node and relationship counts. Unfiltered counts like these are read
+    # from Neo4j's counts store rather than by scanning the graph.
+    query = """
+    CALL { MATCH (n) RETURN count(n) AS node_count }
+    CALL { MATCH ()-[r]->() RETURN count(r) AS rel_count }
+    RETURN node_count, rel_count
+    """
     result = neo4j_db.run_query_and_return_single(query)
-    rel_count = result.get("count", 0)
+    node_count = result.get("node_count", 0)
+    rel_count = result.get("rel_count", 0)
 
     print(f"Found {node_count} nodes and {rel_count} relationships in Neo4j")
 
@@ -61,7 +88,7 @@ def clean_neo4j(neo4j_db: Neo4jDatabase, confirm: bool = False) -> bool:
 
     # Clear all data
     print("Clearing all data from Neo4j...")
-    neo4j_db.run_query("MATCH (n) DETACH DELETE n")
+    neo4j_db.clear_database(concurrency=threads)
 
     # Verify deletion
     query = "MATCH (n) RETURN count(n) as count"
@@ -76,12 +103,91 @@ def clean_neo4j(neo4j_db: Neo4jDatabase, confirm: bool = False) -> bool:
         return False
 
 
-def physically_delete_neo4j(confirm: bool = False, restart: bool = True) -> bool:
+def _clear_directory(path: str, max_workers: int = 1) -> None:
+    """Delete everything inside a directory, keeping the directory itself.
+
+    Args:
+        path: Directory to empty
+        max_workers: Number of threads deleting top-level entries at once
+
+    """
+    # Directory entries carry their type, so no extra stat call per item
+    with os.scandir(path) as entries:
+        if max_workers <= 1:
+            for entry in entries:
+                _delete_entry(entry)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so the first failure is raised
+            list(executor.map(_delete_entry, entries))
+
+
+def _delete_entry(entry: os.DirEntry) -> None:
+    """Delete a file, symlink or directory tree.
+
+    Args:
+        entry: Directory entry to delete
+
+    """
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)
+
+
+def _wait_for_neo4j_stop(uri: str | None) -> None:
+    """Wait until nothing is listening on Neo4j's Bolt port.
+
+    Args:
+        uri: Bolt URI of the server being stopped; without one the full
+            timeout is slept
+
+    """
+    if uri is None:
+        time.sleep(NEO4J_STOP_TIMEOUT)
+        return
+
+    parts = urlsplit(uri)
+    address = (parts.hostname or "localhost", parts.port or 7687)
+    deadline = time.monotonic() + NEO4J_STOP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(address, timeout=NEO4J_STOP_POLL_INTERVAL):
+                pass
+        except OSError:
+            return
+        time.sleep(NEO4J_STOP_POLL_INTERVAL)
+
+
+def _run_cleanups(cleanups: list[Callable[[], bool]], concurrent: bool) -> list[bool]:
+    """Run database cleanups, overlapping them when allowed.
+
+    Args:
+        cleanups: Cleanup callables returning their success status
+        concurrent: Whether the cleanups may run at the same time; callers pass
+            False when a cleanup may prompt for confirmation
+
+    Returns:
+        The success status of each cleanup, in order
+
+    """
+    if not concurrent or len(cleanups) < 2:
+        return [cleanup() for cleanup in cleanups]
+
+    with ThreadPoolExecutor(max_workers=len(cleanups)) as executor:
+        futures = [executor.submit(cleanup) for cleanup in cleanups]
+        return [future.result() for future in futures]
+
+
+def physically_delete_neo4j(
+    confirm: bool = False, restart: bool = True, uri: str | None = None
+) -> bool:
     """Physically delete Neo4j database files.
 
     Args:
         confirm: Whether to skip confirmation prompt
         restart: Whether to restart Neo4j after deletion
+        uri: Bolt URI of the server, used to detect when it has stopped
 
     Returns:
         True if successful, False otherwise
@@ -107,33 +213,21 @@ def physically_delete_neo4j(confirm: bool = False, restart: bool = True) -> bool
         print(f"  NEO4J_DATABASES_DIR: {neo4j_databases_dir}")
         print(f"  NEO4J_TRANSACTIONS_DIR: {neo4j_tx_dir}")
     else:
-        # Check standard locations
-        home_dir = os.path.expanduser("~")
-
-        # Check Homebrew installation (standard location for binaries)
-        homebrew_neo4j_dir = "/opt/homebrew"
-
-        # Check ~/.graphrag/neo4j (application data location)
-        graphrag_neo4j_dir = os.path.join(home_dir, ".graphrag", "neo4j")
-
-        # Check project directory (legacy location)
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        project_neo4j_dir = os.path.join(project_root, "neo4j")
-
-        # Determine which Neo4j installation to use
-        if os.path.exists(homebrew_neo4j_dir) and os.path.isdir(homebrew_neo4j_dir):
+        # Check standard locations: Homebrew binaries with data in
+        # ~/.graphrag/neo4j, then the legacy project directory
+        if os.path.isdir(HOMEBREW_NEO4J_DIR):
             # Using Homebrew installation with data in .graphrag
-            neo4j_dir = homebrew_neo4j_dir
-            neo4j_databases_dir = os.path.join(graphrag_neo4j_dir, "data", "databases")
-            neo4j_tx_dir = os.path.join(graphrag_neo4j_dir, "data", "transactions")
+            neo4j_dir = HOMEBREW_NEO4J_DIR
+            neo4j_databases_dir = os.path.join(GRAPHRAG_NEO4J_DIR, "data", "databases")
+            neo4j_tx_dir = os.path.join(GRAPHRAG_NEO4J_DIR, "data", "transactions")
             print(
                 "Using Neo4j installation from Homebrew at /opt/homebrew with data in ~/.graphrag/neo4j"
             )
-        elif os.path.exists(project_neo4j_dir) and os.path.isdir(project_neo4j_dir):
+        elif os.path.isdir(PROJECT_NEO4J_DIR):
             # Legacy installation in project directory
-            neo4j_dir = project_neo4j_dir
-            neo4j_databases_dir = os.path.join(project_neo4j_dir, "data", "databases")
-            neo4j_tx_dir = os.path.join(project_neo4j_dir, "data", "transactions")
+            neo4j_dir = PROJECT_NEO4J_DIR
+            neo4j_databases_dir = os.path.join(PROJECT_NEO4J_DIR, "data", "databases")
+            neo4j_tx_dir = os.path.join(PROJECT_NEO4J_DIR, "data", "transactions")
             print(f"Using Neo4j installation in project directory: {neo4j_dir}")
         else:
             print("❌ Neo4j installation not found in standard locations")
@@ -158,17 +252,15 @@ def physically_delete_neo4j(confirm: bool = False, restart: bool = True) -> bool
 
     # Stop Neo4j server if it's running
     print("Stopping Neo4j server...")
-    # Get project root for scripts
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    stop_script = os.path.join(project_root, "scripts", "stop_neo4j.sh")
-
-    if os.path.exists(stop_script):
+    if os.path.exists(STOP_NEO4J_SCRIPT):
         try:
-            subprocess.run([stop_script], check=True)
+            subprocess.run(
+                [STOP_NEO4J_SCRIPT], check=True, timeout=NEO4J_STOP_SCRIPT_TIMEOUT
+            )
             print("✅ Neo4j server stopped")
             # Wait for Neo4j to fully stop
-            time.sleep(5)
-        except subprocess.CalledProcessError as e:
+            _wait_for_neo4j_stop(uri)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             print(f"⚠️  Warning: Failed to stop Neo4j server: {e}")
             print("Continuing with deletion anyway...")
     else:
@@ -184,12 +276,7 @@ def physically_delete_neo4j(confirm: bool = False, restart: bool = True) -> bool
         print(f"Deleting Neo4j databases directory: {neo4j_databases_dir}")
         try:
             # Delete all contents but keep the directory
-            for item in os.listdir(neo4j_databases_dir):
-                item_path = os.path.join(neo4j_databases_dir, item)
-                if os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
-                else:
-                    os.remove(item_path)
+            _clear_directory(neo4j_databases_dir)
             print("✅ Successfully deleted Neo4j databases directory contents")
         except Exception as e:
             print(f"❌ Failed to delete Neo4j databases directory: {e}")
@@ -200,12 +287,7 @@ def physically_delete_neo4j(confirm: bool = False, restart: bool = True) -> bool
         print(f"Deleting Neo4j transactions directory: {neo4j_tx_dir}")
         try:
             # Delete all contents but keep the directory
-            for item in os.listdir(neo4j_tx_dir):
-                item_path = os.path.join(neo4j_tx_dir, item)
-                if os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
-                else:
-                    os.remove(item_path)
+            _clear_directory(neo4j_tx_dir)
             print("✅ Successfully deleted Neo4j transactions directory contents")
         except Exception as e:
             print(f"❌ Failed to delete Neo4j transactions directory: {e}")
@@ -214,15 +296,16 @@ def physically_delete_neo4j(confirm: bool = False, restart: bool = True) -> bool
     # Restart Neo4j if requested
     if restart and success:
         print("Restarting Neo4j server...")
-        # Get project root for scripts (if not already defined)
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        start_script = os.path.join(project_root, "scripts", "start_neo4j.sh")
-
-        if os.path.exists(start_script):
+        if os.path.exists(START_NEO4J_SCRIPT):
             try:
-                # Start Neo4j in the background
+                # Start Neo4j in the background, detached from this process.
+                # Its output is discarded: pipes that are never read would
+                # block the script once the OS buffer fills.
                 subprocess.Popen(
-                    [start_script], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                    [START_NEO4J_SCRIPT],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
                 )
                 print("✅ Neo4j server restarting in the background")
                 print("⚠️  Note: It may take a few moments for Neo4j to fully start")
@@ -268,15 +351,26 @@ def clean_chromadb(vector_db: VectorDatabase, confirm: bool = False) -> bool:
             print("Operation cancelled")
             return False
 
-    # Delete the directory
-    print(f"Deleting ChromaDB directory: {persist_dir}")
+    # Reset through ChromaDB itself, which clears its data in place and
+    # keeps the open client's state consistent
+    print(f"Resetting ChromaDB at: {persist_dir}")
     try:
-        shutil.rmtree(persist_dir)
-        print("✅ Successfully deleted ChromaDB directory")
+        if vector_db.client is None:
+            vector_db.connect()
+        vector_db.client.reset()
+        vector_db.collection = None
+        print("✅ Successfully reset ChromaDB")
+        return True
+    except Exception as e:
+        print(f"⚠️  Warning: ChromaDB reset failed: {e}")
+        print("Falling back to deleting the ChromaDB directory...")
 
-        # Recreate the directory
-        os.makedirs(persist_dir, exist_ok=True)
-        print("✅ Recreated empty ChromaDB directory")
+    # Delete the directory's contents. Collection segments are separate
+    # subdirectories, so they are deleted in parallel.
+    print(f"Deleting ChromaDB directory contents: {persist_dir}")
+    try:
+        _clear_directory(persist_dir, max_workers=min(8, os.cpu_count() or 1))
+        print("✅ Successfully emptied ChromaDB directory")
 
         return True
     except Exception as e:
@@ -304,11 +398,14 @@ def clean_database(
         neo4j_db = Neo4jDatabase()
         vector_db = VectorDatabase()
 
-        # Clean Neo4j
-        neo4j_success = clean_neo4j(neo4j_db, neo4j_confirm)
-
-        # Clean ChromaDB
-        chromadb_success = clean_chromadb(vector_db, chromadb_confirm)
+        # Clean Neo4j and ChromaDB, together unless either may prompt
+        neo4j_success, chromadb_success = _run_cleanups(
+            [
+                lambda: clean_neo4j(neo4j_db, neo4j_confirm),
+                lambda: clean_chromadb(vector_db, chromadb_confirm),
+            ],
+            concurrent=neo4j_confirm and chromadb_confirm,
+        )
 
         # Close Neo4j connection
         neo4j_db.close()
@@ -341,6 +438,12 @@ def main() -> None:
     parser.add_argument(
         "--yes", "-y", action="store_true", help="Skip confirmation prompts"
     )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="Concurrent transactions for deleting Neo4j relationships (Neo4j 5.21+)",
+    )
     args = parser.parse_args()
 
     # Load environment variables
@@ -359,7 +462,9 @@ def main() -> None:
             print("Ignoring --physical-delete option")
         else:
             # Physical deletion of Neo4j
-            physically_delete_neo4j(confirm=args.yes, restart=not args.no_restart)
+            physically_delete_neo4j(
+                confirm=args.yes, restart=not args.no_restart, uri=neo4j_db.uri
+            )
 
             # If physical deletion was performed, skip logical deletion
             if not args.chromadb:
@@ -368,12 +473,16 @@ def main() -> None:
                 print("\n✅ Database cleaning completed")
                 return
 
-    # Clean databases based on arguments (logical deletion)
+    # Clean databases based on arguments (logical deletion). The two are
+    # independent, so they run together unless confirmation prompts are needed
+    cleanups = []
     if args.neo4j or not (args.neo4j or args.chromadb):
-        clean_neo4j(neo4j_db, args.yes)
+        cleanups.append(lambda: clean_neo4j(neo4j_db, args.yes, args.threads))
 
     if args.chromadb or not (args.neo4j or args.chromadb):
-        clean_chromadb(vector_db, args.yes)
+        cleanups.append(lambda: clean_chromadb(vector_db, args.yes))
+
+    _run_cleanups(cleanups, concurrent=args.yes)
 
     # Close Neo4j connection
     neo4j_db.close()
@@ -1,7 +1,10 @@
 import logging
 import os
+import sqlite3
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from contextlib import closing
+from typing import Any
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
@@ -9,6 +12,21 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../s
 from database.neo4j_db import Neo4jDatabase
 from database.vector_db import VectorDatabase
 
+# Number of documents fetched from ChromaDB per request
+PAGE_SIZE = 10000
+
+# ChromaDB's backing store and a per-hash document count for one collection
+CHROMA_SQLITE_FILE = "chroma.sqlite3"
+HASH_COUNTS_QUERY = """
+SELECT m.string_value, COUNT(*)
+FROM embedding_metadata AS m
+JOIN embeddings AS e ON e.id = m.id
+JOIN segments AS s ON s.id = e.segment_id
+JOIN collections AS c ON c.id = s.collection
+WHERE c.name = ? AND m.key = 'hash'
+GROUP BY m.string_value
+"""
+
 # generate_document_hash is a method of DuplicateDetector, no need to import separately
 
 # Configure logging
@@ -18,6 +36,100 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _hash_counts_from_sqlite(
+    persist_directory: str, collection_name: str
+) -> dict[str, int] | None:
+    """Count documents per hash straight from ChromaDB's sqlite store.
+
+    Args:
+        persist_directory: ChromaDB persistence directory
+        collection_name: Name of the collection to count
+
+    Returns:
+        Mapping of hash to document count, or None if the store can't be read
+
+    """
+    db_path = os.path.join(persist_directory, CHROMA_SQLITE_FILE)
+    if not os.path.isfile(db_path):
+        return None
+    try:
+        with closing(sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)) as conn:
+            rows = conn.execute(HASH_COUNTS_QUERY, (collection_name,)).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not count hashes in {db_path}: {e}")
+        return None
+    return dict(rows)
+
+
+def _documents_with_hash(collection: Any, doc_hash: str) -> list[dict[str, str]]:
+    """Fetch the id, title and filepath of every document with the given hash."""
+    result = collection.get(where={"hash": doc_hash}, include=["metadatas"])
+    return [
+        {
+            "id": doc_id,
+            "title": metadata.get("title", "N/A"),
+            "filepath": metadata.get("filepath", "N/A"),
+        }
+        for doc_id, metadata in zip(result["ids"], result["metadatas"], strict=True)
+    ]
+
+
+def _group_by_hash_paged(
+    collection: Any,
+) -> tuple[Counter, dict[str, list[dict[str, str]]], int]:
+    """Count a collection's documents per hash, a page at a time.
+
+    Ids, hashes, titles and filepaths are kept as parallel lists and counted
+    with Counter; per-document dicts are only built for duplicated hashes.
+
+    Args:
+        collection: ChromaDB collection to scan
+
+    Returns:
+        Tuple of (document count per hash, documents of each duplicated hash,
+        total number of documents)
+
+    """
+    ids, hashes, titles, filepaths = [], [], [], []
+    total_documents = 0
+    while True:
+        page = collection.get(
+            include=["metadatas"], limit=PAGE_SIZE, offset=total_documents
+        )
+        page_ids = page.get("ids") if page else None
+        if not page_ids:
+            break
+        metadatas = page.get("metadatas")
+        if not isinstance(metadatas, list) or len(metadatas) != len(page_ids):
+            logger.warning(
+                "Could not retrieve document IDs and metadatas correctly from ChromaDB."
+            )
+            break
+
+        for doc_id, metadata in zip(page_ids, metadatas, strict=True):
+            doc_hash = metadata.get("hash")  # Get hash from metadata
+
+            if doc_hash:
+                ids.append(doc_id)
+                hashes.append(doc_hash)
+                titles.append(metadata.get("title", "N/A"))
+                filepaths.append(metadata.get("filepath", "N/A"))
+            else:
+                logger.warning(f"Document {doc_id} is missing hash metadata.")
+        total_documents += len(page_ids)
+
+    hash_counts = Counter(hashes)
+    docs_by_hash = defaultdict(list)
+    for doc_id, doc_hash, title, filepath in zip(
+        ids, hashes, titles, filepaths, strict=True
+    ):
+        if hash_counts[doc_hash] > 1:
+            docs_by_hash[doc_hash].append(
+                {"id": doc_id, "title": title, "filepath": filepath}
+            )
+    return hash_counts, docs_by_hash, total_documents
+
+
 def find_and_report_duplicates():
     """Find and report duplicate documents in the database."""
     logger.info("Starting duplicate detection and reporting...")
@@ -30,11 +142,27 @@ def find_and_report_duplicates():
             logger.error("Failed to connect to ChromaDB collection.")
             return None
 
-        # Get all documents (this might be slow for very large databases)
-        # Consider fetching in batches if performance is an issue
-        all_docs = collection.get(include=["metadatas"])
+        # Let Chroma's sqlite do the grouping; only fall back to scanning the
+        # whole collection in Python when the store can't be read directly
+        hash_counts = _hash_counts_from_sqlite(
+            vector_db.persist_directory, collection.name
+        )
+        if hash_counts is not None:
+            total_documents = collection.count()
+            missing_hash = total_documents - sum(hash_counts.values())
+            if missing_hash:
+                logger.warning(f"{missing_hash} documents are missing hash metadata.")
+            docs_by_hash = {
+                doc_hash: _documents_with_hash(collection, doc_hash)
+                for doc_hash, count in hash_counts.items()
+                if count > 1
+            }
+        else:
+            hash_counts, docs_by_hash, total_documents = _group_by_hash_paged(
+                collection
+            )
 
-        if not all_docs or not all_docs.get("ids"):
+        if not total_documents:
             logger.info("No documents found in the collection.")
             return {
                 "total_documents": 0,
@@ -43,50 +171,13 @@ def find_and_report_duplicates():
                 "duplicates": {},
             }
 
-        # Group by hash
-        docs_by_hash = defaultdict(list)
-        # Instantiate DuplicateDetector to use generate_document_hash method
-        # duplicate_detector = DuplicateDetector(vector_db) # Not needed here
-
-        # Ensure all_docs is not None and contains 'ids' and 'metadatas' which are lists of the same length
-        if (
-            all_docs
-            and isinstance(all_docs.get("ids"), list)
-            and isinstance(all_docs.get("metadatas"), list)
-            and len(all_docs["ids"]) == len(all_docs["metadatas"])
-        ):
-            ids = all_docs["ids"]
-            metadatas = all_docs["metadatas"]
-            for i, doc_id in enumerate(ids):
-                metadata = metadatas[i]
-                doc_hash = metadata.get("hash")  # Get hash from metadata
-
-                if doc_hash:
-                    docs_by_hash[doc_hash].append(
-                        {
-                            "id": doc_id,
-                            "title": metadata.get("title", "N/A"),
-                            "filepath": metadata.get("filepath", "N/A"),
-                        }
-                    )
-                else:
-                    logger.warning(f"Document {doc_id} is missing hash metadata.")
-        else:
-            logger.warning(
-                "Could not retrieve document IDs and metadatas correctly from ChromaDB."
-            )
-
         # Find duplicates (hashes with more than one document)
         duplicates = {h: docs for h, docs in docs_by_hash.items() if len(docs) > 1}
 
         # Generate report
         report = {
-            "total_documents": len(
-                all_docs.get("ids", [])
-                if all_docs and isinstance(all_docs.get("ids"), list)
-                else []
-            ),  # Handle potential None or non-list
-            "unique_documents": len(docs_by_hash),
+            "total_documents": total_documents,
+            "unique_documents": len(hash_counts),
             "duplicate_sets": len(duplicates),
             "duplicates": duplicates,
         }
@@ -13,6 +13,7 @@ sys.path.append(
 from neo4j import GraphDatabase
 
 from src.config import get_port
+from src.database.neo4j_db import delete_all_nodes
 
 
 def clear_neo4j() -> int:
@@ -47,7 +48,7 @@ def clear_neo4j() -> int:
 
             # Clear all data
             print("Clearing all data from Neo4j...")
-            session.run("MATCH (n) DETACH DELETE n")
+            delete_all_nodes(session)
 
             # Verify deletion
             result = session.run("MATCH (n) RETURN count(n) as count")
@@ -8,6 +8,9 @@ import os
 import sys
 import time
 
+from neo4j import ManagedTransaction
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
+
 # Add the project root directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
@@ -19,6 +22,82 @@ os.environ["NEO4J_URI"] = "bolt://0.0.0.0:7687"
 os.environ["GRAPHRAG_API_URL"] = "http://0.0.0.0:5000"
 
 
+# Constraints and indexes created by initialize_neo4j, keyed by name
+SCHEMA_STATEMENTS = (
+    # Constraints
+    (
+        "book_id",
+        "CREATE CONSTRAINT book_id IF NOT EXISTS FOR (b:Book) REQUIRE b.id IS UNIQUE",
+    ),
+    (
+        "concept_id",
+        "CREATE CONSTRAINT concept_id IF NOT EXISTS FOR (c:Concept) REQUIRE c.id IS UNIQUE",
+    ),
+    # Book indexes
+    ("book_title", "CREATE INDEX book_title IF NOT EXISTS FOR (b:Book) ON (b.title)"),
+    (
+        "book_category",
+        "CREATE INDEX book_category IF NOT EXISTS FOR (b:Book) ON (b.category)",
+    ),
+    ("book_isbn", "CREATE INDEX book_isbn IF NOT EXISTS FOR (b:Book) ON (b.isbn)"),
+    # Chapter indexes
+    (
+        "chapter_title",
+        "CREATE INDEX chapter_title IF NOT EXISTS FOR (c:Chapter) ON (c.title)",
+    ),
+    (
+        "chapter_book_id",
+        "CREATE INDEX chapter_book_id IF NOT EXISTS FOR (c:Chapter) ON (c.book_id)",
+    ),
+    # Section indexes
+    (
+        "section_title",
+        "CREATE INDEX section_title IF NOT EXISTS FOR (s:Section) ON (s.title)",
+    ),
+    (
+        "section_chapter_id",
+        "CREATE INDEX section_chapter_id IF NOT EXISTS FOR (s:Section) ON (s.chapter_id)",
+    ),
+    # Concept indexes
+    (
+        "concept_name",
+        "CREATE INDEX concept_name IF NOT EXISTS FOR (c:Concept) ON (c.name)",
+    ),
+    (
+        "concept_category",
+        "CREATE INDEX concept_category IF NOT EXISTS FOR (c:Concept) ON (c.category)",
+    ),
+)
+
+
+def _existing_schema_names(neo4j_db: Neo4jDatabase) -> set[str]:
+    """Return the names of the constraints and indexes already in the database.
+
+    Args:
+        neo4j_db: Neo4j database instance
+
+    Returns:
+        Constraint and index names
+
+    """
+    names = set()
+    for query in ("SHOW CONSTRAINTS YIELD name", "SHOW INDEXES YIELD name"):
+        names.update(record["name"] for record in neo4j_db.run_query(query))
+    return names
+
+
+def _run_statements(tx: ManagedTransaction, statements: list[str]) -> None:
+    """Run each statement in the given transaction.
+
+    Args:
+        tx: Neo4j write transaction
+        statements: Cypher statements without parameters
+
+    """
+    for statement in statements:
+        tx.run(statement)
+
+
 def initialize_neo4j(neo4j_db: Neo4jDatabase) -> bool:
     """Initialize the Neo4j database with constraints and indexes.
 
@@ -31,98 +110,44 @@ def initialize_neo4j(neo4j_db: Neo4jDatabase) -> bool:
     """
     print("Initializing Neo4j database...")
 
-    # Wait for Neo4j to be available
-    max_retries = 30
-    retry_interval = 2  # seconds
-
-    for i in range(max_retries):
-        if neo4j_db.verify_connection():
+    # Wait for Neo4j to be available. Retries start quickly, so a server that
+    # is nearly up is not waited on for long, and back off exponentially.
+    timeout = 60  # seconds
+    retry_interval = 0.25  # seconds
+    max_retry_interval = 4  # seconds
+
+    deadline = time.monotonic() + timeout
+    neo4j_db.connect()
+    attempt = 1
+    while True:
+        try:
+            neo4j_db.driver.verify_connectivity()
             print("✅ Neo4j connection established!")
             break
-        print(f"Waiting for Neo4j to be available... ({i + 1}/{max_retries})")
-        time.sleep(retry_interval)
-    else:
-        print("❌ Failed to connect to Neo4j after multiple attempts.")
-        return False
+        except (ServiceUnavailable, SessionExpired):
+            if time.monotonic() + retry_interval > deadline:
+                print("❌ Failed to connect to Neo4j after multiple attempts.")
+                return False
+            print(f"Waiting for Neo4j to be available... (attempt {attempt})")
+            time.sleep(retry_interval)
+            retry_interval = min(retry_interval * 2, max_retry_interval)
+            attempt += 1
+        except Exception as e:
+            print(f"❌ Failed to connect to Neo4j: {e}")
+            return False
 
     try:
-        # Create constraints
-        print("Creating constraints...")
-
-        # Constraint for Book nodes
-        neo4j_db.run_query("""
-        CREATE CONSTRAINT book_id IF NOT EXISTS
-        FOR (b:Book)
-        REQUIRE b.id IS UNIQUE
-        """)
-
-        # Constraint for Concept nodes
-        neo4j_db.run_query("""
-        CREATE CONSTRAINT concept_id IF NOT EXISTS
-        FOR (c:Concept)
-        REQUIRE c.id IS UNIQUE
-        """)
-
-        # Create indexes
-        print("Creating indexes...")
-
-        # Book indexes
-        neo4j_db.run_query("""
-        CREATE INDEX book_title IF NOT EXISTS
-        FOR (b:Book)
-        ON (b.title)
-        """)
-
-        neo4j_db.run_query("""
-        CREATE INDEX book_category IF NOT EXISTS
-        FOR (b:Book)
-        ON (b.category)
-        """)
-
-        neo4j_db.run_query("""
-        CREATE INDEX book_isbn IF NOT EXISTS
-        FOR (b:Book)
-        ON (b.isbn)
-        """)
-
-        # Chapter indexes
-        neo4j_db.run_query("""
-        CREATE INDEX chapter_title IF NOT EXISTS
-        FOR (c:Chapter)
-        ON (c.title)
-        """)
-
-        neo4j_db.run_query("""
-        CREATE INDEX chapter_book_id IF NOT EXISTS
-        FOR (c:Chapter)
-        ON (c.book_id)
-        """)
-
-        # Section indexes
-        neo4j_db.run_query("""
-        CREATE INDEX section_title IF NOT EXISTS
-        FOR (s:Section)
-        ON (s.title)
-        """)
-
-        neo4j_db.run_query("""
-        CREATE INDEX section_chapter_id IF NOT EXISTS
-        FOR (s:Section)
-        ON (s.chapter_id)
-        """)
-
-        # Concept indexes
-        neo4j_db.run_query("""
-        CREATE INDEX concept_name IF NOT EXISTS
-        FOR (c:Concept)
-        ON (c.name)
-        """)
-
-        neo4j_db.run_query("""
-        CREATE INDEX concept_category IF NOT EXISTS
-        FOR (c:Concept)
-        ON (c.category)
-        """)
+        # Only missing constraints and indexes are created, all in one
+        # transaction, so a warm start takes no schema locks
+        existing = _existing_schema_names(neo4j_db)
+        missing = [
+            statement for name, statement in SCHEMA_STATEMENTS if name not in existing
+        ]
+        if missing:
+            print(f"Creating {len(missing)} constraints and indexes...")
+            neo4j_db.execute_write(_run_statements, missing)
+        else:
+            print("All constraints and indexes already exist")
 
         print("✅ Neo4j database initialized successfully!")
         return True
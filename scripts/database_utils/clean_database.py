@@ -26,6 +26,8 @@ except ImportError:
     )
     sys.exit(1)
 
+from src.database.neo4j_db import delete_all_nodes
+
 CONFIG_FILE_PATH = os.path.join(project_root, "config", "database_config.json")
 
 
@@ -66,7 +68,7 @@ def clear_neo4j(config) -> bool | None:
         print(f"Successfully connected to Neo4j at {uri}")
         with driver.session() as session:
             print("Clearing Neo4j database (deleting all nodes and relationships)...")
-            session.run("MATCH (n) DETACH DELETE n")
+            delete_all_nodes(session)
             print("Neo4j database cleared successfully.")
         return True
     except neo4j_exceptions.AuthError:
@@ -1,20 +1,52 @@
 """Script to add a document to the GraphRAG system."""
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import io
 import logging
 import os
 import re
 import sys
+import threading
 import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import PyPDF2
+from neo4j import ManagedTransaction
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import numpy as np
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import pypdfium2 as pdfium
+
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    PYPDFIUM2_AVAILABLE = False
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
 from src.database.neo4j_db import Neo4jDatabase
 from src.database.vector_db import VectorDatabase
 from src.processing.concept_extractor import ConceptExtractor
+from src.processing.document_processor import split_sentences
 from src.processing.duplicate_detector import DuplicateDetector
 
 logging.basicConfig(
@@ -22,6 +54,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Page-level parallelism for PDF text extraction
+PDF_EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+PDF_PAGES_PER_WORKER_MIN = 16  # Smaller PDFs are extracted on the calling thread
+
 RELATIONSHIP_PATTERNS = {
     "DEFINES_CONCEPT": [" defines ", " is defined as ", " refers to ", " means "],
     "IS_A": [" is a ", " is an ", " is type of ", " is kind of "],
@@ -40,6 +76,13 @@ RELATIONSHIP_PATTERNS = {
     ],
 }
 
+# Chunking patterns, compiled once rather than per document
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_SENTENCE_RE = re.compile(r"(?:[.!?]\s+|^)([^.!?]*)$")
+
+# Mentions starting within this many characters count as co-occurring
+COOCCURRENCE_WINDOW_CHARS = 200
+
 PROMPT_ENGINEERING_CONCEPTS = {
     "prompt engineering": "PE",
     "chain of thought": "COT",
@@ -133,33 +176,188 @@ PROMPT_ENGINEERING_CONCEPTS = {
 }
 
 
+# Keywords matched in every document, then extra keywords per domain
+COMMON_KEYWORDS = {
+    "machine learning": "ML",
+    "neural network": "NN",
+    "deep learning": "DL",
+    "artificial intelligence": "AI",
+    "natural language processing": "NLP",
+    "computer vision": "CV",
+    "reinforcement learning": "RL",
+    "supervised learning": "SL",
+    "unsupervised learning": "UL",
+    "transformer": "TR",
+    "attention mechanism": "AM",
+    "convolutional neural network": "CNN",
+    "recurrent neural network": "RNN",
+    "long short-term memory": "LSTM",
+    "gated recurrent unit": "GRU",
+    "generative adversarial network": "GAN",
+    "transfer learning": "TL",
+    "fine-tuning": "FT",
+    "backpropagation": "BP",
+    "gradient descent": "GD",
+    "retrieval-augmented generation": "RAG",
+    "graphrag": "GRAG",
+    "knowledge graph": "KG",
+    "vector database": "VDB",
+    "embedding": "EMB",
+    "hybrid search": "HS",
+    "deduplication": "DD",
+    "large language model": "LLM",
+    "neo4j": "NEO",
+    "chromadb": "CHROMA",
+}
+DOMAIN_KEYWORDS = {
+    "AI": {
+        "prompt engineering": "PE",
+        "chain of thought": "COT",
+        "few-shot learning": "FSL",
+        "zero-shot learning": "ZSL",
+        "multimodal": "MM",
+        "text-to-image": "T2I",
+        "diffusion model": "DM",
+        "stable diffusion": "SD",
+        "dall-e": "DALLE",
+        "midjourney": "MJ",
+        "gpt": "GPT",
+        "bert": "BERT",
+        "t5": "T5",
+        "llama": "LLAMA",
+        "claude": "CLAUDE",
+    },
+    "Programming": {
+        "python": "PY",
+        "javascript": "JS",
+        "typescript": "TS",
+        "java": "JAVA",
+        "c++": "CPP",
+        "rust": "RUST",
+        "go": "GO",
+        "docker": "DOCKER",
+        "kubernetes": "K8S",
+        "microservices": "MS",
+        "api": "API",
+        "rest": "REST",
+        "graphql": "GQL",
+        "database": "DB",
+        "sql": "SQL",
+        "nosql": "NOSQL",
+        "git": "GIT",
+        "ci/cd": "CICD",
+        "devops": "DEVOPS",
+    },
+}
+# Merged, pre-lowercased (keyword, abbreviation) pairs for each domain (None for
+# the common keywords alone), built once so extraction does no dict work
+DOMAIN_KEYWORD_TABLES: dict[str | None, tuple[tuple[str, str], ...]] = {
+    domain: tuple(
+        (keyword.lower(), abbr)
+        for keyword, abbr in {
+            **COMMON_KEYWORDS,
+            **DOMAIN_KEYWORDS.get(domain, {}),
+        }.items()
+    )
+    for domain in (None, *DOMAIN_KEYWORDS)
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_extractor(domain: str) -> ConceptExtractor:
+    """Return a ConceptExtractor for the domain, shared across documents."""
+    return ConceptExtractor(use_nlp=False, use_llm=True, domain=domain)
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> list[str]:
+    """Extract text from pages [start, stop) using a reader private to the caller.
+
+    PdfReader objects share a single stream and are not safe to use from
+    several threads, so each worker parses its own reader over the same bytes.
+    """
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _extract_pages_pypdf2(pdf_bytes: bytes) -> list[str]:
+    """Extract per-page text with PyPDF2, spreading large PDFs over threads."""
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    num_pages = len(reader.pages)
+    workers = min(PDF_EXTRACT_WORKERS, num_pages // PDF_PAGES_PER_WORKER_MIN)
+    if workers <= 1:
+        return [page.extract_text() or "" for page in reader.pages]
+    step = -(-num_pages // workers)  # ceiling division
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        page_ranges = executor.map(
+            lambda start: _extract_page_range(
+                pdf_bytes, start, min(start + step, num_pages)
+            ),
+            range(0, num_pages, step),
+        )
+        return [text for part in page_ranges for text in part]
+
+
+def _extract_pages_pdfium(pdf_bytes: bytes) -> list[str]:
+    """Extract per-page text with pypdfium2 (PDFium, native code).
+
+    PDFium is not thread-safe, so pages are read sequentially; it is still
+    several times faster than PyPDF2's pure-Python parser.
+    """
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    try:
+        pages_text = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium reports line breaks as CRLF
+            pages_text.append(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+        return pages_text
+    finally:
+        pdf.close()
+
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     logger.info(f"Extracting text from {os.path.basename(pdf_path)}...")
-    text = ""
     try:
         with open(pdf_path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
-            num_pages = len(reader.pages)
-            for page_num in range(num_pages):
-                page = reader.pages[page_num]
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n\n"
-            logger.info(
-                f"  Extracted {len(text.split())} words from {num_pages} pages."
-            )
-            return text
+            pdf_bytes = file.read()
+        if PYPDFIUM2_AVAILABLE:
+            pages_text = _extract_pages_pdfium(pdf_bytes)
+        else:
+            pages_text = _extract_pages_pypdf2(pdf_bytes)
+        num_pages = len(pages_text)
+        text = "".join(page_text + "\n\n" for page_text in pages_text if page_text)
+        logger.info(f"  Extracted {len(text.split())} words from {num_pages} pages.")
+        return text
     except Exception as e:
         logger.error(f"Error extracting text from {pdf_path}: {e}")
         return ""
 
 
+def file_content_hash(file_path: str) -> str:
+    """Hash a source file's bytes for duplicate detection.
+
+    Every ingestion path hashes PDFs this way, so the same file is recognised
+    as a duplicate however it was imported.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        SHA-256 hex digest of the file's contents
+
+    """
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> list[str]:
     chunks = []
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     if not text:
         return []
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = split_sentences(text)
     current_chunk = ""
     for sentence in sentences:
         if not sentence:
@@ -167,9 +365,7 @@ def chunk_text(text: str, chunk_size: int = 1000, overlap: int = 200) -> list[st
         if len(current_chunk) + len(sentence) + 1 > chunk_size and current_chunk:
             chunks.append(current_chunk.strip())
             overlap_text = current_chunk[-overlap:]
-            last_sentence_in_overlap_match = re.search(
-                r"(?:[.!?]\s+|^)([^.!?]*)$", overlap_text
-            )
+            last_sentence_in_overlap_match = _TRAILING_SENTENCE_RE.search(overlap_text)
             if (
                 last_sentence_in_overlap_match
                 and last_sentence_in_overlap_match.group(1).strip()
@@ -205,6 +401,7 @@ def extract_entities_from_metadata(metadata: dict[str, Any]) -> list[dict[str, A
                 {
                     "id": concept_id,
                     "name": concept_name,
+                    "normalized_name": concept_name.lower(),
                     "type": "Concept",
                     "source": "metadata",
                 }
@@ -212,103 +409,64 @@ def extract_entities_from_metadata(metadata: dict[str, Any]) -> list[dict[str, A
     return entities
 
 
+@functools.lru_cache(maxsize=8)
+def _keyword_automaton(domain: str | None) -> "ahocorasick.Automaton":
+    """Build the Aho-Corasick automaton over a domain's keywords, once per domain.
+
+    Args:
+        domain: Key of DOMAIN_KEYWORD_TABLES
+
+    Returns:
+        Automaton whose values are the matched lowercase keywords
+
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword, _ in DOMAIN_KEYWORD_TABLES[domain]:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
 def extract_entities_from_text(
-    text: str, domain: str | None = None
+    text: str,
+    domain: str | None = None,
+    text_lower: str | None = None,
+    mentions: list[tuple[int, int, str]] | None = None,
 ) -> list[dict[str, Any]]:
     entities = []
-    common_keywords = {
-        "machine learning": "ML",
-        "neural network": "NN",
-        "deep learning": "DL",
-        "artificial intelligence": "AI",
-        "natural language processing": "NLP",
-        "computer vision": "CV",
-        "reinforcement learning": "RL",
-        "supervised learning": "SL",
-        "unsupervised learning": "UL",
-        "transformer": "TR",
-        "attention mechanism": "AM",
-        "convolutional neural network": "CNN",
-        "recurrent neural network": "RNN",
-        "long short-term memory": "LSTM",
-        "gated recurrent unit": "GRU",
-        "generative adversarial network": "GAN",
-        "transfer learning": "TL",
-        "fine-tuning": "FT",
-        "backpropagation": "BP",
-        "gradient descent": "GD",
-        "retrieval-augmented generation": "RAG",
-        "graphrag": "GRAG",
-        "knowledge graph": "KG",
-        "vector database": "VDB",
-        "embedding": "EMB",
-        "hybrid search": "HS",
-        "deduplication": "DD",
-        "large language model": "LLM",
-        "neo4j": "NEO",
-        "chromadb": "CHROMA",
-    }
-    domain_keywords = {
-        "AI": {
-            "prompt engineering": "PE",
-            "chain of thought": "COT",
-            "few-shot learning": "FSL",
-            "zero-shot learning": "ZSL",
-            "multimodal": "MM",
-            "text-to-image": "T2I",
-            "diffusion model": "DM",
-            "stable diffusion": "SD",
-            "dall-e": "DALLE",
-            "midjourney": "MJ",
-            "gpt": "GPT",
-            "bert": "BERT",
-            "t5": "T5",
-            "llama": "LLAMA",
-            "claude": "CLAUDE",
-        },
-        "Programming": {
-            "python": "PY",
-            "javascript": "JS",
-            "typescript": "TS",
-            "java": "JAVA",
-            "c++": "CPP",
-            "rust": "RUST",
-            "go": "GO",
-            "docker": "DOCKER",
-            "kubernetes": "K8S",
-            "microservices": "MS",
-            "api": "API",
-            "rest": "REST",
-            "graphql": "GQL",
-            "database": "DB",
-            "sql": "SQL",
-            "nosql": "NOSQL",
-            "git": "GIT",
-            "ci/cd": "CICD",
-            "devops": "DEVOPS",
-        },
-    }
-    keywords_to_use = common_keywords.copy()
-    if domain and domain in domain_keywords:
-        keywords_to_use.update(domain_keywords[domain])
-    text_lower = text.lower()
-    found_entity_names = set()
-    for keyword, abbr in keywords_to_use.items():
-        if keyword.lower() in text_lower:
-            normalized_name = keyword.title()
-            if normalized_name not in found_entity_names:
-                entity_id = f"concept-kw-{abbr.lower()}-{uuid.uuid4().hex[:8]}"
-                entities.append(
-                    {
-                        "id": entity_id,
-                        "name": normalized_name,
-                        "type": "Concept",
-                        "abbreviation": abbr,
-                        "domain": domain or "common",
-                        "source": "keyword_text",
-                    }
-                )
-                found_entity_names.add(normalized_name)
+    table_domain = domain if domain in DOMAIN_KEYWORDS else None
+    keyword_table = DOMAIN_KEYWORD_TABLES[table_domain]
+    if text_lower is None:
+        text_lower = text.lower()
+    if AHOCORASICK_AVAILABLE:
+        # One pass over the text finds every keyword it contains; when asked,
+        # the (start, end, keyword) of each hit is recorded for later stages
+        hits = [
+            (end_idx - len(keyword) + 1, end_idx + 1, keyword)
+            for end_idx, keyword in _keyword_automaton(table_domain).iter(text_lower)
+        ]
+        if mentions is not None:
+            mentions.extend(hits)
+        found_keywords = {keyword for _, _, keyword in hits}
+    else:
+        found_keywords = {kw for kw, _ in keyword_table if kw in text_lower}
+    # Walk the table rather than the matches to keep the keyword order. Table
+    # keywords are unique and already lowercase, so each one is its entity's
+    # normalized name.
+    for keyword, abbr in keyword_table:
+        if keyword in found_keywords:
+            entity_id = f"concept-kw-{abbr.lower()}-{uuid.uuid4().hex[:8]}"
+            entities.append(
+                {
+                    "id": entity_id,
+                    "name": keyword.title(),
+                    "normalized_name": keyword,
+                    "type": "Concept",
+                    "abbreviation": abbr,
+                    "domain": domain or "common",
+                    "source": "keyword_text",
+                }
+            )
     return entities
 
 
@@ -317,36 +475,44 @@ def extract_entities(
     metadata: dict[str, Any] | None = None,
     extractor_instance: ConceptExtractor | None = None,
     domain: str | None = "general",
+    llm_concepts: list[dict[str, Any]] | None = None,
+    text_lower: str | None = None,
+    mentions: list[tuple[int, int, str]] | None = None,
 ) -> list[dict[str, Any]]:
     all_entities_map: dict[str, dict[str, Any]] = {}
-    if extractor_instance and extractor_instance.use_llm:
+    # Lowercase the text once for every keyword scan below, unless the caller
+    # already has it
+    if text_lower is None:
+        text_lower = text.lower()
+    if llm_concepts is None and extractor_instance and extractor_instance.use_llm:
         try:
             logger.info("Attempting entity extraction using LLM...")
             llm_output = extractor_instance.extract_concepts_llm(text)
             llm_concepts = llm_output.get("concepts", [])
-            if llm_concepts:
-                logger.info(f"LLM extracted {len(llm_concepts)} concepts.")
-                for concept in llm_concepts:
-                    name_lower = concept.get("name", "").lower()
-                    if name_lower:
-                        if "id" not in concept or not concept["id"]:
-                            concept["id"] = (
-                                f"concept-llm-{name_lower.replace(' ', '-')}-{uuid.uuid4().hex[:8]}"
-                            )
-                        concept["source"] = "llm"
-                        all_entities_map[name_lower] = concept
-            else:
-                logger.info("LLM did not extract any concepts.")
         except Exception as e:
             logger.error(f"Error during LLM entity extraction: {e}", exc_info=True)
+    if llm_concepts:
+        logger.info(f"LLM extracted {len(llm_concepts)} concepts.")
+        for concept in llm_concepts:
+            name_lower = concept.get("name", "").lower()
+            if name_lower:
+                if "id" not in concept or not concept["id"]:
+                    concept["id"] = (
+                        f"concept-llm-{name_lower.replace(' ', '-')}-{uuid.uuid4().hex[:8]}"
+                    )
+                concept["source"] = "llm"
+                all_entities_map[name_lower] = concept
+    elif llm_concepts is not None:
+        logger.info("LLM did not extract any concepts.")
     pe_keywords_concepts = []
     for concept_name_pe, abbr_pe in PROMPT_ENGINEERING_CONCEPTS.items():
         name_pe_lower = concept_name_pe.lower()
-        if name_pe_lower in text.lower() and name_pe_lower not in all_entities_map:
+        if name_pe_lower in text_lower and name_pe_lower not in all_entities_map:
             pe_id = f"concept-pe-{abbr_pe.lower()}-{uuid.uuid4().hex[:8]}"
             entity_data = {
                 "id": pe_id,
                 "name": concept_name_pe.title(),
+                "normalized_name": name_pe_lower,
                 "type": "PromptEngineeringConcept",
                 "abbreviation": abbr_pe,
                 "source": "keyword_pe",
@@ -355,10 +521,12 @@ def extract_entities(
             pe_keywords_concepts.append(entity_data)
     if pe_keywords_concepts:
         logger.info(f"Extracted {len(pe_keywords_concepts)} PE concepts via keywords.")
-    keyword_text_concepts = extract_entities_from_text(text, domain)
+    keyword_text_concepts = extract_entities_from_text(
+        text, domain, text_lower=text_lower, mentions=mentions
+    )
     newly_added_keyword_concepts = 0
     for concept in keyword_text_concepts:
-        name_lower = concept["name"].lower()
+        name_lower = concept["normalized_name"]
         if name_lower not in all_entities_map:
             all_entities_map[name_lower] = concept
             newly_added_keyword_concepts += 1
@@ -369,7 +537,7 @@ def extract_entities(
     if metadata:
         metadata_concepts = extract_entities_from_metadata(metadata)
         for concept in metadata_concepts:
-            name_lower = concept["name"].lower()
+            name_lower = concept["normalized_name"]
             all_entities_map[name_lower] = concept
         if metadata_concepts:
             logger.info(f"Processed {len(metadata_concepts)} concepts from metadata.")
@@ -378,11 +546,69 @@ def extract_entities(
     return final_entities
 
 
+def _find_entity_mentions(
+    text_lower: str, names: set[str]
+) -> list[tuple[int, int, str]]:
+    """Locate every occurrence of the given lowercase names in one pass.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    falls back to repeated ``str.find`` per name.
+
+    Returns:
+        List of (start, end, name) tuples, end exclusive
+
+    """
+    mentions: list[tuple[int, int, str]] = []
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for name in names:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+        for end_idx, name in automaton.iter(text_lower):
+            mentions.append((end_idx - len(name) + 1, end_idx + 1, name))
+    else:
+        for name in names:
+            pos = text_lower.find(name)
+            while pos != -1:
+                mentions.append((pos, pos + len(name), name))
+                pos = text_lower.find(name, pos + 1)
+    return mentions
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_connectors(
+    pattern_items: tuple[tuple[str, tuple[str, ...]], ...],
+) -> tuple[list[str], dict[str, int], re.Pattern[str]]:
+    """Precompile relationship connectors for pattern-based extraction.
+
+    Args:
+        pattern_items: (relationship type, connectors) pairs in priority order
+
+    Returns:
+        Tuple of (pattern types, connector -> priority of its pattern type,
+        regex matching any connector)
+
+    """
+    pattern_types = [p_type for p_type, _ in pattern_items]
+    # Earlier pattern types win when a connector is listed more than once
+    connector_priority: dict[str, int] = {}
+    for priority, (_, patterns) in enumerate(pattern_items):
+        for pattern in patterns:
+            connector_priority.setdefault(pattern, priority)
+    connector_re = re.compile(
+        "|".join(
+            re.escape(c) for c in sorted(connector_priority, key=len, reverse=True)
+        )
+    )
+    return pattern_types, connector_priority, connector_re
+
+
 def _extract_relationships_pattern_based(
     entities: list[dict[str, Any]],
     text_lower: str,
     relationship_patterns: dict[str, list[str]],
     logger_instance: logging.Logger,
+    mentions: list[tuple[int, int, str]] | None = None,
 ) -> list[dict[str, Any]]:
     pattern_relationships = []
     valid_entities = [e for e in entities if e.get("name") and e.get("id")]
@@ -391,61 +617,157 @@ def _extract_relationships_pattern_based(
     logger_instance.info(
         f"Attempting pattern-based relationship extraction for {len(valid_entities)} entities."
     )
-    for i, source_entity in enumerate(valid_entities):
-        source_name_lower = source_entity["name"].lower()
-        source_id = source_entity["id"]
-        for j, target_entity in enumerate(valid_entities):
-            if i == j:
+    entity_indices_by_name: dict[str, list[int]] = defaultdict(list)
+    for idx, entity in enumerate(valid_entities):
+        entity_indices_by_name[entity["name"].lower()].append(idx)
+
+    pattern_types, connector_priority, connector_re = _compile_connectors(
+        tuple((p_type, tuple(p)) for p_type, p in relationship_patterns.items())
+    )
+
+    # A pattern "{source}{connector}{target}" matches when a mention of the
+    # source ends exactly where a connector starts and a mention of the target
+    # starts exactly where that connector ends.
+    if mentions is None:
+        mentions = _find_entity_mentions(text_lower, set(entity_indices_by_name))
+    names_starting_at: dict[int, list[str]] = defaultdict(list)
+    for start, _, name in mentions:
+        names_starting_at[start].append(name)
+
+    best_priority: dict[tuple[int, int], int] = {}
+    for _, source_end, source_name in mentions:
+        # Most mentions are not followed by any connector; one C-level regex
+        # match rules them out before checking connectors individually
+        if not connector_re.match(text_lower, source_end):
+            continue
+        for connector, priority in connector_priority.items():
+            if not text_lower.startswith(connector, source_end):
                 continue
-            target_name_lower = target_entity["name"].lower()
-            target_id = target_entity["id"]
-            rel_type, strength, found_pattern = "RELATED_TO", 0.5, False
-            for p_type, patterns in relationship_patterns.items():
-                if found_pattern:
-                    break
-                for pattern in patterns:
-                    if f"{source_name_lower}{pattern}{target_name_lower}" in text_lower:
-                        rel_type, strength, found_pattern = p_type, 0.8, True
-                        break
-            if found_pattern:
-                pattern_relationships.append(
-                    {
-                        "source_id": source_id,
-                        "target_id": target_id,
-                        "type": rel_type,
-                        "description": f"{source_entity['name']} is {rel_type.lower().replace('_', ' ')} {target_entity['name']}",
-                        "strength": strength,
-                        "method": "pattern_based",
-                    }
-                )
+            for target_name in names_starting_at.get(source_end + len(connector), ()):
+                for i in entity_indices_by_name[source_name]:
+                    for j in entity_indices_by_name[target_name]:
+                        if i != j and priority < best_priority.get(
+                            (i, j), len(pattern_types)
+                        ):
+                            best_priority[(i, j)] = priority
+
+    for (i, j), priority in sorted(best_priority.items()):
+        source_entity, target_entity = valid_entities[i], valid_entities[j]
+        rel_type = pattern_types[priority]
+        pattern_relationships.append(
+            {
+                "source_id": source_entity["id"],
+                "target_id": target_entity["id"],
+                "type": rel_type,
+                "description": f"{source_entity['name']} is {rel_type.lower().replace('_', ' ')} {target_entity['name']}",
+                "strength": 0.8,
+                "method": "pattern_based",
+            }
+        )
     logger_instance.info(
         f"Pattern-based extraction found {len(pattern_relationships)} relationships."
     )
     return pattern_relationships
 
 
+def _cooccurring_name_pairs(
+    name_ids: "np.ndarray", positions: "np.ndarray", window: int, n_names: int
+) -> "np.ndarray":
+    """Count co-occurring mention pairs over dense name IDs.
+
+    Compiled with Numba when available; mentions must be sorted by position.
+
+    Args:
+        name_ids: Name ID of each mention (int32)
+        positions: Start offset of each mention (int32), ascending
+        window: Maximum distance in characters between co-occurring mentions
+        n_names: Number of distinct name IDs
+
+    Returns:
+        Upper-triangular (n_names, n_names) matrix of co-occurrence counts
+
+    """
+    counts = np.zeros((n_names, n_names), dtype=np.int32)
+    left = 0
+    for right in range(positions.shape[0]):
+        start = positions[right]
+        while positions[left] < start - window:
+            left += 1
+        a = name_ids[right]
+        for k in range(left, right):
+            b = name_ids[k]
+            if a < b:
+                counts[a, b] += 1
+            elif b < a:
+                counts[b, a] += 1
+    return counts
+
+
+if NUMBA_AVAILABLE:
+    _cooccurring_name_pairs = njit(cache=True)(_cooccurring_name_pairs)
+
+
 def _extract_relationships_basic(
-    entities: list[dict[str, Any]], text_lower: str, logger_instance: logging.Logger
+    entities: list[dict[str, Any]],
+    text_lower: str,
+    logger_instance: logging.Logger,
+    mentions: list[tuple[int, int, str]] | None = None,
+    window: int = COOCCURRENCE_WINDOW_CHARS,
 ) -> list[dict[str, Any]]:
     basic_relationships = []
     valid_entities = [e for e in entities if e.get("name") and e.get("id")]
     if len(valid_entities) < 2:
         logger_instance.debug("Basic Rel: Not enough valid entities for co-occurrence.")
         return basic_relationships
-    for i in range(len(valid_entities)):
-        for j in range(i + 1, len(valid_entities)):
-            e1, e2 = valid_entities[i], valid_entities[j]
-            if e1["name"].lower() in text_lower and e2["name"].lower() in text_lower:
-                basic_relationships.append(
-                    {
-                        "source_id": e1["id"],
-                        "target_id": e2["id"],
-                        "type": "RELATED_TO",
-                        "description": f"{e1['name']} co-occurs with {e2['name']} in text (simplified)",
-                        "strength": 0.3,
-                        "method": "basic_cooccurrence",
-                    }
-                )
+    entity_indices_by_name: dict[str, list[int]] = defaultdict(list)
+    for idx, entity in enumerate(valid_entities):
+        entity_indices_by_name[entity["name"].lower()].append(idx)
+    if mentions is None:
+        mentions = _find_entity_mentions(text_lower, set(entity_indices_by_name))
+
+    # Sweep the mentions in text order, pairing each with the earlier mentions
+    # that start within `window` characters of it
+    ordered = sorted(mentions)
+    name_pairs: set[tuple[str, str]] = set()
+    if NUMBA_AVAILABLE and ordered:
+        names = list(entity_indices_by_name)
+        name_ids = {name: k for k, name in enumerate(names)}
+        counts = _cooccurring_name_pairs(
+            np.array([name_ids[name] for _, _, name in ordered], dtype=np.int32),
+            np.array([start for start, _, _ in ordered], dtype=np.int32),
+            window,
+            len(names),
+        )
+        name_pairs.update(
+            (names[a], names[b]) for a, b in zip(*np.nonzero(counts), strict=True)
+        )
+    else:
+        left = 0
+        for right, (start, _, name) in enumerate(ordered):
+            while ordered[left][0] < start - window:
+                left += 1
+            for _, _, other_name in ordered[left:right]:
+                if other_name != name:
+                    name_pairs.add((name, other_name))
+
+    pairs: set[tuple[int, int]] = set()
+    for name, other_name in name_pairs:
+        for i in entity_indices_by_name[name]:
+            for j in entity_indices_by_name[other_name]:
+                pairs.add((min(i, j), max(i, j)))
+
+    for i, j in sorted(pairs):
+        e1, e2 = valid_entities[i], valid_entities[j]
+        basic_relationships.append(
+            {
+                "source_id": e1["id"],
+                "target_id": e2["id"],
+                "type": "RELATED_TO",
+                "description": f"{e1['name']} co-occurs with {e2['name']} in text (simplified)",
+                "strength": 0.3,
+                "method": "basic_cooccurrence",
+            }
+        )
     logger_instance.info(
         f"Basic co-occurrence (simplified) found {len(basic_relationships)} relationships."
     )
@@ -453,7 +775,12 @@ def _extract_relationships_basic(
 
 
 def extract_relationships(
-    entities: list[dict[str, Any]], text: str, extractor: ConceptExtractor
+    entities: list[dict[str, Any]],
+    text: str,
+    extractor: ConceptExtractor,
+    text_lower: str | None = None,
+    mentions: list[tuple[int, int, str]] | None = None,
+    raw_llm_relationships: list[dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     logger.info(f"Starting relationship extraction for {len(entities)} entities.")
     all_extracted_relationships = []
@@ -466,11 +793,14 @@ def extract_relationships(
     llm_relationships = []
     if extractor.use_llm:
         try:
-            logger.info(
-                f"Attempting LLM relationship extraction for {len(valid_entities)} entities..."
-            )
-            llm_output = extractor.extract_concepts_llm(text)
-            raw_llm_rels = llm_output.get("relationships", [])
+            if raw_llm_relationships is None:
+                logger.info(
+                    f"Attempting LLM relationship extraction for {len(valid_entities)} entities..."
+                )
+                llm_output = extractor.extract_concepts_llm(text)
+                raw_llm_rels = llm_output.get("relationships", [])
+            else:
+                raw_llm_rels = raw_llm_relationships
             if raw_llm_rels:
                 logger.info(f"LLM returned {len(raw_llm_rels)} raw relationships.")
                 for rel_data in raw_llm_rels:
@@ -518,9 +848,15 @@ def extract_relationships(
     else:
         logger.info("LLM use disabled, skipping LLM relationship extraction.")
     all_extracted_relationships.extend(llm_relationships)
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    # One mention scan feeds both the pattern and co-occurrence passes
+    if mentions is None:
+        mentions = _find_entity_mentions(
+            text_lower, {e["name"].lower() for e in valid_entities}
+        )
     pattern_rels = _extract_relationships_pattern_based(
-        valid_entities, text_lower, RELATIONSHIP_PATTERNS, logger
+        valid_entities, text_lower, RELATIONSHIP_PATTERNS, logger, mentions=mentions
     )
     all_extracted_relationships.extend(pattern_rels)
     should_fallback = (
@@ -532,7 +868,9 @@ def extract_relationships(
         logger.info(
             "No relationships from LLM/patterns, falling back to basic co-occurrence."
         )
-        basic_rels = _extract_relationships_basic(valid_entities, text_lower, logger)
+        basic_rels = _extract_relationships_basic(
+            valid_entities, text_lower, logger, mentions=mentions
+        )
         all_extracted_relationships.extend(basic_rels)
     final_rels, seen_map = [], {}
     priority = {"llm": 3, "pattern_based": 2, "basic_cooccurrence": 1}
@@ -556,57 +894,131 @@ def extract_relationships(
     return final_rels
 
 
+def extract_graph(
+    text: str,
+    metadata: dict[str, Any] | None,
+    extractor: ConceptExtractor,
+    domain: str | None = "general",
+    llm_concepts: list[dict[str, Any]] | None = None,
+    text_lower: str | None = None,
+    llm_relationships: list[dict[str, Any]] | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Extract entities and the relationships between them in one pass.
+
+    The LLM's concept and relationship extraction runs at most once and feeds
+    both stages; when the caller passes ``llm_concepts`` from a batched call,
+    no LLM request is made here at all. The keyword automaton's hits double as
+    relationship mentions, so only entity names it did not cover are searched
+    for again.
+
+    Args:
+        text: Document or chunk text
+        metadata: Metadata, possibly with explicit 'concepts'
+        extractor: Concept extractor
+        domain: Keyword domain
+        llm_concepts: Concepts already extracted by a batched LLM call
+        text_lower: Lowercased text, if the caller already has it
+        llm_relationships: Relationships from the same batched call as
+            ``llm_concepts`` (default: none)
+
+    Returns:
+        Tuple of (entities, relationships)
+
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    raw_llm_relationships = llm_relationships
+    if llm_concepts is not None and raw_llm_relationships is None:
+        raw_llm_relationships = []
+    if llm_concepts is None and extractor.use_llm:
+        try:
+            logger.info("Attempting concept and relationship extraction using LLM...")
+            llm_output = extractor.extract_concepts_llm(text)
+            llm_concepts = llm_output.get("concepts", [])
+            raw_llm_relationships = llm_output.get("relationships", [])
+        except Exception as e:
+            logger.error(f"Error during LLM extraction: {e}", exc_info=True)
+            llm_concepts, raw_llm_relationships = [], []
+
+    keyword_mentions: list[tuple[int, int, str]] = []
+    entities = extract_entities(
+        text,
+        metadata,
+        extractor_instance=extractor,
+        domain=domain,
+        llm_concepts=llm_concepts,
+        text_lower=text_lower,
+        mentions=keyword_mentions,
+    )
+
+    names = {e["name"].lower() for e in entities if e.get("name") and e.get("id")}
+    scanned = {name for _, _, name in keyword_mentions}
+    mentions = [mention for mention in keyword_mentions if mention[2] in names]
+    if names - scanned:
+        mentions.extend(_find_entity_mentions(text_lower, names - scanned))
+    relationships = extract_relationships(
+        entities,
+        text,
+        extractor=extractor,
+        text_lower=text_lower,
+        mentions=mentions,
+        raw_llm_relationships=raw_llm_relationships,
+    )
+    return entities, relationships
+
+
 def _create_neo4j_document_node(
-    neo4j_db: Neo4jDatabase, properties: dict[str, Any]
+    tx: ManagedTransaction, properties: dict[str, Any]
 ) -> None:
     query = """
     MERGE (d:Document {id: $id})
-    ON CREATE SET d += $props, d.created_at = datetime(), d.updated_at = datetime()
-    ON MATCH SET d += $props, d.updated_at = datetime()
+    ON CREATE SET d += $props, d.created_at = datetime.transaction(),
+        d.updated_at = datetime.transaction()
+    ON MATCH SET d += $props, d.updated_at = datetime.transaction()
     RETURN d.id AS id
     """
     props_to_set = {k: v for k, v in properties.items() if k != "id"}
-    neo4j_db.run_query(query, {"id": properties["id"], "props": props_to_set})
+    tx.run(query, {"id": properties["id"], "props": props_to_set})
     logger.info(f"Ensured Document node: {properties['id']}")
 
 
 def _create_neo4j_chunk_node(
-    neo4j_db: Neo4jDatabase, properties: dict[str, Any]
+    tx: ManagedTransaction, properties: dict[str, Any]
 ) -> None:
     query = """
     MERGE (c:Chunk {id: $id})
-    ON CREATE SET c += $props, c.created_at = datetime()
+    ON CREATE SET c += $props, c.created_at = datetime.transaction()
     ON MATCH SET c += $props
     RETURN c.id AS id
     """
     props_to_set = {k: v for k, v in properties.items() if k != "id"}
-    neo4j_db.run_query(query, {"id": properties["id"], "props": props_to_set})
+    tx.run(query, {"id": properties["id"], "props": props_to_set})
     logger.info(f"Ensured Chunk node: {properties['id']}")
 
 
-def _link_document_to_chunk(
-    neo4j_db: Neo4jDatabase, doc_id: str, chunk_id: str
-) -> None:
+def _link_document_to_chunk(tx: ManagedTransaction, doc_id: str, chunk_id: str) -> None:
     query = """
     MATCH (d:Document {id: $doc_id})
     MATCH (c:Chunk {id: $chunk_id})
     MERGE (d)-[:HAS_CHUNK]->(c)
     """
-    neo4j_db.run_query(query, {"doc_id": doc_id, "chunk_id": chunk_id})
+    tx.run(query, {"doc_id": doc_id, "chunk_id": chunk_id})
     logger.info(f"Linked Document {doc_id} to Chunk {chunk_id}")
 
 
-def _add_neo4j_entity_with_linking(
-    neo4j_db: Neo4jDatabase,
-    entity_data: dict[str, Any],
-    target_node_id: str,
-    target_node_label: str,
-    link_type: str = "MENTIONS_CONCEPT",
-) -> None:
+def _entity_node_row(entity_data: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Build the node label and properties for an extracted entity.
+
+    Returns:
+        (label, properties) for the entity's node
+
+    """
     entity_id = entity_data.get("id", f"concept-{uuid.uuid4().hex}")
     entity_name = entity_data.get("name")
     entity_type_label = entity_data.get("type", "Concept")  # This is the Label
-    normalized_name = entity_name.lower().strip() if entity_name else ""
+    normalized_name = entity_data.get("normalized_name") or (
+        entity_name.lower().strip() if entity_name else ""
+    )
 
     params_for_node = {
         "id": entity_id,
@@ -624,10 +1036,8 @@ def _add_neo4j_entity_with_linking(
         ):  # Neo4j compatible types
             params_for_node[key] = value
 
-    # Use dynamic labels with caution or ensure entity_type_label is sanitized
-    # For simplicity, assuming entity_type_label is a valid Neo4j Label like "Concept", "Person"
-    # Parameterizing labels directly is not standard. We construct the query string.
-    # Ensure entity_type_label is a safe string (e.g., alphanumeric)
+    # Labels cannot be parameterized, so they are interpolated into the query
+    # string. Ensure entity_type_label is a safe string (e.g., alphanumeric)
     if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", entity_type_label):
         logger.error(
             f"Invalid entity type label for Neo4j: {entity_type_label}. Defaulting to 'Concept'."
@@ -635,36 +1045,68 @@ def _add_neo4j_entity_with_linking(
         entity_type_label = "Concept"
         params_for_node["type"] = "Concept"  # Update the type property as well
 
-    merge_query = f"""
-    MERGE (c:{entity_type_label} {{id: $id}})
-    ON CREATE SET c = $params, c.created_at = datetime(), c.updated_at = datetime()
-    ON MATCH SET c += $params, c.updated_at = datetime()
+    return entity_type_label, params_for_node
+
+
+def _append_description(description: str, addition: str) -> str:
+    """Append a description unless it is empty or already included.
+
+    Mirrors the ON MATCH description update in _merge_entity_nodes.
     """
-    # For ON MATCH, we use c += $params to update existing properties and add new ones.
-    # $params should not include 'id' for the SET c += $params part if id is immutable after creation.
-    # However, MERGE uses id for matching.
-    # A cleaner way for ON MATCH might be specific SET c.prop = $params.prop for updatable fields.
-    # For now, c += $params will update all provided params.
-
-    neo4j_db.run_query(merge_query, {"id": entity_id, "params": params_for_node})
-
-    link_query = f"""
-    MATCH (t:{target_node_label} {{id: $target_node_id}})
-    MATCH (c:{entity_type_label} {{id: $entity_id}})
-    MERGE (t)-[r:{link_type}]->(c)
-    RETURN type(r)
+    if not addition or addition in description:
+        return description
+    if not description:
+        return addition
+    return f"{description} {addition}"
+
+
+def _merge_entity_nodes(
+    tx: ManagedTransaction, label: str, rows: list[dict[str, Any]]
+) -> dict[str, str]:
+    """Upsert entity nodes of one label with a single UNWIND query.
+
+    Nodes are merged on ``normalized_name`` so a concept seen in several
+    documents maps to a single node. New nodes take ``row.props``; existing
+    nodes keep their ID and have each of ``row.descriptions`` appended once.
+
+    Args:
+        tx: Neo4j write transaction
+        label: Node label of every row
+        rows: One row per distinct normalized name, with ``props`` and
+            ``descriptions``
+
+    Returns:
+        Mapping of normalized names to stored node IDs
+
     """
-    neo4j_db.run_query(
-        link_query, {"target_node_id": target_node_id, "entity_id": entity_id}
-    )
-    logger.debug(
-        f"Linked {target_node_label} {target_node_id} to {entity_type_label} {entity_id} ({entity_name})"
-    )
+    query = f"""
+    UNWIND $rows AS row
+    MERGE (c:{label} {{normalized_name: row.props.normalized_name}})
+    ON CREATE SET c = row.props, c.created_at = datetime.transaction(),
+        c.updated_at = datetime.transaction()
+    ON MATCH SET c.description = reduce(
+            description = coalesce(c.description, ''), addition IN row.descriptions |
+            CASE
+                WHEN addition = '' OR description CONTAINS addition THEN description
+                WHEN description = '' THEN addition
+                ELSE description + ' ' + addition
+            END
+        ),
+        c.updated_at = datetime.transaction()
+    RETURN c.normalized_name AS normalized_name, c.id AS id
+    """
+    result = tx.run(query, {"rows": rows})
+    return {record["normalized_name"]: record["id"] for record in result}
 
 
 def _add_neo4j_relationships(
-    neo4j_db: Neo4jDatabase, relationships: list[dict[str, Any]]
+    tx: ManagedTransaction, relationships: list[dict[str, Any]]
 ) -> None:
+    # Relationship types and labels cannot be parameterized, so rows are
+    # grouped by (type, source label, target label) and each group is written
+    # with a single UNWIND query. The labels let both endpoint lookups use the
+    # label's id index instead of scanning every node.
+    rows_by_key: dict[tuple[str, str, str], list[dict[str, Any]]] = defaultdict(list)
     for rel in relationships:
         rel_type = rel.get("type", "RELATED_TO")
         if not re.match(
@@ -674,27 +1116,571 @@ def _add_neo4j_relationships(
                 f"Invalid relationship type '{rel_type}'. Skipping relationship: {rel}"
             )
             continue
+        source_label = rel.get("source_label", "Concept")
+        target_label = rel.get("target_label", "Concept")
+        if not all(
+            re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", label)
+            for label in (source_label, target_label)
+        ):
+            logger.warning(
+                f"Invalid entity label '{source_label}' or '{target_label}'. "
+                f"Skipping relationship: {rel}"
+            )
+            continue
+        rows_by_key[(rel_type, source_label, target_label)].append(
+            {
+                "source_id": rel["source_id"],
+                "target_id": rel["target_id"],
+                "strength": float(rel.get("strength", 0.5)),
+                "description": rel.get("description", ""),
+                "method": rel.get("method", "unknown"),
+            }
+        )
 
+    for (rel_type, source_label, target_label), rows in rows_by_key.items():
         query = f"""
-        MATCH (c1 {{id: $source_id}})
-        MATCH (c2 {{id: $target_id}})
+        UNWIND $rows AS row
+        MATCH (c1:{source_label} {{id: row.source_id}})
+        MATCH (c2:{target_label} {{id: row.target_id}})
         MERGE (c1)-[r:{rel_type}]->(c2)
-        ON CREATE SET r.strength = $strength, r.description = $description, r.method = $method, r.created_at = datetime()
-        ON MATCH SET r.strength = CASE WHEN r.strength < $strength THEN $strength ELSE r.strength END,
-                     r.description = $description, r.method = $method, r.updated_at = datetime()
-        RETURN type(r)
+        ON CREATE SET r.strength = row.strength, r.description = row.description, r.method = row.method, r.created_at = datetime.transaction()
+        ON MATCH SET r.strength = CASE WHEN r.strength < row.strength THEN row.strength ELSE r.strength END,
+                     r.description = row.description, r.method = row.method, r.updated_at = datetime.transaction()
+        RETURN count(r) AS merged
         """
-        params = {
-            "source_id": rel["source_id"],
-            "target_id": rel["target_id"],
-            "strength": float(rel.get("strength", 0.5)),
-            "description": rel.get("description", ""),
-            "method": rel.get("method", "unknown"),
-        }
-        neo4j_db.run_query(query, params)
+        tx.run(query, {"rows": rows})
     logger.info(f"Processed {len(relationships)} entity relationships in Neo4j.")
 
 
+def _persist_document(
+    tx: ManagedTransaction,
+    doc_props: dict[str, Any],
+    targets: list[dict[str, Any]],
+    relationships: list[dict[str, Any]],
+) -> dict[str, str]:
+    """Write a document's nodes, entity links and relationships in one transaction.
+
+    Args:
+        tx: Neo4j write transaction
+        doc_props: Properties of the Document node
+        targets: One entry per Document/Chunk node with its entities; chunk
+            entries also carry ``chunk_props``
+        relationships: Entity relationships, rewritten in place to stored IDs
+            and labels
+
+    Returns:
+        Mapping of extracted entity IDs to their stored node IDs
+
+    """
+    return _persist_documents(tx, [(doc_props, targets, relationships)])[0]
+
+
+def _delete_documents(tx: ManagedTransaction, document_ids: list[str]) -> None:
+    """Delete Document nodes and their chunks; entity nodes are left in place.
+
+    Args:
+        tx: Neo4j write transaction
+        document_ids: IDs of the Document nodes to delete
+
+    """
+    query = """
+    MATCH (d:Document) WHERE d.id IN $ids
+    OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+    DETACH DELETE c, d
+    """
+    tx.run(query, {"ids": document_ids})
+
+
+def discard_documents(
+    neo4j_db: Neo4jDatabase,
+    vector_db: VectorDatabase,
+    document_ids: Iterable[str],
+    seen_hashes: dict[str, str] | None = None,
+) -> None:
+    """Remove whatever was stored for documents whose writes did not complete.
+
+    A document that is only half written (graph data without vectors, or the
+    reverse) would otherwise be skipped as a duplicate on every rerun. Its
+    Document and Chunk nodes and vector rows are deleted and its hash is
+    forgotten, so the next import adds it again.
+
+    Args:
+        neo4j_db: Neo4j database instance
+        vector_db: Vector database instance
+        document_ids: IDs of the documents to remove
+        seen_hashes: The run's hash cache passed to add_document_to_graphrag
+
+    """
+    document_ids = list(document_ids)
+    if not document_ids:
+        return
+    if seen_hashes:
+        failed = set(document_ids)
+        for doc_hash, doc_id in list(seen_hashes.items()):
+            if doc_id in failed:
+                seen_hashes.pop(doc_hash, None)
+    try:
+        neo4j_db.execute_write(_delete_documents, document_ids)
+    except Exception as e:
+        logger.error(
+            f"Error removing graph data for {len(document_ids)} documents: {e}"
+        )
+    try:
+        vector_db.delete(where={"document_id": {"$in": document_ids}})
+    except Exception as e:
+        logger.error(f"Error removing vectors for {len(document_ids)} documents: {e}")
+
+
+def mark_unwritten_documents_failed(
+    results: list[dict[str, Any]],
+    failed_document_ids: set[str],
+    neo4j_db: Neo4jDatabase,
+    vector_db: VectorDatabase,
+    seen_hashes: dict[str, str] | None = None,
+) -> int:
+    """Turn the results of documents whose buffered writes failed into failures.
+
+    ``add_document_to_graphrag`` reports success once a document's writes are
+    queued on a shared buffer. Once the buffer has flushed, this marks the
+    results of the documents it could not write as failed and discards
+    whatever was stored for them.
+
+    Args:
+        results: Results from add_document_to_graphrag, updated in place
+        failed_document_ids: IDs of documents whose writes failed
+        neo4j_db: Neo4j database instance
+        vector_db: Vector database instance
+        seen_hashes: The run's hash cache passed to add_document_to_graphrag
+
+    Returns:
+        Number of results marked as failed
+
+    """
+    failed = [
+        result
+        for result in results
+        if result
+        and result.get("status") in ("success", "partial_failure")
+        and result.get("document_id") in failed_document_ids
+    ]
+    for result in failed:
+        result["status"] = "failure"
+        result["error"] = "Writing the document to the database failed."
+    discard_documents(
+        neo4j_db,
+        vector_db,
+        [result["document_id"] for result in failed],
+        seen_hashes=seen_hashes,
+    )
+    return len(failed)
+
+
+class VectorWriteBuffer:
+    """Accumulate vector DB writes and send them in batches.
+
+    Embedding and inserting many documents in one ``add_documents`` call is
+    much cheaper than one call per document. The buffer is safe to share
+    between the worker threads of a folder import.
+
+    Rows are grouped by their ``document_id`` metadata. When a batch fails,
+    its documents are retried one at a time, and those that still fail are
+    collected in ``failed_document_ids`` for the caller to report and discard.
+    """
+
+    def __init__(self, vector_db: VectorDatabase, batch_size: int = 64) -> None:
+        """Initialize the buffer.
+
+        Args:
+            vector_db: Vector database instance to write to
+            batch_size: Number of pending documents that triggers a flush
+
+        """
+        self.vector_db = vector_db
+        self.batch_size = batch_size
+        self.failed_document_ids: set[str] = set()
+        self._documents: list[str] = []
+        self._metadatas: list[dict[str, Any]] = []
+        self._ids: list[str] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "VectorWriteBuffer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if not self.flush():
+            logger.error(
+                f"{len(self.failed_document_ids)} documents could not be written "
+                "to the vector DB."
+            )
+
+    def add(self, document: str, metadata: dict[str, Any], doc_id: str) -> None:
+        """Queue a document, flushing once the batch is full.
+
+        Args:
+            document: Document text
+            metadata: Document metadata
+            doc_id: Document ID
+
+        """
+        with self._lock:
+            self._documents.append(document)
+            self._metadatas.append(metadata)
+            self._ids.append(doc_id)
+            is_full = len(self._ids) >= self.batch_size
+        if is_full:
+            self.flush()
+
+    def pending_document_ids(self) -> set[str]:
+        """Return the IDs of documents with rows that have not been written yet."""
+        with self._lock:
+            return {
+                metadata.get("document_id", row_id)
+                for metadata, row_id in zip(self._metadatas, self._ids, strict=True)
+            }
+
+    def flush(self) -> bool:
+        """Write all pending documents to the vector database.
+
+        Returns:
+            False if any document written through this buffer has failed,
+            including in earlier flushes, True otherwise
+
+        """
+        with self._lock:
+            documents, metadatas, ids = self._documents, self._metadatas, self._ids
+            self._documents, self._metadatas, self._ids = [], [], []
+        if ids:
+            if self._add(documents, metadatas, ids):
+                logger.info(f"Flushed {len(ids)} documents to vector DB.")
+            else:
+                self._retry_per_document(documents, metadatas, ids)
+        with self._lock:
+            return not self.failed_document_ids
+
+    def _retry_per_document(
+        self, documents: list[str], metadatas: list[dict[str, Any]], ids: list[str]
+    ) -> None:
+        """Write a failed batch again one document at a time, recording failures."""
+        rows_by_document: dict[str, list[int]] = defaultdict(list)
+        for index, (metadata, row_id) in enumerate(zip(metadatas, ids, strict=True)):
+            rows_by_document[metadata.get("document_id", row_id)].append(index)
+
+        failed = set()
+        for document_id, rows in rows_by_document.items():
+            if len(rows_by_document) == 1 or not self._add(
+                [documents[i] for i in rows],
+                [metadatas[i] for i in rows],
+                [ids[i] for i in rows],
+            ):
+                failed.add(document_id)
+        logger.error(
+            f"Could not write {len(failed)} of {len(rows_by_document)} documents "
+            "to vector DB."
+        )
+        with self._lock:
+            self.failed_document_ids |= failed
+
+    def _add(
+        self, documents: list[str], metadatas: list[dict[str, Any]], ids: list[str]
+    ) -> bool:
+        """Send rows to the vector database.
+
+        Returns:
+            True if the write succeeded, False otherwise
+
+        """
+        try:
+            return self.vector_db.add_documents(
+                documents=documents, metadatas=metadatas, ids=ids
+            )
+        except Exception as e:
+            logger.error(
+                f"Error writing {len(ids)} documents to vector DB: {e}", exc_info=True
+            )
+            return False
+
+
+def _persist_documents(
+    tx: ManagedTransaction,
+    documents: list[tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]],
+) -> list[dict[str, str]]:
+    """Write several documents' graph data in one transaction.
+
+    Entities are deduplicated across every document and chunk in the batch
+    first, so each distinct concept is merged once however often it is
+    mentioned; mentions are then linked with one UNWIND per label pair.
+    Every query stamps ``datetime.transaction()``, so all nodes and edges
+    written for the batch share one timestamp computed by the server.
+
+    Args:
+        tx: Neo4j write transaction
+        documents: (doc_props, targets, relationships) per document, where
+            targets has one entry per Document/Chunk node with its entities
+            (chunk entries also carry ``chunk_props``), and relationships are
+            rewritten in place to stored IDs and labels
+
+    Returns:
+        Per document, mapping of extracted entity IDs to their stored node IDs
+
+    """
+    # (label, normalized_name) -> merge row, in first-mention order
+    entity_rows: dict[tuple[str, str], dict[str, Any]] = {}
+    # (target label, entity label) -> distinct (target ID, normalized_name)
+    mentions: dict[tuple[str, str], dict[tuple[str, str], None]] = defaultdict(dict)
+    # Per document: extracted entity ID -> (label, normalized_name)
+    entity_keys: list[dict[str, tuple[str, str]]] = []
+
+    for doc_props, targets, _ in documents:
+        _create_neo4j_document_node(tx, doc_props)
+        keys: dict[str, tuple[str, str]] = {}
+        for target in targets:
+            chunk_props = target.get("chunk_props")
+            if chunk_props:
+                _create_neo4j_chunk_node(tx, chunk_props)
+                _link_document_to_chunk(tx, doc_props["id"], chunk_props["id"])
+            for entity_data in target["entities"]:
+                label, props = _entity_node_row(entity_data)
+                key = (label, props["normalized_name"])
+                row = entity_rows.get(key)
+                if row is None:
+                    entity_rows[key] = {"props": props, "descriptions": []}
+                else:
+                    row["props"]["description"] = _append_description(
+                        row["props"]["description"], props["description"]
+                    )
+                entity_rows[key]["descriptions"].append(props["description"])
+                keys[props["id"]] = key
+                mentions[(target["label"], label)][(target["id"], key[1])] = None
+        entity_keys.append(keys)
+
+    rows_by_label: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for (label, _), row in entity_rows.items():
+        rows_by_label[label].append(row)
+    stored_ids: dict[tuple[str, str], str] = {}
+    for label, rows in rows_by_label.items():
+        for normalized_name, node_id in _merge_entity_nodes(tx, label, rows).items():
+            stored_ids[(label, normalized_name)] = node_id
+
+    for (target_label, label), pairs in mentions.items():
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (t:{target_label} {{id: row.target_id}})
+        MATCH (c:{label} {{normalized_name: row.normalized_name}})
+        MERGE (t)-[:MENTIONS_CONCEPT]->(c)
+        """
+        rows = [
+            {"target_id": target_id, "normalized_name": normalized_name}
+            for target_id, normalized_name in pairs
+        ]
+        tx.run(query, {"rows": rows})
+    logger.debug(
+        f"Merged {len(entity_rows)} distinct entities for {len(documents)} documents"
+    )
+
+    id_maps: list[dict[str, str]] = []
+    all_relationships: list[dict[str, Any]] = []
+    for (_, targets, relationships), keys in zip(documents, entity_keys, strict=True):
+        id_map = {orig_id: stored_ids[key] for orig_id, key in keys.items()}
+        for target in targets:
+            for entity_data in target["entities"]:
+                if entity_data.get("id") in id_map:
+                    entity_data["id"] = id_map[entity_data["id"]]
+        # Relationships also carry their endpoints' labels for an indexed MATCH
+        for rel in relationships:
+            for end in ("source", "target"):
+                key = keys.get(rel[f"{end}_id"])
+                if key is not None:
+                    rel[f"{end}_id"] = stored_ids[key]
+                    rel[f"{end}_label"] = key[0]
+        all_relationships.extend(relationships)
+        id_maps.append(id_map)
+
+    if all_relationships:
+        _add_neo4j_relationships(tx, all_relationships)
+    return id_maps
+
+
+class GraphWriteBuffer:
+    """Accumulate per-document graph writes and commit them in batches.
+
+    Each flush writes all queued documents in a single transaction instead of
+    one transaction (and commit) per document. Full batches are committed on
+    a background writer thread, so the next batch is prepared while the
+    previous one is being written; at most one batch is in flight at a time.
+    Like VectorWriteBuffer, the buffer is safe to share between worker
+    threads.
+
+    If a batch fails, its documents are retried one transaction each, so one
+    bad document does not roll back the rest. A document's vector rows are
+    only passed on to ``vector_buffer`` once its graph data is committed;
+    documents that could not be written are collected in
+    ``failed_document_ids``.
+    """
+
+    def __init__(
+        self,
+        neo4j_db: Neo4jDatabase,
+        vector_buffer: VectorWriteBuffer,
+        batch_size: int = 100,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            neo4j_db: Neo4j database instance to write to
+            vector_buffer: Buffer that receives each document's vector rows
+                after its graph data is committed
+            batch_size: Number of pending documents that triggers a flush
+
+        """
+        self.neo4j_db = neo4j_db
+        self.vector_buffer = vector_buffer
+        self.batch_size = batch_size
+        self.failed_document_ids: set[str] = set()
+        self._documents: list[
+            tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]
+        ] = []
+        # Document ID -> vector rows waiting for the document's graph commit
+        self._vector_rows: dict[str, list[tuple[str, dict[str, Any], str]]] = {}
+        self._lock = threading.Lock()
+        # Serialises batch hand-off so batches are committed in order
+        self._write_lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="graph-writer"
+        )
+        self._in_flight: Future[None] | None = None
+
+    def __enter__(self) -> "GraphWriteBuffer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if not self.flush():
+            logger.error(
+                f"Graph data for {len(self.failed_document_ids)} documents "
+                "could not be written."
+            )
+        self._writer.shutdown()
+
+    def add(
+        self,
+        doc_props: dict[str, Any],
+        targets: list[dict[str, Any]],
+        relationships: list[dict[str, Any]],
+        vector_rows: list[tuple[str, dict[str, Any], str]],
+    ) -> None:
+        """Queue a document's graph data, flushing once the batch is full.
+
+        A full batch is handed to the writer thread; this only blocks while
+        the previous batch is still being written.
+
+        Args:
+            doc_props: Properties of the Document node
+            targets: Document/Chunk nodes with their entities
+            relationships: Entity relationships
+            vector_rows: (text, metadata, ID) rows for the vector DB, queued
+                once the graph data is committed
+
+        """
+        with self._lock:
+            self._documents.append((doc_props, targets, relationships))
+            self._vector_rows[doc_props["id"]] = vector_rows
+            if len(self._documents) < self.batch_size:
+                return
+            documents, self._documents = self._documents, []
+        with self._write_lock:
+            self._wait_for_in_flight()
+            self._in_flight = self._writer.submit(self._write, documents)
+
+    def flush(self) -> bool:
+        """Write all pending documents to Neo4j in one transaction.
+
+        Waits for any batch still being written in the background first.
+
+        Returns:
+            False if any document written through this buffer has failed,
+            including in batches committed in the background, True otherwise
+
+        """
+        with self._lock:
+            documents, self._documents = self._documents, []
+        with self._write_lock:
+            self._wait_for_in_flight()
+            if documents:
+                self._write(documents)
+        with self._lock:
+            return not self.failed_document_ids
+
+    def _wait_for_in_flight(self) -> None:
+        """Wait for the background batch, if any; call with _write_lock held."""
+        if self._in_flight is not None:
+            self._in_flight.result()
+            self._in_flight = None
+
+    def _write(
+        self,
+        documents: list[
+            tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]
+        ],
+    ) -> None:
+        """Write a batch of documents to Neo4j in one transaction.
+
+        If the transaction fails, each document is retried on its own. The
+        vector rows of committed documents are queued on the vector buffer;
+        the IDs of documents that could not be written are added to
+        ``failed_document_ids``.
+
+        Args:
+            documents: (doc_props, targets, relationships) per document
+
+        """
+        if self._commit(documents):
+            logger.info(
+                f"Committed graph data for {len(documents)} documents in one transaction."
+            )
+            committed = documents
+        elif len(documents) == 1:
+            committed = []
+        else:
+            logger.info(f"Retrying {len(documents)} documents one at a time.")
+            committed = [document for document in documents if self._commit([document])]
+
+        committed_ids = {doc_props["id"] for doc_props, _, _ in committed}
+        with self._lock:
+            vector_rows = [
+                self._vector_rows.pop(doc_props["id"]) for doc_props, _, _ in documents
+            ]
+            self.failed_document_ids.update(
+                doc_props["id"]
+                for doc_props, _, _ in documents
+                if doc_props["id"] not in committed_ids
+            )
+        for (doc_props, _, _), rows in zip(documents, vector_rows, strict=True):
+            if doc_props["id"] in committed_ids:
+                for vec_text, vec_meta, vec_id in rows:
+                    self.vector_buffer.add(vec_text, vec_meta, vec_id)
+
+    def _commit(
+        self,
+        documents: list[
+            tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]
+        ],
+    ) -> bool:
+        """Run one write transaction for the given documents.
+
+        Returns:
+            True if the transaction committed, False otherwise
+
+        """
+        try:
+            self.neo4j_db.execute_write(_persist_documents, documents)
+            return True
+        except Exception as e:
+            logger.error(
+                f"Error writing graph data for {len(documents)} documents: {e}",
+                exc_info=True,
+            )
+            return False
+
+
 def add_document_to_graphrag(
     text: str,
     metadata: dict[str, Any],
@@ -704,6 +1690,10 @@ def add_document_to_graphrag(
     use_chunking_for_pdf: bool = False,
     chunk_size: int = 4000,
     overlap: int = 400,
+    extractor: ConceptExtractor | None = None,
+    vector_buffer: VectorWriteBuffer | None = None,
+    graph_buffer: GraphWriteBuffer | None = None,
+    seen_hashes: dict[str, str] | None = None,
 ) -> dict[str, Any] | None:
     doc_title = metadata.get("title", metadata.get("filename", "Unknown Title"))
     doc_source = metadata.get("source", metadata.get("file_path", "Unknown Source"))
@@ -713,18 +1703,58 @@ def add_document_to_graphrag(
         f"Attempting to add document: '{doc_title}' from '{doc_source}' (type: {document_type}, domain: {domain})"
     )
 
-    local_extractor = ConceptExtractor(use_nlp=False, use_llm=True, domain=domain)
-    logger.info(
-        f"ConceptExtractor initialized for '{doc_title}' (LLM usage: {local_extractor.use_llm})"
-    )
-
+    # One session serves this document's duplicate lookup and its graph
+    # write, so they share a pooled connection and the session's causal
+    # chaining instead of opening a session per query
+    session = neo4j_db.session()
     try:
-        full_text_hash = duplicate_detector.generate_document_hash(text)
+        # Duplicate checks come first so already-indexed documents skip
+        # extractor setup, entity extraction and all graph work
+        # Prefer a hash of the source file's bytes (set by process_pdf_file)
+        # over re-encoding and hashing the extracted text
+        full_text_hash = metadata.get("content_hash")
+        if not full_text_hash:
+            full_text_hash = duplicate_detector.generate_document_hash(text)
         metadata["full_text_hash"] = full_text_hash
+        # Cache of document hash -> document ID for documents already added (or
+        # found to be duplicates) earlier in the caller's run, checked before
+        # any DB or LLM work. It also covers documents whose writes are still
+        # queued on a shared buffer, which the lookups below cannot see yet. It
+        # is owned by the run, so documents deleted between runs are re-added.
+        if seen_hashes is None:
+            seen_hashes = {}
+        cached_doc_id = seen_hashes.get(full_text_hash)
+        if cached_doc_id is not None:
+            logger.info(
+                f"Skipping duplicate document: '{doc_title}' (ID: {cached_doc_id}, Method: memcache)"
+            )
+            return {
+                "status": "duplicate",
+                "document_id": cached_doc_id,
+                "message": "Document is a duplicate.",
+            }
+        # Exact hash match against the indexed Document.hash before the vector
+        # DB hash/title lookups
+        existing = session.run(
+            "MATCH (d:Document {hash: $hash}) RETURN d.id AS id LIMIT 1",
+            {"hash": full_text_hash},
+        ).data()
+        if existing:
+            seen_hashes[full_text_hash] = existing[0]["id"]
+            logger.info(
+                f"Skipping duplicate document: '{doc_title}' (ID: {existing[0]['id']}, Method: neo4j_hash)"
+            )
+            return {
+                "status": "duplicate",
+                "document_id": existing[0]["id"],
+                "message": "Document is a duplicate.",
+            }
         is_dup, existing_doc_id, method = duplicate_detector.is_duplicate(
-            text, metadata
+            text, metadata, precomputed_hash=full_text_hash
         )
         if is_dup:
+            if existing_doc_id is not None:
+                seen_hashes[full_text_hash] = existing_doc_id
             logger.info(
                 f"Skipping duplicate document: '{doc_title}' (ID: {existing_doc_id}, Method: {method})"
             )
@@ -735,6 +1765,13 @@ def add_document_to_graphrag(
             }
 
         logger.info(f"Processing new document: '{doc_title}'")
+        local_extractor = extractor or _get_extractor(domain)
+        # Without a caller-owned buffer, this document's writes are batched
+        # locally and flushed before returning
+        local_vector_buffer = vector_buffer or VectorWriteBuffer(vector_db)
+        logger.info(
+            f"Using ConceptExtractor for '{doc_title}' (LLM usage: {local_extractor.use_llm})"
+        )
         texts_to_process_with_meta = []
         is_pdf_and_chunking = document_type == "pdf" and use_chunking_for_pdf
 
@@ -749,16 +1786,14 @@ def add_document_to_graphrag(
                     "status": "failure",
                 }
             for i, chunk_content in enumerate(chunks):
-                chunk_meta = metadata.copy()
-                chunk_meta.update(
-                    {
-                        "chunk_index": i,
-                        "total_chunks": len(chunks),
-                        "chunk_hash": duplicate_detector.generate_document_hash(
-                            chunk_content
-                        ),
-                    }
-                )
+                chunk_meta = {
+                    **metadata,
+                    "chunk_index": i,
+                    "total_chunks": len(chunks),
+                    "chunk_hash": duplicate_detector.generate_document_hash(
+                        chunk_content
+                    ),
+                }
                 texts_to_process_with_meta.append(
                     {
                         "text": chunk_content,
@@ -793,11 +1828,37 @@ def add_document_to_graphrag(
         ]:  # Add more relevant fields
             if key in metadata:
                 parent_doc_props[key] = metadata[key]
-        _create_neo4j_document_node(neo4j_db, parent_doc_props)
 
         all_chunk_results, overall_entities_map, overall_relationships_list = [], {}, []
+        # Graph writes and vector rows are collected here and persisted after
+        # extraction: Neo4j in one transaction, then the vector DB
+        neo4j_targets: list[dict[str, Any]] = []
+        vector_rows: list[tuple[str, dict[str, Any], str]] = []
+
+        # Extract LLM concepts, then their relationships, for all chunks up
+        # front with one generate_batch call per pass, whose requests run
+        # concurrently, rather than a two-pass extraction per chunk inside the
+        # loop below.
+        batched_llm_concepts: list[list[dict[str, Any]]] | None = None
+        batched_llm_relationships: list[list[dict[str, Any]]] | None = None
+        if len(texts_to_process_with_meta) > 1 and local_extractor.use_llm:
+            try:
+                batched_llm_concepts = local_extractor.extract_concepts_llm_batch(
+                    [item["text"] for item in texts_to_process_with_meta]
+                )
+                batched_llm_relationships = (
+                    local_extractor.extract_relationships_llm_batch(
+                        batched_llm_concepts
+                    )
+                )
+            except Exception as e:
+                logger.error(
+                    f"Batched LLM concept extraction failed for '{doc_title}', "
+                    f"falling back to per-chunk extraction: {e}",
+                    exc_info=True,
+                )
 
-        for item in texts_to_process_with_meta:
+        for item_idx, item in enumerate(texts_to_process_with_meta):
             cur_text, cur_meta, is_chunk_item, chunk_idx_val = (
                 item["text"],
                 item["metadata"],
@@ -810,28 +1871,34 @@ def add_document_to_graphrag(
                 else "Document"
             )
             try:
-                entities = extract_entities(
+                entities, relationships = extract_graph(
                     cur_text,
                     cur_meta,
-                    extractor_instance=local_extractor,
+                    local_extractor,
                     domain=domain,
+                    llm_concepts=(
+                        batched_llm_concepts[item_idx]
+                        if batched_llm_concepts is not None
+                        else None
+                    ),
+                    text_lower=cur_text.lower(),
+                    llm_relationships=(
+                        batched_llm_relationships[item_idx]
+                        if batched_llm_relationships is not None
+                        else None
+                    ),
                 )
                 logger.info(
-                    f"{log_prefix}: Extracted {len(entities)} entities for '{doc_title}'."
+                    f"{log_prefix}: Extracted {len(entities)} entities and "
+                    f"{len(relationships)} relationships for '{doc_title}'."
                 )
                 for entity in entities:
-                    name_l = entity["name"].lower()
+                    name_l = entity.get("normalized_name") or entity["name"].lower()
                     if name_l not in overall_entities_map:
                         overall_entities_map[name_l] = entity
                     elif "id" not in overall_entities_map[name_l] and "id" in entity:
                         overall_entities_map[name_l]["id"] = entity["id"]
 
-                relationships = extract_relationships(
-                    entities, cur_text, extractor=local_extractor
-                )
-                logger.info(
-                    f"{log_prefix}: Extracted {len(relationships)} relationships for '{doc_title}'."
-                )
                 overall_relationships_list.extend(relationships)
 
                 current_target_node_id_str: str
@@ -849,8 +1916,6 @@ def add_document_to_graphrag(
                         "char_count": len(cur_text),
                         "word_count": len(cur_text.split()),
                     }
-                    _create_neo4j_chunk_node(neo4j_db, chunk_props)
-                    _link_document_to_chunk(neo4j_db, doc_id, chunk_node_id_val)
                     current_target_node_id_str = chunk_node_id_val
                     current_target_label = "Chunk"
 
@@ -859,34 +1924,24 @@ def add_document_to_graphrag(
                         for k, v in cur_meta.items()
                         if isinstance(v, str | int | float | bool)
                     }
-                    vec_meta.update(
-                        {
-                            "document_id": doc_id,
-                            "chunk_id": chunk_node_id_val,
-                            "title": doc_title,
-                        }
-                    )  # Ensure title for vector
-                    vector_db.add_documents(
-                        ids=[chunk_node_id_val],
-                        documents=[cur_text],
-                        metadatas=[vec_meta],
-                    )
-                    logger.info(
-                        f"{log_prefix}: Added chunk {chunk_node_id_val} to vector DB."
-                    )
+                    vec_meta["document_id"] = doc_id
+                    vec_meta["chunk_id"] = chunk_node_id_val
+                    vec_meta["title"] = doc_title  # Ensure title for vector
+                    vector_rows.append((cur_text, vec_meta, chunk_node_id_val))
                 else:
+                    chunk_props = None
                     current_target_node_id_str = doc_id
                     current_target_label = "Document"
 
-                for (
-                    entity_data
-                ) in entities:  # Link entities to the current target (doc or chunk)
-                    _add_neo4j_entity_with_linking(
-                        neo4j_db,
-                        entity_data,
-                        current_target_node_id_str,
-                        current_target_label,
-                    )
+                # Entities are linked to the current target (doc or chunk)
+                neo4j_targets.append(
+                    {
+                        "id": current_target_node_id_str,
+                        "label": current_target_label,
+                        "entities": entities,
+                        "chunk_props": chunk_props,
+                    }
+                )
 
                 all_chunk_results.append(
                     {"status": "success", "id": current_target_node_id_str}
@@ -910,21 +1965,47 @@ def add_document_to_graphrag(
                 for k, v in metadata.items()
                 if isinstance(v, str | int | float | bool)
             }
-            vec_meta_full.update(
-                {"document_id": doc_id, "title": doc_title, "source": doc_source}
+            vec_meta_full["document_id"] = doc_id
+            vec_meta_full["title"] = doc_title
+            vec_meta_full["source"] = doc_source
+            vector_rows.append((text, vec_meta_full, doc_id))
+
+        if graph_buffer is None:
+            session.execute_write(
+                _persist_document,
+                parent_doc_props,
+                neo4j_targets,
+                overall_relationships_list,
             )
-            vector_db.add_documents(
-                ids=[doc_id], documents=[text], metadatas=[vec_meta_full]
+            logger.info(f"Committed graph data for '{doc_title}' in one transaction.")
+        else:
+            # Vector rows follow once the graph data is committed
+            graph_buffer.add(
+                parent_doc_props, neo4j_targets, overall_relationships_list, vector_rows
             )
-            logger.info(f"Added full document {doc_id} to vector DB for '{doc_title}'.")
-
-        if overall_relationships_list:
-            _add_neo4j_relationships(neo4j_db, overall_relationships_list)
+            logger.info(f"Queued graph data for '{doc_title}'.")
+
+        # With a caller-owned buffer, write failures surface later through its
+        # failed_document_ids; the caller reports and discards those documents
+        if graph_buffer is None:
+            for vec_text, vec_meta, vec_id in vector_rows:
+                local_vector_buffer.add(vec_text, vec_meta, vec_id)
+        if vector_buffer is None and not local_vector_buffer.flush():
+            discard_documents(neo4j_db, vector_db, [doc_id], seen_hashes=seen_hashes)
+            return {
+                "status": "failure",
+                "document_id": doc_id,
+                "error": f"Could not write vector DB entries for '{doc_title}'.",
+            }
+        logger.info(
+            f"Queued {len(vector_rows)} entries for vector DB for '{doc_title}'."
+        )
 
         successful_ops = [
             res for res in all_chunk_results if res.get("status") == "success"
         ]
         if len(successful_ops) == len(texts_to_process_with_meta):
+            seen_hashes[full_text_hash] = doc_id
             return {
                 "status": "success",
                 "document_id": doc_id,
@@ -949,6 +2030,260 @@ def add_document_to_graphrag(
             f"Unhandled error adding document '{doc_title}': {e}", exc_info=True
         )
         return {"error": f"Unhandled error: {e}", "status": "failure"}
+    finally:
+        session.close()
+
+
+def process_pdf_file(
+    file_path: str,
+    neo4j_db: Neo4jDatabase,
+    vector_db: VectorDatabase,
+    duplicate_detector: DuplicateDetector,
+    base_metadata: dict[str, Any] | None = None,
+    use_chunking_for_pdf: bool = False,
+    chunk_size: int = 4000,
+    overlap: int = 400,
+    extractor: ConceptExtractor | None = None,
+    vector_buffer: VectorWriteBuffer | None = None,
+    seen_hashes: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Extract a single PDF and add it to the GraphRAG system.
+
+    Args:
+        file_path: Path to the PDF file
+        neo4j_db: Neo4j database instance
+        vector_db: Vector database instance
+        duplicate_detector: DuplicateDetector instance
+        base_metadata: Metadata shared by every file (author, category, domain, ...)
+        use_chunking_for_pdf: Whether to chunk the PDF text before extraction
+        chunk_size: Target chunk size for PDF chunking
+        overlap: Overlap size for PDF chunking
+        extractor: ConceptExtractor to reuse (default: shared instance for the domain)
+        vector_buffer: Shared vector DB write buffer (default: write immediately)
+        seen_hashes: Hash cache shared by the files of one run (default: none)
+
+    Returns:
+        Result dictionary from add_document_to_graphrag, with the file path added
+
+    """
+    metadata = dict(base_metadata or {})
+    metadata.update(
+        {
+            "title": os.path.splitext(os.path.basename(file_path))[0],
+            "source": metadata.get("source") or file_path,
+            "file_path": file_path,
+            "document_type": "pdf",
+        }
+    )
+    metadata["content_hash"] = file_content_hash(file_path)
+    text = extract_text_from_pdf(file_path)
+    if not text:
+        return {
+            "file_path": file_path,
+            "status": "failure",
+            "error": f"Could not extract text from PDF: {file_path}",
+        }
+    result = add_document_to_graphrag(
+        text=text,
+        metadata=metadata,
+        neo4j_db=neo4j_db,
+        vector_db=vector_db,
+        duplicate_detector=duplicate_detector,
+        use_chunking_for_pdf=use_chunking_for_pdf,
+        chunk_size=chunk_size,
+        overlap=overlap,
+        extractor=extractor,
+        vector_buffer=vector_buffer,
+        seen_hashes=seen_hashes,
+    ) or {"status": "failure", "error": "No result returned."}
+    result["file_path"] = file_path
+    return result
+
+
+def _iter_pdfs(folder_path: str) -> Iterator[str]:
+    """Yield PDF paths under a folder (recursively) as they are found.
+
+    Uses ``os.scandir`` so large folders are walked lazily instead of being
+    listed in full before processing starts.
+    """
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_pdfs(entry.path)
+            elif entry.is_file() and entry.name.lower().endswith(".pdf"):
+                yield entry.path
+
+
+async def iter_folder_results(
+    folder_path: str,
+    neo4j_db: Neo4jDatabase,
+    vector_db: VectorDatabase,
+    duplicate_detector: DuplicateDetector,
+    base_metadata: dict[str, Any] | None = None,
+    use_chunking_for_pdf: bool = False,
+    chunk_size: int = 4000,
+    overlap: int = 400,
+    max_concurrency: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Add every PDF in a folder, yielding each file's result as it completes.
+
+    Each file runs ``process_pdf_file`` in a worker thread (PyPDF2 and the
+    database drivers are synchronous). At most ``max_concurrency`` files are in
+    flight at once, and new paths are only pulled from the folder walk as slots
+    free up, so memory stays flat regardless of folder size. Vector DB writes
+    are buffered across files and flushed in batches, and once more at the end.
+
+    Args:
+        folder_path: Folder containing PDF files (searched recursively)
+        neo4j_db: Neo4j database instance
+        vector_db: Vector database instance
+        duplicate_detector: DuplicateDetector instance
+        base_metadata: Metadata shared by every file
+        use_chunking_for_pdf: Whether to chunk the PDF text before extraction
+        chunk_size: Target chunk size for PDF chunking
+        overlap: Overlap size for PDF chunking
+        max_concurrency: Maximum number of files processed at once
+            (default: IMPORT_CONCURRENCY environment variable, or 8)
+
+    Yields:
+        Result dictionary for each file, in completion order once the file's
+        vector DB rows have been written
+
+    """
+    if max_concurrency is None:
+        max_concurrency = int(os.getenv("IMPORT_CONCURRENCY", "8"))
+    max_concurrency = max(1, max_concurrency)
+    logger.info(
+        f"Importing PDF files from {folder_path} "
+        f"(processing up to {max_concurrency} at a time)."
+    )
+
+    # Make sure the Neo4j driver exists before worker threads start using it
+    neo4j_db.connect()
+    extractor = _get_extractor((base_metadata or {}).get("domain") or "general")
+    # Duplicate content within this import is skipped without a DB lookup
+    seen_hashes: dict[str, str] = {}
+
+    async def _process(file_path: str) -> dict[str, Any]:
+        try:
+            return await asyncio.to_thread(
+                process_pdf_file,
+                file_path,
+                neo4j_db,
+                vector_db,
+                duplicate_detector,
+                base_metadata,
+                use_chunking_for_pdf,
+                chunk_size,
+                overlap,
+                extractor,
+                vector_buffer,
+                seen_hashes,
+            )
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {e}")
+            return {"file_path": file_path, "status": "failure", "error": str(e)}
+
+    # Vector DB writes from all files share one buffer and go out in batches.
+    # A file's result is held back until its rows have been written, so a
+    # failed batch is reported against the files it contained.
+    with VectorWriteBuffer(vector_db) as vector_buffer:
+        held: list[dict[str, Any]] = []
+
+        def _release(final: bool = False) -> list[dict[str, Any]]:
+            nonlocal held
+            if final:
+                vector_buffer.flush()
+            unwritten = set() if final else vector_buffer.pending_document_ids()
+            ready = [r for r in held if r.get("document_id") not in unwritten]
+            held = [r for r in held if r.get("document_id") in unwritten]
+            mark_unwritten_documents_failed(
+                ready,
+                vector_buffer.failed_document_ids,
+                neo4j_db,
+                vector_db,
+                seen_hashes=seen_hashes,
+            )
+            return ready
+
+        pending: set[asyncio.Task] = set()
+        for file_path in _iter_pdfs(folder_path):
+            if len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                held.extend(task.result() for task in done)
+                for result in _release():
+                    yield result
+            pending.add(asyncio.create_task(_process(file_path)))
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            held.extend(task.result() for task in done)
+            for result in _release():
+                yield result
+        for result in _release(final=True):
+            yield result
+
+
+async def process_folder_async(
+    folder_path: str,
+    neo4j_db: Neo4jDatabase,
+    vector_db: VectorDatabase,
+    duplicate_detector: DuplicateDetector,
+    base_metadata: dict[str, Any] | None = None,
+    use_chunking_for_pdf: bool = False,
+    chunk_size: int = 4000,
+    overlap: int = 400,
+    max_concurrency: int | None = None,
+) -> dict[str, int]:
+    """Add every PDF in a folder and return per-status counts.
+
+    Thin wrapper around ``iter_folder_results`` that only keeps counters, so
+    per-file results are logged as they arrive rather than accumulated.
+
+    Args:
+        folder_path: Folder containing PDF files (searched recursively)
+        neo4j_db: Neo4j database instance
+        vector_db: Vector database instance
+        duplicate_detector: DuplicateDetector instance
+        base_metadata: Metadata shared by every file
+        use_chunking_for_pdf: Whether to chunk the PDF text before extraction
+        chunk_size: Target chunk size for PDF chunking
+        overlap: Overlap size for PDF chunking
+        max_concurrency: Maximum number of files processed at once
+
+    Returns:
+        Summary dictionary with total, success, duplicate and failed counts
+
+    """
+    summary = {"total": 0, "success": 0, "duplicate": 0, "failed": 0}
+    async for result in iter_folder_results(
+        folder_path,
+        neo4j_db,
+        vector_db,
+        duplicate_detector,
+        base_metadata=base_metadata,
+        use_chunking_for_pdf=use_chunking_for_pdf,
+        chunk_size=chunk_size,
+        overlap=overlap,
+        max_concurrency=max_concurrency,
+    ):
+        summary["total"] += 1
+        status = result.get("status")
+        if status == "success":
+            summary["success"] += 1
+        elif status == "duplicate":
+            summary["duplicate"] += 1
+        else:
+            summary["failed"] += 1
+        logger.info(
+            f"[{summary['total']}] {os.path.basename(result.get('file_path', ''))}: "
+            f"{status}"
+        )
+    return summary
 
 
 def main() -> None:
@@ -961,6 +2296,16 @@ def main() -> None:
     parser.add_argument(
         "--file-path", type=str, help="Path to the document file (PDF or TXT)."
     )
+    parser.add_argument(
+        "--folder", type=str, help="Folder of PDF files to add (searched recursively)."
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Number of PDFs processed concurrently with --folder "
+        "(default: IMPORT_CONCURRENCY env var or 8).",
+    )
     parser.add_argument("--title", type=str, help="Document title.")
     parser.add_argument("--author", type=str, help="Document author.")
     parser.add_argument("--category", type=str, help="Document category.")
@@ -986,8 +2331,43 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if not args.text and not args.file_path:
-        parser.error("Either --text or --file-path must be provided.")
+    if not args.text and not args.file_path and not args.folder:
+        parser.error("Either --text, --file-path or --folder must be provided.")
+
+    if args.folder:
+        if not os.path.isdir(args.folder):
+            logger.error(f"Folder not found: {args.folder}")
+            sys.exit(1)
+        neo4j_db_instance = Neo4jDatabase()
+        try:
+            neo4j_db_instance.create_schema()
+            vector_db_instance = VectorDatabase()
+            summary = asyncio.run(
+                process_folder_async(
+                    args.folder,
+                    neo4j_db_instance,
+                    vector_db_instance,
+                    DuplicateDetector(vector_db_instance),
+                    base_metadata={
+                        "author": args.author or "Unknown",
+                        "category": args.category or "General",
+                        "source": args.source,
+                        "domain": args.domain,
+                    },
+                    use_chunking_for_pdf=args.use_chunking_for_pdf,
+                    chunk_size=args.chunk_size,
+                    overlap=args.overlap,
+                    max_concurrency=args.max_concurrency,
+                )
+            )
+            logger.info(
+                f"Folder import finished: {summary['success']} added, "
+                f"{summary['duplicate']} duplicates, {summary['failed']} failed "
+                f"(of {summary['total']} PDFs)."
+            )
+        finally:
+            neo4j_db_instance.close()
+        return
 
     doc_text = args.text
     doc_metadata = {
@@ -1014,6 +2394,7 @@ def main() -> None:
             if not doc_text:
                 logger.error(f"Could not extract text from PDF: {args.file_path}")
                 sys.exit(1)
+            doc_metadata["content_hash"] = file_content_hash(args.file_path)
         elif args.file_path.lower().endswith(".txt"):
             try:
                 with open(args.file_path, encoding="utf-8") as f:
@@ -1033,6 +2414,7 @@ def main() -> None:
     neo4j_db_instance = None
     try:
         neo4j_db_instance = Neo4jDatabase()
+        neo4j_db_instance.create_schema()
         vector_db_instance = VectorDatabase()
         duplicate_detector_instance = DuplicateDetector(vector_db_instance)  # Corrected
 
@@ -7,23 +7,51 @@ This script demonstrates how to:
 """
 
 import argparse
-import glob
 import json
+import mmap
 import os
 import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add the project root directory to the Python path
 sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 )  # Adjusted path to go up two levels to project root
 
-from scripts.document_processing.add_document_core import add_document_to_graphrag
+from scripts.document_processing.add_document_core import (
+    GraphWriteBuffer,
+    VectorWriteBuffer,
+    add_document_to_graphrag,
+    file_content_hash,
+    mark_unwritten_documents_failed,
+)
 from src.database.neo4j_db import Neo4jDatabase
 from src.database.vector_db import VectorDatabase
 from src.processing.duplicate_detector import DuplicateDetector
 from src.processing.file_handler import FileHandler  # Added import
 
+# Files are read on this many threads, at most READ_AHEAD_FILES ahead of the
+# single thread that writes them to the databases
+READ_WORKERS = min(8, os.cpu_count() or 1)
+READ_AHEAD_FILES = 64
+
+# Progress is reported once per this many files rather than per file
+PROGRESS_EVERY = 100
+
+# Text files at least this large are decoded from a memory map
+MMAP_MIN_BYTES = 1 << 20
+
 
 def process_directory(
     directory_path: str,
@@ -43,103 +71,205 @@ def process_directory(
         List of processing results
 
     """
-    supported_extensions = FileHandler.get_supported_extensions()
-    all_files = []
-    for ext in supported_extensions:
-        # Use recursive glob to find files with the current extension
-        pattern = os.path.join(directory_path, "**", f"*{ext}")
-        all_files.extend(glob.glob(pattern, recursive=True))
-
-    # Add .txt and .json files for backward compatibility if not already covered by FileHandler
-    # and to ensure the example files are processed if they are .txt or .json
-    if ".txt" not in supported_extensions:
-        all_files.extend(
-            glob.glob(os.path.join(directory_path, "**", "*.txt"), recursive=True)
-        )
-    if ".json" not in supported_extensions:
-        all_files.extend(
-            glob.glob(os.path.join(directory_path, "**", "*.json"), recursive=True)
-        )
-
-    # Remove duplicates that might arise if an extension is in both lists
-    all_files = sorted(list(set(all_files)))
+    # .txt and .json are always included for backward compatibility, and so
+    # that the example files are processed even if FileHandler lacks them
+    extensions = {*FileHandler.get_supported_extensions(), ".txt", ".json"}
+    all_files = sorted(_find_files(directory_path, extensions))
 
     print(
         f"Found {len(all_files)} processable files in {directory_path} and its subdirectories."
     )
 
     results = []
-
-    for file_path in all_files:
-        file_name = os.path.basename(file_path)
-        _, ext = os.path.splitext(file_path.lower())
-        print(f"\nProcessing file: {file_name} (Type: {ext})")
-
-        try:
-            if FileHandler.can_handle_file(file_path):
-                text, metadata = FileHandler.process_file(file_path)
-                # Ensure file_path is in metadata, FileHandler might not add it
-                if "file_path" not in metadata:
-                    metadata["file_path"] = file_path
-                if (
-                    "source" not in metadata
-                ):  # Add a default source if not provided by loader
-                    metadata["source"] = f"File ({ext})"
-            elif ext == ".txt":  # Manual handling for .txt
-                with open(file_path, encoding="utf-8") as f:
-                    text = f.read()
-                metadata = {
-                    "title": os.path.splitext(file_name)[0],
-                    "source": "Text File",
-                    "file_path": file_path,
-                }
-            elif ext == ".json":  # Manual handling for .json
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                text = data.pop("text", "")
-                if not text:
-                    print(f"Skipping {file_name}: No 'text' field found in JSON")
-                    results.append(
-                        {
-                            "file_path": file_path,
-                            "status": "skipped",
-                            "reason": "No text field in JSON",
-                        }
-                    )
+    # Duplicate content within this run is skipped without a DB lookup
+    seen_hashes: dict[str, str] = {}
+
+    # Files are read and parsed on a thread pool ahead of ingestion, while this
+    # thread is the single writer. Graph and vector writes are batched across
+    # files instead of being committed once per document; both buffers flush
+    # on exit, the graph buffer first since it hands committed documents'
+    # vector rows on to the vector buffer.
+    with (
+        VectorWriteBuffer(vector_db) as vector_buffer,
+        GraphWriteBuffer(neo4j_db, vector_buffer) as graph_buffer,
+    ):
+        for index, (file_path, parsed) in enumerate(
+            _read_files_ahead(all_files), start=1
+        ):
+            file_name = os.path.basename(file_path)
+            try:
+                text, metadata = parsed.result()
+                if text is None:
+                    # Skipped while reading; metadata holds the result
+                    results.append(metadata)
                     continue
-                metadata = data
-                metadata["source"] = "JSON File"
-                metadata["file_path"] = file_path
-            else:
-                print(
-                    f"Skipping {file_name}: Unsupported file type by explicit check {ext}"
+
+                # Add document to GraphRAG system
+                result = add_document_to_graphrag(
+                    text=text,
+                    metadata=metadata,
+                    neo4j_db=neo4j_db,
+                    vector_db=vector_db,
+                    duplicate_detector=duplicate_detector,
+                    vector_buffer=vector_buffer,
+                    graph_buffer=graph_buffer,
+                    seen_hashes=seen_hashes,
                 )
+                results.append(result)
+
+            except Exception as e:
+                print(f"❌ Error processing file {file_name}: {e}")
                 results.append(
-                    {
-                        "file_path": file_path,
-                        "status": "skipped",
-                        "reason": f"Unsupported file type {ext}",
-                    }
+                    {"file_path": file_path, "status": "error", "reason": str(e)}
                 )
+            finally:
+                if index % PROGRESS_EVERY == 0 or index == len(all_files):
+                    print(f"Processed {index}/{len(all_files)} files", flush=True)
+
+    # Results report success once a document's writes are queued; documents
+    # the buffers could not write are marked failed now
+    failed_count = mark_unwritten_documents_failed(
+        results,
+        graph_buffer.failed_document_ids | vector_buffer.failed_document_ids,
+        neo4j_db,
+        vector_db,
+        seen_hashes=seen_hashes,
+    )
+    if failed_count:
+        print(f"❌ {failed_count} documents could not be written to the database")
+
+    return results
+
+
+def _find_files(directory_path: str, extensions: set[str]) -> Iterator[str]:
+    """Find files with the given extensions in a directory tree.
+
+    Walks the tree with os.scandir, whose cached directory entry types avoid
+    a stat call per file. Hidden files and directories are skipped, as with
+    a recursive glob.
+
+    Args:
+        directory_path: Root directory to search
+        extensions: File extensions to match, including the leading dot
+
+    Yields:
+        Paths of the matching files
+
+    """
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
                 continue
+            if entry.is_dir():
+                yield from _find_files(entry.path, extensions)
+            elif entry.is_file() and os.path.splitext(entry.name)[1] in extensions:
+                yield entry.path
 
-            # Add document to GraphRAG system
-            result = add_document_to_graphrag(
-                text=text,
-                metadata=metadata,
-                neo4j_db=neo4j_db,
-                vector_db=vector_db,
-                duplicate_detector=duplicate_detector,
-            )
-            results.append(result)
-
-        except Exception as e:
-            print(f"❌ Error processing file {file_name}: {e}")
-            results.append(
-                {"file_path": file_path, "status": "error", "reason": str(e)}
-            )
 
-    return results
+def _read_files_ahead(
+    file_paths: list[str],
+) -> Iterator[tuple[str, Future[tuple[str | None, dict[str, Any]]]]]:
+    """Read files on a thread pool, yielding them in order as they are needed.
+
+    At most READ_AHEAD_FILES files are read or held in memory ahead of the
+    consumer.
+
+    Args:
+        file_paths: Paths of the files to read
+
+    Yields:
+        (file_path, future) pairs; each future resolves to _read_file's result
+
+    """
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        pending: deque[tuple[str, Future[tuple[str | None, dict[str, Any]]]]] = deque()
+        for file_path in file_paths:
+            pending.append((file_path, executor.submit(_read_file, file_path)))
+            if len(pending) >= READ_AHEAD_FILES:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+def _read_text(file_path: str) -> str:
+    """Read a UTF-8 text file.
+
+    Large files are decoded straight from a memory map, so the file's bytes
+    are never copied into a Python object alongside the decoded text.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        File contents
+
+    """
+    path = Path(file_path)
+    if path.stat().st_size < MMAP_MIN_BYTES:
+        return path.read_text(encoding="utf-8")
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        return str(mapped, "utf-8")
+
+
+def _read_file(file_path: str) -> tuple[str | None, dict[str, Any]]:
+    """Read and parse one file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        (text, metadata) to ingest, or (None, result) if the file is skipped
+
+    """
+    file_name = os.path.basename(file_path)
+    _, ext = os.path.splitext(file_path.lower())
+
+    if FileHandler.can_handle_file(file_path):
+        text, metadata = FileHandler.process_file(file_path)
+        # Ensure file_path is in metadata, FileHandler might not add it
+        if "file_path" not in metadata:
+            metadata["file_path"] = file_path
+        if "source" not in metadata:  # Add a default source if not provided by loader
+            metadata["source"] = f"File ({ext})"
+        if ext == ".pdf":
+            # Same hash as the other PDF import paths, for duplicate detection
+            metadata["content_hash"] = file_content_hash(file_path)
+    elif ext == ".txt":  # Manual handling for .txt
+        text = _read_text(file_path)
+        metadata = {
+            "title": os.path.splitext(file_name)[0],
+            "source": "Text File",
+            "file_path": file_path,
+        }
+    elif ext == ".json":  # Manual handling for .json
+        raw = Path(file_path).read_bytes()
+        if b'"text"' in raw:
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            text = data.pop("text", "")
+        else:
+            # No "text" key anywhere in the file, so skip it without parsing
+            text = ""
+        if not text:
+            print(f"Skipping {file_name}: No 'text' field found in JSON")
+            return None, {
+                "file_path": file_path,
+                "status": "skipped",
+                "reason": "No text field in JSON",
+            }
+        metadata = data
+        metadata["source"] = "JSON File"
+        metadata["file_path"] = file_path
+    else:
+        print(f"Skipping {file_name}: Unsupported file type by explicit check {ext}")
+        return None, {
+            "file_path": file_path,
+            "status": "skipped",
+            "reason": f"Unsupported file type {ext}",
+        }
+    return text, metadata
 
 
 def create_example_files(output_dir: str) -> None:
@@ -306,15 +436,17 @@ def create_example_files(output_dir: str) -> None:
     # Write example text files
     for example in example_texts:
         file_path = os.path.join(output_dir, example["filename"])
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(example["content"])
+        Path(file_path).write_bytes(example["content"].encode("utf-8"))
         print(f"Created example text file: {file_path}")
 
     # Write example JSON files
     for example in example_jsons:
         file_path = os.path.join(output_dir, example["filename"])
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(example["content"], f, indent=2)
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(example["content"], option=orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(example["content"], indent=2).encode("utf-8")
+        Path(file_path).write_bytes(content)
         print(f"Created example JSON file: {file_path}")
 
 
@@ -342,6 +474,10 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # Output is per batch of files, so let stdout buffer between progress
+    # reports (which flush) instead of writing on every newline
+    sys.stdout.reconfigure(line_buffering=False)
+
     # Create example files if requested
     if args.create_examples:
         create_example_files(args.example_dir)
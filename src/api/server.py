@@ -433,12 +433,17 @@ def add_folder():
         from concurrent.futures import ThreadPoolExecutor
 
         from scripts.document_processing.add_document_core import (
+            VectorWriteBuffer,
             add_document_to_graphrag,
+            discard_documents,
+            file_content_hash,
         )
         from src.processing.duplicate_detector import DuplicateDetector
 
         # Initialize duplicate detector
         duplicate_detector = DuplicateDetector(vector_db)
+        # Duplicate content within this job is skipped without a DB lookup
+        seen_hashes: dict[str, str] = {}
 
         files = job.params["files"]
         default_metadata = job.params.get("default_metadata", {})
@@ -571,6 +576,9 @@ def add_folder():
                     metadata["source"] = "Folder Import"
                 if "filename" not in metadata:
                     metadata["filename"] = filename
+                if file_ext == ".pdf":
+                    # Same hash as the other PDF import paths, for duplicate detection
+                    metadata["content_hash"] = file_content_hash(file_path)
 
                 # Add document to GraphRAG system
                 logger.debug(
@@ -587,6 +595,8 @@ def add_folder():
                         neo4j_db=neo4j_db,
                         vector_db=vector_db,
                         duplicate_detector=duplicate_detector,
+                        vector_buffer=vector_buffer,
+                        seen_hashes=seen_hashes,
                     )
 
                     # Log the raw result for debugging
@@ -666,12 +676,35 @@ def add_folder():
             10, len(files)
         )  # Use at most 10 threads or number of files, whichever is smaller
 
-        # Process files in parallel using a thread pool
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Process files in parallel using a thread pool. Vector DB writes are
+        # shared across workers and flushed in batches when the pool is done.
+        with (
+            VectorWriteBuffer(vector_db) as vector_buffer,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
             # Submit all files for processing
             file_infos = [(i, file_path) for i, file_path in enumerate(files)]
             executor.map(process_file, file_infos)
 
+        # Files were counted as added once their vector rows were queued; the
+        # ones in batches that could not be written are failures after all
+        failed_ids = vector_buffer.failed_document_ids
+        if failed_ids:
+            for file_result in results["details"]:
+                if (
+                    file_result["success"]
+                    and file_result.get("status") != "duplicate"
+                    and file_result.get("document_id") in failed_ids
+                ):
+                    logger.error(
+                        f"Failed to write {file_result['file']} to the vector database"
+                    )
+                    file_result["success"] = False
+                    file_result["error"] = "Writing to the vector database failed."
+                    results["added_count"] -= 1
+                    results["failed_count"] += 1
+            discard_documents(neo4j_db, vector_db, failed_ids)
+
         # Ensure final progress is 100%
         job.update_progress(len(files), len(files))
 
@@ -135,34 +135,26 @@ class GraphDatabase:
             concept_properties["id"] = f"concept-{uuid.uuid4()}"
 
         concept_properties["name"] = concept_name
+        concept_properties["normalized_name"] = concept_name.lower().strip()
         concept_properties["created_at"] = datetime.now().isoformat()
 
-        # Check if concept already exists (case-insensitive match)
+        # Reuse an existing concept with the same case-insensitive name. The
+        # lookup is on normalized_name, which is backed by a unique constraint,
+        # instead of toLower(c.name), which scans every Concept node.
         query = """
-        MATCH (c:Concept)
-        WHERE toLower(c.name) = toLower($name)
+        MERGE (c:Concept {normalized_name: $properties.normalized_name})
+        ON CREATE SET c = $properties
         RETURN c.id AS id, c.name AS name
         """
 
-        existing = self.neo4j_db.run_query_and_return_single(
-            query, {"name": concept_name}
+        result = self.neo4j_db.run_query_and_return_single(
+            query, {"properties": concept_properties}
         )
 
-        if existing:
+        if result.get("id") != concept_properties["id"]:
             logger.debug(
-                f"Concept '{concept_name}' already exists with ID {existing['id']}"
+                f"Concept '{concept_name}' already exists with ID {result.get('id')}"
             )
-            return existing
-
-        # Create concept node
-        query = """
-        CREATE (c:Concept $properties)
-        RETURN c.id AS id, c.name AS name
-        """
-
-        result = self.neo4j_db.run_query_and_return_single(
-            query, {"properties": concept_properties}
-        )
 
         return result
 
@@ -257,8 +249,7 @@ class GraphDatabase:
         elif source_is_id:
             query = f"""
             MATCH (source:Concept {{id: $source}})
-            MATCH (target:Concept)
-            WHERE toLower(target.name) = toLower($target)
+            MATCH (target:Concept {{normalized_name: $target_normalized}})
             MERGE (source)-[r:{relationship_type}]->(target)
             ON CREATE SET r = $properties
             RETURN source.id AS source_id, source.name AS source_name,
@@ -272,8 +263,7 @@ class GraphDatabase:
             }
         elif target_is_id:
             query = f"""
-            MATCH (source:Concept)
-            WHERE toLower(source.name) = toLower($source)
+            MATCH (source:Concept {{normalized_name: $source_normalized}})
             MATCH (target:Concept {{id: $target}})
             MERGE (source)-[r:{relationship_type}]->(target)
             ON CREATE SET r = $properties
@@ -289,11 +279,13 @@ class GraphDatabase:
         else:
             # Both are names, need to find or create both concepts
             query = f"""
-            MERGE (source:Concept {{name: $source}})
-            ON CREATE SET source.id = $source_id, source.created_at = $created_at
+            MERGE (source:Concept {{normalized_name: $source_normalized}})
+            ON CREATE SET source.id = $source_id, source.name = $source,
+                          source.created_at = $created_at
 
-            MERGE (target:Concept {{name: $target}})
-            ON CREATE SET target.id = $target_id, target.created_at = $created_at
+            MERGE (target:Concept {{normalized_name: $target_normalized}})
+            ON CREATE SET target.id = $target_id, target.name = $target,
+                          target.created_at = $created_at
 
             MERGE (source)-[r:{relationship_type}]->(target)
             ON CREATE SET r = $properties
@@ -311,6 +303,8 @@ class GraphDatabase:
                 "properties": rel_properties,
             }
 
+        params["source_normalized"] = source_concept.lower().strip()
+        params["target_normalized"] = target_concept.lower().strip()
         result = self.neo4j_db.run_query_and_return_single(query, params)
 
         return result
@@ -1,16 +1,99 @@
 """Neo4j database connection and operations for GraphRAG project."""
 
 import os
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from dotenv import load_dotenv
-from neo4j import Driver, GraphDatabase
+from neo4j import Driver, Session
+from neo4j.exceptions import CypherSyntaxError
 
 from src.config import get_port
+from src.database.neo4j_pool import get_driver
 
 # Load environment variables
 load_dotenv()
 
+T = TypeVar("T")
+
+
+# Passes of concurrent relationship deletes before leaving the rest to the
+# node delete
+RELATIONSHIP_DELETE_PASSES = 3
+
+
+def delete_all_nodes(
+    session: Session, batch_size: int = 10000, concurrency: int = 1
+) -> None:
+    """Delete every node and relationship, in transactions of `batch_size` nodes.
+
+    Large graphs are then never held in a single transaction's locks and
+    memory. With `concurrency` above 1, relationships are first deleted by
+    that many concurrent transactions (Neo4j 5.21+), which is where most of
+    the work in a dense graph lies.
+
+    Args:
+        session: Neo4j session to run the deletes in
+        batch_size: Number of nodes (or relationships) to delete per transaction
+        concurrency: Number of transactions deleting relationships at once
+
+    """
+    if concurrency > 1:
+        _delete_relationships_concurrently(session, batch_size, concurrency)
+    try:
+        session.run(
+            """
+            MATCH (n)
+            CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $batch_size ROWS
+            """,
+            batch_size=batch_size,
+        ).consume()
+    except CypherSyntaxError:
+        # Servers before 4.4 have no CALL {} IN TRANSACTIONS
+        while session.run(
+            """
+            MATCH (n) WITH n LIMIT $batch_size
+            DETACH DELETE n
+            RETURN count(*) AS deleted
+            """,
+            batch_size=batch_size,
+        ).single()["deleted"]:
+            pass
+
+
+def _delete_relationships_concurrently(
+    session: Session, batch_size: int, concurrency: int
+) -> None:
+    """Delete relationships with several concurrent transactions.
+
+    Concurrent batches can conflict on the locks of shared end nodes. Failed
+    batches are skipped and retried by the next pass, and whatever is left
+    after RELATIONSHIP_DELETE_PASSES passes is deleted with its nodes.
+
+    Args:
+        session: Neo4j session to run the deletes in
+        batch_size: Number of relationships to delete per transaction
+        concurrency: Number of transactions to run at once
+
+    """
+    for _ in range(RELATIONSHIP_DELETE_PASSES):
+        try:
+            session.run(
+                f"""
+                MATCH ()-[r]->()
+                CALL {{ WITH r DELETE r }}
+                    IN {int(concurrency)} CONCURRENT TRANSACTIONS OF $batch_size ROWS
+                    ON ERROR CONTINUE
+                """,
+                batch_size=batch_size,
+            ).consume()
+        except CypherSyntaxError:
+            # Servers before 5.21 have no concurrent transactions
+            return
+        remaining = session.run("MATCH ()-[r]->() RETURN count(r) AS count").single()
+        if not remaining["count"]:
+            return
+
 
 class Neo4jDatabase:
     """Neo4j database connection and operations for GraphRAG project."""
@@ -20,6 +103,7 @@ class Neo4jDatabase:
         uri: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        database: str | None = None,
     ) -> None:
         """Initialize Neo4j database connection.
 
@@ -27,6 +111,8 @@ class Neo4jDatabase:
             uri: Neo4j URI (default: from environment variable)
             username: Neo4j username (default: from environment variable)
             password: Neo4j password (default: from environment variable)
+            database: Database name (default: from environment variable, else
+                the server's default database)
 
         """
         # Get Neo4j port from centralized configuration
@@ -53,20 +139,58 @@ class Neo4jDatabase:
         print(f"Neo4j URI: {self.uri} (from env: {env_uri})")
         self.username = username or os.getenv("NEO4J_USERNAME", "neo4j")
         self.password = password or os.getenv("NEO4J_PASSWORD", "graphrag")
+        # Naming the database up front saves the driver a round-trip to
+        # resolve the user's home database for every new session
+        self.database = database or os.getenv("NEO4J_DATABASE")
         self.driver: Driver | None = None
 
     def connect(self) -> None:
-        """Connect to Neo4j database."""
+        """Connect to Neo4j database.
+
+        The driver, and its connection pool, is shared with every other
+        instance using the same URI and credentials.
+        """
         if self.driver is None:
-            self.driver = GraphDatabase.driver(
-                self.uri, auth=(self.username, self.password)
-            )
+            self.driver = get_driver(self.uri, self.username, self.password)
 
     def close(self) -> None:
-        """Close Neo4j database connection."""
-        if self.driver is not None:
-            self.driver.close()
-            self.driver = None
+        """Close Neo4j database connection.
+
+        The shared driver stays open for other instances and is closed when
+        the process exits.
+        """
+        self.driver = None
+
+    def session(self) -> Session:
+        """Open a session for running several queries or one transaction.
+
+        Use as a context manager, e.g. ``with db.session() as s:
+        s.execute_write(fn)``, to group many writes into a single commit.
+
+        Returns:
+            Neo4j session
+
+        """
+        self.connect()
+        return self.driver.session(database=self.database)
+
+    def execute_write(self, work: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a unit of work in a single managed write transaction.
+
+        Every query issued through the transaction passed to `work` is
+        committed together, and the work is retried on transient errors.
+
+        Args:
+            work: Function taking a transaction followed by `args` and `kwargs`
+            *args: Positional arguments for `work`
+            **kwargs: Keyword arguments for `work`
+
+        Returns:
+            Whatever `work` returns
+
+        """
+        with self.session() as session:
+            return session.execute_write(work, *args, **kwargs)
 
     def verify_connection(self) -> bool:
         """Verify Neo4j database connection.
@@ -84,7 +208,7 @@ class Neo4jDatabase:
                 print("Driver is None after connect()")
                 return False
 
-            with self.driver.session() as session:
+            with self.driver.session(database=self.database) as session:
                 result = session.run("RETURN 1 AS result")
                 return result.single()["result"] == 1
         except Exception as e:
@@ -108,7 +232,7 @@ class Neo4jDatabase:
 
         """
         self.connect()
-        with self.driver.session() as session:
+        with self.driver.session(database=self.database) as session:
             result = session.run(query, parameters or {})
             # Convert all records to dictionaries
             return [dict(record) for record in result]
@@ -127,7 +251,7 @@ class Neo4jDatabase:
 
         """
         self.connect()
-        with self.driver.session() as session:
+        with self.driver.session(database=self.database) as session:
             result = session.run(query, parameters or {})
             record = result.single()
             if record:
@@ -142,6 +266,8 @@ class Neo4jDatabase:
             "CREATE CONSTRAINT chapter_id IF NOT EXISTS FOR (c:Chapter) REQUIRE c.id IS UNIQUE",
             "CREATE CONSTRAINT section_id IF NOT EXISTS FOR (s:Section) REQUIRE s.id IS UNIQUE",
             "CREATE CONSTRAINT concept_id IF NOT EXISTS FOR (c:Concept) REQUIRE c.id IS UNIQUE",
+            "CREATE CONSTRAINT document_id IF NOT EXISTS FOR (d:Document) REQUIRE d.id IS UNIQUE",
+            "CREATE CONSTRAINT chunk_id IF NOT EXISTS FOR (c:Chunk) REQUIRE c.id IS UNIQUE",
         ]
 
         # Create indexes for common properties
@@ -159,22 +285,106 @@ class Neo4jDatabase:
             # Concept indexes
             "CREATE INDEX concept_name IF NOT EXISTS FOR (c:Concept) ON (c.name)",
             "CREATE INDEX concept_category IF NOT EXISTS FOR (c:Concept) ON (c.category)",
+            "CREATE FULLTEXT INDEX concept_name_ft IF NOT EXISTS FOR (c:Concept) ON EACH [c.name]",
+            # Document indexes
+            "CREATE INDEX document_hash IF NOT EXISTS FOR (d:Document) ON (d.hash)",
         ]
 
+        # Concepts written before normalized_name existed can only be found by
+        # scanning toLower(c.name); give one node per name the indexed key.
+        # Nodes whose name is already taken are left alone rather than
+        # violating the uniqueness constraint.
+        backfill = """
+        MATCH (c:Concept)
+        WHERE c.normalized_name IS NULL AND c.name IS NOT NULL
+        WITH toLower(trim(c.name)) AS normalized_name, collect(c) AS nodes
+        WHERE NOT EXISTS {
+            MATCH (:Concept {normalized_name: normalized_name})
+        }
+        WITH normalized_name, head(nodes) AS c
+        SET c.normalized_name = normalized_name
+        """
+
+        # The backfill runs first so the normalized_name key also covers
+        # backfilled nodes. Each statement is applied on its own, so one
+        # failure does not stop the rest of the schema from being created.
         self.connect()
-        with self.driver.session() as session:
-            for constraint in constraints:
-                session.run(constraint)
-            for index in indexes:
-                session.run(index)
+        with self.driver.session(database=self.database) as session:
+            for statement in [backfill, *constraints, *indexes]:
+                try:
+                    session.run(statement).consume()
+                except Exception as e:
+                    print(
+                        f"Could not apply schema statement '{statement.strip()}': {e}"
+                    )
+            try:
+                self._ensure_concept_name_key(session)
+            except Exception as e:
+                print(f"Could not index Concept.normalized_name: {e}")
+
+    def _ensure_concept_name_key(self, session: Session) -> None:
+        """Back Concept.normalized_name with a uniqueness constraint if possible.
+
+        Concepts are merged and matched on normalized_name, so it needs an
+        index either way. Databases written before concepts were merged on it
+        can hold duplicate names, which make the constraint fail; those keep a
+        plain index instead. Neo4j will not create the constraint over an
+        existing index on the same property, so the plain index is only
+        dropped once no duplicates are left.
 
-    def clear_database(self) -> None:
+        Args:
+            session: Session to run the schema statements in
+
+        """
+        constraint = (
+            "CREATE CONSTRAINT concept_normalized_name_unique IF NOT EXISTS "
+            "FOR (c:Concept) REQUIRE c.normalized_name IS UNIQUE"
+        )
+        try:
+            session.run(constraint).consume()
+            return
+        except Exception as e:
+            error = e
+
+        duplicates = session.run(
+            """
+            MATCH (c:Concept)
+            WHERE c.normalized_name IS NOT NULL
+            WITH c.normalized_name AS normalized_name, count(*) AS copies
+            WHERE copies > 1
+            RETURN count(*) AS duplicates
+            """
+        ).single()["duplicates"]
+        if not duplicates:
+            # The plain index is what blocked the constraint
+            session.run("DROP INDEX concept_normalized_name IF EXISTS").consume()
+            try:
+                session.run(constraint).consume()
+                return
+            except Exception as e:
+                error = e
+
+        print(
+            f"Could not make Concept.normalized_name unique ({duplicates} duplicated "
+            f"names), indexing it instead: {error}"
+        )
+        session.run(
+            "CREATE INDEX concept_normalized_name IF NOT EXISTS "
+            "FOR (c:Concept) ON (c.normalized_name)"
+        ).consume()
+
+    def clear_database(self, batch_size: int = 10000, concurrency: int = 1) -> None:
         """Clear all data from the database.
         WARNING: This will delete all nodes and relationships.
+
+        Args:
+            batch_size: Number of nodes to delete per transaction
+            concurrency: Number of transactions deleting relationships at once
+
         """
         self.connect()
-        with self.driver.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
+        with self.driver.session(database=self.database) as session:
+            delete_all_nodes(session, batch_size, concurrency)
 
     def create_dummy_data(self) -> None:
         """Create dummy data for testing."""
@@ -198,9 +408,12 @@ class Neo4jDatabase:
                            number: 2, chapter_id: 'chapter-001'})
 
         // Create concepts
-        CREATE (concept1:Concept {id: 'concept-001', name: 'Neural Networks'})
-        CREATE (concept2:Concept {id: 'concept-002', name: 'Decision Trees'})
-        CREATE (concept3:Concept {id: 'concept-003', name: 'Gradient Descent'})
+        CREATE (concept1:Concept {id: 'concept-001', name: 'Neural Networks',
+                                  normalized_name: 'neural networks'})
+        CREATE (concept2:Concept {id: 'concept-002', name: 'Decision Trees',
+                                  normalized_name: 'decision trees'})
+        CREATE (concept3:Concept {id: 'concept-003', name: 'Gradient Descent',
+                                  normalized_name: 'gradient descent'})
 
         // Create relationships
         CREATE (b1)-[:CONTAINS]->(c1)
@@ -215,5 +428,5 @@ class Neo4jDatabase:
         """
 
         self.connect()
-        with self.driver.session() as session:
+        with self.driver.session(database=self.database) as session:
             session.run(books_query)
@@ -0,0 +1,60 @@
+"""Shared Neo4j drivers for GraphRAG project.
+
+A driver owns a pool of Bolt connections, and creating one costs a handshake
+(plus TLS and routing discovery where used). Every Neo4jDatabase with the
+same connection settings therefore shares one driver per process.
+"""
+
+import atexit
+import os
+import threading
+
+from neo4j import Driver, GraphDatabase
+
+# Pool tunables (can be overridden by environment variables)
+MAX_CONNECTION_POOL_SIZE = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+CONNECTION_ACQUISITION_TIMEOUT = float(
+    os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60")
+)
+MAX_CONNECTION_LIFETIME = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+
+_drivers: dict[tuple[str, str, str], Driver] = {}
+_lock = threading.Lock()
+
+
+def get_driver(uri: str, username: str, password: str) -> Driver:
+    """Get the shared driver for a set of connection settings.
+
+    Args:
+        uri: Neo4j URI
+        username: Neo4j username
+        password: Neo4j password
+
+    Returns:
+        Neo4j driver, created on first use
+
+    """
+    key = (uri, username, password)
+    with _lock:
+        driver = _drivers.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(
+                uri,
+                auth=(username, password),
+                max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+                connection_acquisition_timeout=CONNECTION_ACQUISITION_TIMEOUT,
+                max_connection_lifetime=MAX_CONNECTION_LIFETIME,
+            )
+            _drivers[key] = driver
+        return driver
+
+
+def close_drivers() -> None:
+    """Close every shared driver and its connections."""
+    with _lock:
+        for driver in _drivers.values():
+            driver.close()
+        _drivers.clear()
+
+
+atexit.register(close_drivers)
@@ -234,7 +234,7 @@ class VectorDatabase:
         ids: list[str] | None = None,
         batch_size: int = DEFAULT_BATCH_SIZE,
         check_duplicates: bool = True,
-    ) -> None:
+    ) -> bool:
         """Add documents to vector database.
 
         Args:
@@ -245,6 +245,9 @@ class VectorDatabase:
             batch_size: Number of documents to add in each batch
             check_duplicates: Whether to check for duplicates before adding
 
+        Returns:
+            True if every batch was added, False if any batch failed
+
         """
         if self.collection is None:
             self.connect()
@@ -258,12 +261,13 @@ class VectorDatabase:
 
         if total_docs <= batch_size:
             # Small enough to add in one batch
-            self._add_batch_with_retry(
+            return self._add_batch_with_retry(
                 documents, embeddings, metadatas, ids, check_duplicates
             )
         else:
             # Process in batches
             logger.info(f"Adding {total_docs} documents in batches of {batch_size}...")
+            success = True
 
             for i in range(0, total_docs, batch_size):
                 end_idx = min(i + batch_size, total_docs)
@@ -280,12 +284,15 @@ class VectorDatabase:
                     batch_metadatas = metadatas[i:end_idx]
 
                 # Add batch with retry logic
-                self._add_batch_with_retry(
-                    batch_docs,
-                    batch_embeddings,
-                    batch_metadatas,
-                    batch_ids,
-                    check_duplicates,
+                success = (
+                    self._add_batch_with_retry(
+                        batch_docs,
+                        batch_embeddings,
+                        batch_metadatas,
+                        batch_ids,
+                        check_duplicates,
+                    )
+                    and success
                 )
 
                 logger.info(
@@ -295,6 +302,7 @@ class VectorDatabase:
 
                 # Small delay to avoid overwhelming the database
                 time.sleep(0.1)
+            return success
 
     def _add_batch_with_retry(
         self,
@@ -625,13 +633,20 @@ class VectorDatabase:
         return cast(dict[str, Any], result)
 
     def get(
-        self, ids: list[str] | None = None, where: dict[str, Any] | None = None
+        self,
+        ids: list[str] | None = None,
+        where: dict[str, Any] | None = None,
+        limit: int | None = None,
+        include: list[str] | None = None,
     ) -> dict[str, Any]:
         """Get documents from vector database.
 
         Args:
             ids: List of document IDs
             where: Filter query by metadata
+            limit: Maximum number of documents to return
+            include: Fields to return, e.g. ["metadatas"] (default: ChromaDB's
+                default of documents and metadatas)
 
         Returns:
             Documents
@@ -643,9 +658,13 @@ class VectorDatabase:
         # Use type assertion to handle potential None value
         assert self.collection is not None, "Collection is None after connect()"
 
+        get_kwargs: dict[str, Any] = {"ids": ids, "where": where, "limit": limit}
+        if include is not None:
+            get_kwargs["include"] = include
+
         try:
             # Use type casting to handle type compatibility issues
-            result = self.collection.get(ids=ids, where=where)
+            result = self.collection.get(**get_kwargs)
 
             # Convert the result to a dictionary
             return cast(dict[str, Any], result)
@@ -674,7 +693,7 @@ class VectorDatabase:
                     )
 
                     # Try the get operation again
-                    result = self.collection.get(ids=ids, where=where)
+                    result = self.collection.get(**get_kwargs)
 
                     return cast(dict[str, Any], result)
                 except Exception as e2:
@@ -683,6 +702,23 @@ class VectorDatabase:
             # Return empty result structure
             return self._create_empty_result()
 
+    def delete(
+        self, ids: list[str] | None = None, where: dict[str, Any] | None = None
+    ) -> None:
+        """Delete documents from vector database.
+
+        Args:
+            ids: List of document IDs
+            where: Filter by metadata
+
+        """
+        if self.collection is None:
+            self.connect()
+
+        # Use type assertion to handle potential None value
+        assert self.collection is not None, "Collection is None after connect()"
+        self.collection.delete(ids=ids, where=where)
+
     def _create_empty_result(self) -> dict[str, Any]:
         """Create an empty result structure for when queries fail.
 
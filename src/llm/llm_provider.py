@@ -4,10 +4,14 @@ This module provides a flexible architecture for integrating with various LLM en
 including local LLM servers (e.g., LM Studio, Ollama) and cloud APIs.
 """
 
+import functools
 import json
 import logging
 import os
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
@@ -18,6 +22,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of requests a generate_batch call has in flight at once
+LLM_BATCH_CONCURRENCY = int(os.getenv("LLM_BATCH_CONCURRENCY", "4"))
+
+
+def _generate_concurrently(
+    generate: Callable[..., str], prompts: list[str], **kwargs
+) -> list[str]:
+    """Call ``generate`` for each prompt on a thread pool, keeping prompt order.
+
+    None of the supported APIs takes several prompts in one completion
+    request, so a batch is sent as up to LLM_BATCH_CONCURRENCY concurrent
+    requests instead of one after another.
+
+    Args:
+        generate: Function generating text for one prompt
+        prompts: List of text prompts
+        **kwargs: Additional parameters passed to ``generate``
+
+    Returns:
+        List of generated texts, in prompt order
+
+    """
+    if len(prompts) <= 1 or LLM_BATCH_CONCURRENCY <= 1:
+        return [generate(prompt, **kwargs) for prompt in prompts]
+    with ThreadPoolExecutor(
+        max_workers=min(LLM_BATCH_CONCURRENCY, len(prompts)),
+        thread_name_prefix="llm-batch",
+    ) as executor:
+        return list(executor.map(lambda prompt: generate(prompt, **kwargs), prompts))
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -175,17 +209,17 @@ class OpenAICompatibleProvider(LLMProvider):
             return f"Error: {str(e)}"
 
     def generate_batch(self, prompts: list[str], **kwargs) -> list[str]:
-        """Generate text for multiple prompts.
+        """Generate text for multiple prompts, sent as concurrent requests.
 
         Args:
             prompts: List of text prompts
             **kwargs: Additional parameters
 
         Returns:
-            List of generated texts
+            List of generated texts, in prompt order
 
         """
-        return [self.generate(prompt, **kwargs) for prompt in prompts]
+        return _generate_concurrently(self.generate, prompts, **kwargs)
 
     def get_embeddings(self, texts: list[str], **kwargs) -> list[list[float]]:
         """Get embeddings for texts.
@@ -384,17 +418,17 @@ class OpenRouterProvider(LLMProvider):
             return f"Error: {str(e)}"
 
     def generate_batch(self, prompts: list[str], **kwargs) -> list[str]:
-        """Generate text for multiple prompts.
+        """Generate text for multiple prompts, sent as concurrent requests.
 
         Args:
             prompts: List of text prompts
             **kwargs: Additional parameters
 
         Returns:
-            List of generated texts
+            List of generated texts, in prompt order
 
         """
-        return [self.generate(prompt, **kwargs) for prompt in prompts]
+        return _generate_concurrently(self.generate, prompts, **kwargs)
 
     def get_embeddings(self, texts: list[str], **kwargs) -> list[list[float]]:
         """Get embeddings for texts using OpenRouter API.
@@ -623,17 +657,17 @@ class OllamaProvider(LLMProvider):
             return f"Error: {str(e)}"
 
     def generate_batch(self, prompts: list[str], **kwargs) -> list[str]:
-        """Generate text for multiple prompts.
+        """Generate text for multiple prompts, sent as concurrent requests.
 
         Args:
             prompts: List of text prompts
             **kwargs: Additional parameters
 
         Returns:
-            List of generated texts
+            List of generated texts, in prompt order
 
         """
-        return [self.generate(prompt, **kwargs) for prompt in prompts]
+        return _generate_concurrently(self.generate, prompts, **kwargs)
 
     def get_embeddings(self, texts: list[str], **kwargs) -> list[list[float]]:
         """Get embeddings for texts using Ollama API.
@@ -751,65 +785,76 @@ class LLMManager:
                 raise
 
     def generate_batch(self, prompts: list[str], **kwargs) -> list[str]:
-        """Generate text for multiple prompts with fallback."""
-        results = []
-        primary_failed = False
-
-        # Try to use primary provider for each prompt
-        for prompt in prompts:
-            if primary_failed and self.fallback_provider:
-                # If primary provider has already failed, use fallback for all remaining prompts
-                logger.info("Using fallback provider for remaining prompts in batch")
-                remaining_prompts = prompts[len(results) :]
-                remaining_results = self.fallback_provider.generate_batch(
-                    remaining_prompts, **kwargs
-                )
-                results.extend(remaining_results)
-                break
+        """Generate text for multiple prompts with fallback.
 
-            try:
-                response = self.primary_provider.generate(prompt, **kwargs)
-
-                # Check if the response indicates an error or rate limiting
-                if (
-                    response.startswith("Error:")
-                    or response.startswith("API Response:")
-                    or "rate-limited" in response
-                    or "error" in response.lower()
-                ):
-                    logger.warning(
-                        f"Primary provider returned error response in batch: {response[:100]}..."
-                    )
-                    primary_failed = True
+        Prompts are sent as concurrent requests. Once the primary provider
+        fails for one prompt, the prompts that have not been sent yet go
+        straight to the fallback provider, so a rate-limited primary is not
+        retried for the rest of the batch.
+        """
+        primary_failed = threading.Event()
+        return _generate_concurrently(
+            functools.partial(
+                self._generate_with_fallback, primary_failed=primary_failed
+            ),
+            prompts,
+            **kwargs,
+        )
 
-                    if self.fallback_provider:
-                        logger.info("Trying fallback provider for this prompt")
-                        fallback_response = self.fallback_provider.generate(
-                            prompt, **kwargs
-                        )
-                        results.append(fallback_response)
-                    else:
-                        results.append(response)
-                else:
-                    results.append(response)
-            except Exception as e:
-                logger.warning(f"Primary provider failed for prompt in batch: {e}")
-                primary_failed = True
+    def _generate_with_fallback(
+        self, prompt: str, primary_failed: threading.Event, **kwargs
+    ) -> str:
+        """Generate text for one prompt of a batch with fallback.
+
+        Unlike ``generate``, a failing fallback provider yields an error
+        response rather than an exception, so one prompt cannot fail the batch.
 
+        Args:
+            prompt: Text prompt
+            primary_failed: Set once the primary provider has failed in this batch
+            **kwargs: Additional parameters
+
+        Returns:
+            Generated text
+
+        """
+        if primary_failed.is_set() and self.fallback_provider:
+            return self._generate_with_fallback_provider(prompt, **kwargs)
+        try:
+            response = self.primary_provider.generate(prompt, **kwargs)
+
+            # Check if the response indicates an error or rate limiting
+            if (
+                response.startswith("Error:")
+                or response.startswith("API Response:")
+                or "rate-limited" in response
+                or "error" in response.lower()
+            ):
+                logger.warning(
+                    f"Primary provider returned error response in batch: {response[:100]}..."
+                )
+                primary_failed.set()
                 if self.fallback_provider:
-                    logger.info("Trying fallback provider for this prompt")
-                    try:
-                        fallback_response = self.fallback_provider.generate(
-                            prompt, **kwargs
-                        )
-                        results.append(fallback_response)
-                    except Exception as e2:
-                        logger.error(f"Fallback provider also failed: {e2}")
-                        results.append(f"Error: Both providers failed - {str(e2)}")
-                else:
-                    raise
+                    logger.info(
+                        "Using fallback provider for remaining prompts in batch"
+                    )
+                    return self._generate_with_fallback_provider(prompt, **kwargs)
+            return response
+        except Exception as e:
+            logger.warning(f"Primary provider failed for prompt in batch: {e}")
+            primary_failed.set()
+            if not self.fallback_provider:
+                raise
+            logger.info("Using fallback provider for remaining prompts in batch")
+            return self._generate_with_fallback_provider(prompt, **kwargs)
 
-        return results
+    def _generate_with_fallback_provider(self, prompt: str, **kwargs) -> str:
+        """Generate text for one prompt of a batch with the fallback provider."""
+        try:
+            return self.fallback_provider.generate(prompt, **kwargs)
+        except Exception as e:
+            logger.error(f"Fallback provider also failed: {e}")
+            return f"Error: Both providers failed - {str(e)}"
 
     def get_embeddings(self, texts: list[str], **kwargs) -> list[list[float]]:
         """Get embeddings with fallback."""
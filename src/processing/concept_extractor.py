@@ -14,11 +14,13 @@ import json
 import logging
 import os
 import re
+from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
 # Import LLM integration
 from src.llm.llm_provider import LLMManager, create_llm_provider
+from src.processing.document_processor import optimize_chunk_size, smart_chunk_text
 
 # Configure logging
 logging.basicConfig(
@@ -314,6 +316,11 @@ def setup_llm_manager(config: dict[str, Any]) -> LLMManager | None:
     return LLMManager(primary_provider, fallback_provider)
 
 
+# System prompt shared by all Pass 1 (per-chunk concept extraction) LLM calls
+PASS1_SYSTEM_PROMPT = "You are an expert in knowledge extraction and ontology creation. Your task is to identify key concepts from the provided text chunk."
+# System prompt shared by all Pass 2 (relationship analysis) LLM calls
+PASS2_SYSTEM_PROMPT = "You are an expert in knowledge graph construction and semantic relationship analysis. Identify precise and meaningful relationships."
+
 # Initialize LLM manager
 llm_manager = None
 
@@ -753,10 +760,8 @@ class ConceptExtractor:
             )
             return {"concepts": [], "relationships": []}
 
-    def _llm_pass1_extract_concepts_from_chunk(
-        self, text_chunk: str
-    ) -> list[dict[str, Any]]:
-        """Pass 1: Extract concepts from a single text chunk using LLM."""
+    def _build_pass1_prompt(self, text_chunk: str) -> str:
+        """Build the Pass 1 concept extraction prompt for a single text chunk."""
         max_text_length = 3000  # Max length for a chunk to send to LLM
         truncated_text = (
             text_chunk[:max_text_length] + "..."
@@ -789,14 +794,20 @@ class ConceptExtractor:
         TEXT CHUNK:
         {truncated_text}
         """
-        system_prompt = "You are an expert in knowledge extraction and ontology creation. Your task is to identify key concepts from the provided text chunk."
+        return prompt
+
+    def _llm_pass1_extract_concepts_from_chunk(
+        self, text_chunk: str
+    ) -> list[dict[str, Any]]:
+        """Pass 1: Extract concepts from a single text chunk using LLM."""
+        prompt = self._build_pass1_prompt(text_chunk)
 
         if llm_manager is None:
             logger.error("LLM manager is not initialized for Pass 1.")
             return []
         try:
             response = llm_manager.generate(
-                prompt, system_prompt=system_prompt, max_tokens=2000
+                prompt, system_prompt=PASS1_SYSTEM_PROMPT, max_tokens=2000
             )
             if response.startswith("Error:") or response.startswith("API Response:"):
                 logger.warning(
@@ -808,10 +819,55 @@ class ConceptExtractor:
             logger.error(f"Exception during Pass 1 concept extraction: {e}")
             return []
 
-    def _llm_pass2_analyze_relationships(
-        self, concepts: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """Pass 2: Analyze relationships between a list of unique concepts using LLM."""
+    def extract_concepts_llm_batch(
+        self, chunks: list[str], max_concepts: int | None = 15
+    ) -> list[list[dict[str, Any]]]:
+        """Pass 1 concept extraction for several chunks with one generate_batch call.
+
+        All chunk prompts are handed to ``LLMManager.generate_batch`` at once
+        instead of issuing one ``generate`` call per chunk from a Python loop.
+        The providers have no multi-prompt endpoint, so this is still one HTTP
+        request per chunk, but up to ``LLM_BATCH_CONCURRENCY`` of them are in
+        flight at a time instead of running one after another.
+
+        Args:
+            chunks: Text chunks to extract concepts from
+            max_concepts: Maximum number of concepts to keep per chunk (None keeps all)
+
+        Returns:
+            One list of concept dictionaries per input chunk, in input order.
+
+        """
+        if not chunks:
+            return []
+        if llm_manager is None:
+            logger.error("LLM manager is not initialized for batched Pass 1.")
+            return [[] for _ in chunks]
+
+        prompts = [self._build_pass1_prompt(chunk) for chunk in chunks]
+        try:
+            responses = llm_manager.generate_batch(
+                prompts, system_prompt=PASS1_SYSTEM_PROMPT, max_tokens=2000
+            )
+        except Exception as e:
+            logger.error(f"Exception during batched Pass 1 concept extraction: {e}")
+            return [[] for _ in chunks]
+
+        results: list[list[dict[str, Any]]] = []
+        for i, response in enumerate(responses):
+            if response.startswith("Error:") or response.startswith("API Response:"):
+                logger.warning(
+                    f"LLM error during batched Pass 1 for chunk {i + 1}: {response}"
+                )
+                results.append([])
+                continue
+            results.append(self._parse_llm_json_response(response)[:max_concepts])
+        # Pad in case the provider returned fewer responses than prompts
+        results.extend([] for _ in range(len(chunks) - len(results)))
+        return results
+
+    def _build_pass2_prompt(self, concepts: list[dict[str, Any]]) -> str | None:
+        """Build the Pass 2 relationship prompt, or None if there are no concept names."""
         concept_names = [
             concept["name"]
             for concept in concepts
@@ -823,7 +879,7 @@ class ConceptExtractor:
             logger.info(
                 "Pass 2: No valid concept names provided for relationship analysis."
             )
-            return []
+            return None
 
         max_concepts_for_analysis = 25
         if len(concept_names) > max_concepts_for_analysis:
@@ -871,14 +927,22 @@ class ConceptExtractor:
         Only include relationships that are clearly supported or implied by general knowledge about these concepts.
         Focus on quality and relevance of relationships. Ensure 'source' and 'target' are from the provided list.
         """
-        system_prompt = "You are an expert in knowledge graph construction and semantic relationship analysis. Identify precise and meaningful relationships."
+        return prompt
+
+    def _llm_pass2_analyze_relationships(
+        self, concepts: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Pass 2: Analyze relationships between a list of unique concepts using LLM."""
+        prompt = self._build_pass2_prompt(concepts)
+        if prompt is None:
+            return []
 
         if llm_manager is None:
             logger.error("LLM manager is not initialized for Pass 2.")
             return []
         try:
             response = llm_manager.generate(
-                prompt, system_prompt=system_prompt, max_tokens=3000
+                prompt, system_prompt=PASS2_SYSTEM_PROMPT, max_tokens=3000
             )
             if response.startswith("Error:") or response.startswith("API Response:"):
                 logger.warning(
@@ -890,6 +954,51 @@ class ConceptExtractor:
             logger.error(f"Exception during Pass 2 relationship analysis: {e}")
             return []
 
+    def extract_relationships_llm_batch(
+        self, concepts_per_chunk: list[list[dict[str, Any]]]
+    ) -> list[list[dict[str, Any]]]:
+        """Pass 2 relationship analysis for several chunks with one generate_batch call.
+
+        Counterpart of ``extract_concepts_llm_batch``: each chunk's concepts get
+        their own Pass 2 prompt, and the prompts run concurrently.
+
+        Args:
+            concepts_per_chunk: Pass 1 concepts of each chunk
+
+        Returns:
+            One list of relationship dictionaries per input chunk, in input order.
+
+        """
+        prompts = [
+            self._build_pass2_prompt(concepts) for concepts in concepts_per_chunk
+        ]
+        indices = [i for i, prompt in enumerate(prompts) if prompt is not None]
+        results: list[list[dict[str, Any]]] = [[] for _ in concepts_per_chunk]
+        if not indices:
+            return results
+        if llm_manager is None:
+            logger.error("LLM manager is not initialized for batched Pass 2.")
+            return results
+
+        try:
+            responses = llm_manager.generate_batch(
+                [prompts[i] for i in indices],
+                system_prompt=PASS2_SYSTEM_PROMPT,
+                max_tokens=3000,
+            )
+        except Exception as e:
+            logger.error(f"Exception during batched Pass 2 relationship analysis: {e}")
+            return results
+
+        for i, response in zip(indices, responses, strict=False):
+            if response.startswith("Error:") or response.startswith("API Response:"):
+                logger.warning(
+                    f"LLM error during batched Pass 2 for chunk {i + 1}: {response}"
+                )
+                continue
+            results[i] = self._parse_llm_json_response(response)
+        return results
+
     def _parse_llm_json_response(self, response: str) -> list[dict[str, Any]]:
         """Parse JSON array from LLM response string.
         Handles cases where JSON might be embedded or be a single object.
@@ -952,14 +1061,20 @@ class ConceptExtractor:
             f"Split document into {len(chunks)} chunks for two-pass LLM extraction."
         )
 
-        all_chunk_concepts: list[dict[str, Any]] = []
-        for i, chunk_text_item in enumerate(chunks):
+        if len(chunks) > 1:
             logger.info(
-                f"Processing chunk {i + 1}/{len(chunks)} for Pass 1 concept extraction ({len(chunk_text_item)} chars)."
+                f"Submitting {len(chunks)} chunks as one batch for Pass 1 concept extraction."
             )
-            chunk_concepts = self._llm_pass1_extract_concepts_from_chunk(
-                chunk_text_item
+            concepts_per_chunk = self.extract_concepts_llm_batch(
+                chunks, max_concepts=None
             )
+        else:
+            concepts_per_chunk = [
+                self._llm_pass1_extract_concepts_from_chunk(chunk) for chunk in chunks
+            ]
+
+        all_chunk_concepts: list[dict[str, Any]] = []
+        for i, chunk_concepts in enumerate(concepts_per_chunk):
             for concept in chunk_concepts:
                 if isinstance(concept, dict):
                     concept["source_chunk_index"] = i
@@ -973,7 +1088,13 @@ class ConceptExtractor:
             f"Pass 1: Extracted {len(all_chunk_concepts)} raw concepts in total from all chunks."
         )
 
-        unique_concepts_map: dict[str, dict[str, Any]] = {}
+        # Collect per-concept fields in lists and merge each concept once at the
+        # end, instead of re-concatenating descriptions on every repeat.
+        first_by_name: dict[str, dict[str, Any]] = {}
+        occurrences: dict[str, int] = defaultdict(int)
+        descriptions: dict[str, list[str]] = defaultdict(list)
+        related_by_name: dict[str, dict[str, None]] = defaultdict(dict)
+        chunk_indices: dict[str, list[int]] = defaultdict(list)
         for concept_item in all_chunk_concepts:
             if (
                 not isinstance(concept_item, dict)
@@ -986,47 +1107,31 @@ class ConceptExtractor:
                 continue
 
             name_lower = concept_item["name"].lower()
-            if name_lower not in unique_concepts_map:
-                unique_concepts_map[name_lower] = concept_item.copy()
-            else:
-                existing_concept = unique_concepts_map[name_lower]
-                new_desc = concept_item.get("description", "")
-                if new_desc and new_desc not in existing_concept.get("description", ""):
-                    existing_concept["description"] = (
-                        existing_concept.get("description", "") + "; " + new_desc
-                    ).strip("; ")
-
-                new_related = concept_item.get("related_concepts", [])
-                if isinstance(new_related, list):
-                    existing_related_set = set(
-                        existing_concept.get("related_concepts", [])
-                    )
-                    existing_related_set.update(
-                        r_concept
-                        for r_concept in new_related
-                        if isinstance(r_concept, str)
-                    )
-                    existing_concept["related_concepts"] = list(existing_related_set)
-
-                current_chunk_idx = concept_item.get("source_chunk_index")
-                if "source_chunk_indices" not in existing_concept:
-                    first_occurrence_idx = existing_concept.get("source_chunk_index")
-                    existing_concept["source_chunk_indices"] = (
-                        [first_occurrence_idx]
-                        if first_occurrence_idx is not None
-                        else []
-                    )
-
-                if (
-                    current_chunk_idx is not None
-                    and current_chunk_idx
-                    not in existing_concept["source_chunk_indices"]
-                ):
-                    existing_concept["source_chunk_indices"].append(current_chunk_idx)
+            first_by_name.setdefault(name_lower, concept_item)
+            occurrences[name_lower] += 1
+            if concept_item.get("description"):
+                descriptions[name_lower].append(concept_item["description"])
+            related = concept_item.get("related_concepts", [])
+            if isinstance(related, list):
+                related_by_name[name_lower].update(
+                    dict.fromkeys(r for r in related if isinstance(r, str))
+                )
+            if concept_item.get("source_chunk_index") is not None:
+                chunk_indices[name_lower].append(concept_item["source_chunk_index"])
 
-        deduplicated_concepts_list = list(unique_concepts_map.values())
-        for concept in deduplicated_concepts_list:
+        deduplicated_concepts_list: list[dict[str, Any]] = []
+        for name_lower, first_concept in first_by_name.items():
+            concept = first_concept.copy()
             concept.pop("source_chunk_index", None)
+            if occurrences[name_lower] > 1:
+                merged_description = "; ".join(dict.fromkeys(descriptions[name_lower]))
+                if merged_description:
+                    concept["description"] = merged_description
+                concept["related_concepts"] = list(related_by_name[name_lower])
+                concept["source_chunk_indices"] = list(
+                    dict.fromkeys(chunk_indices[name_lower])
+                )
+            deduplicated_concepts_list.append(concept)
 
         logger.info(
             f"Pass 1: Consolidated to {len(deduplicated_concepts_list)} unique concepts."
@@ -1062,12 +1167,6 @@ class ConceptExtractor:
             List of text chunks
 
         """
-        # Import the document processor
-        from src.processing.document_processor import (
-            optimize_chunk_size,
-            smart_chunk_text,
-        )
-
         # Determine optimal chunk size based on document characteristics
         optimal_chunk_size = optimize_chunk_size(text, default_size=chunk_size)
 
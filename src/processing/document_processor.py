@@ -11,6 +11,7 @@ This module provides optimized document processing functions for:
 import logging
 import re
 import uuid
+from collections.abc import Iterator
 from typing import Any
 
 # Configure logging
@@ -29,14 +30,36 @@ LARGE_DOC_THRESHOLD = 500000  # > 0.5MB
 SMALL_CHUNK_SIZE = 500
 MEDIUM_CHUNK_SIZE = 750
 
+# Text-splitting patterns, compiled once and shared by every chunking call
+_INLINE_WHITESPACE_RE = re.compile(r"([^\n])\s+([^\n])")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n\s*")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
 
-def smart_chunk_text(
+
+def split_sentences(text: str) -> list[str]:
+    """Split text on sentence-ending punctuation followed by whitespace.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of sentences
+
+    """
+    return _SENTENCE_SPLIT_RE.split(text)
+
+
+def chunk_iter(
     text: str,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     overlap: int = DEFAULT_OVERLAP,
     semantic_boundaries: bool = True,
-) -> list[str]:
-    """Split text into overlapping chunks using semantic boundaries.
+) -> Iterator[str]:
+    """Yield overlapping chunks of text, split on semantic boundaries.
+
+    Generator form of ``smart_chunk_text`` for callers that can consume chunks
+    as they are produced.
 
     Args:
         text: Text to chunk
@@ -44,28 +67,26 @@ def smart_chunk_text(
         overlap: Overlap between chunks in characters
         semantic_boundaries: Whether to use semantic boundaries (paragraphs, sentences)
 
-    Returns:
-        List of text chunks
+    Yields:
+        Text chunks in document order
 
     """
-    chunks = []
-
     # Clean text: normalize whitespace while preserving paragraph breaks
     # First, ensure consistent line endings
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Replace multiple spaces with a single space, but preserve paragraph breaks
-    text = re.sub(r"([^\n])\s+([^\n])", r"\1 \2", text)
+    text = _INLINE_WHITESPACE_RE.sub(r"\1 \2", text)
 
     # Normalize paragraph breaks (multiple newlines become exactly two newlines)
-    text = re.sub(r"\n\s*\n\s*", "\n\n", text)
+    text = _PARAGRAPH_BREAK_RE.sub("\n\n", text)
 
     # Ensure text doesn't start or end with excessive whitespace
     text = text.strip()
 
     if semantic_boundaries:
         # First try to split by paragraphs (double line breaks)
-        paragraphs = re.split(r"\n\s*\n", text)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
 
         # Handle very large paragraphs by splitting them further
         processed_paragraphs = []
@@ -76,8 +97,7 @@ def smart_chunk_text(
                     f"Splitting large paragraph of size {len(paragraph)} into sentences"
                 )
                 # Split by sentence boundaries
-                sentences = re.split(r"(?<=[.!?])\s+", paragraph)
-                processed_paragraphs.extend(sentences)
+                processed_paragraphs.extend(split_sentences(paragraph))
             else:
                 processed_paragraphs.append(paragraph)
 
@@ -90,7 +110,7 @@ def smart_chunk_text(
             if len(paragraph) > chunk_size:
                 # If we have content in the current chunk, save it first
                 if current_chunk:
-                    chunks.append(current_chunk.strip())
+                    yield current_chunk.strip()
                     current_chunk = ""
                     current_paragraphs = []
 
@@ -100,14 +120,14 @@ def smart_chunk_text(
                 )
                 for i in range(0, len(paragraph), chunk_size - overlap):
                     if i + chunk_size >= len(paragraph):
-                        chunks.append(paragraph[i:].strip())
+                        yield paragraph[i:].strip()
                     else:
-                        chunks.append(paragraph[i : i + chunk_size].strip())
+                        yield paragraph[i : i + chunk_size].strip()
                 continue
 
             # If adding this paragraph would exceed chunk size, save current chunk and start a new one
             if len(current_chunk) + len(paragraph) > chunk_size and current_chunk:
-                chunks.append(current_chunk.strip())
+                yield current_chunk.strip()
 
                 # Start new chunk with overlap from the end of the previous chunk
                 if len(current_chunk) > overlap:
@@ -134,19 +154,38 @@ def smart_chunk_text(
 
         # Add the last chunk if it's not empty
         if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+            yield current_chunk.strip()
     else:
         # Simple chunking by character count
         for i in range(0, len(text), chunk_size - overlap):
             # Don't start a new chunk if we're near the end
             if i + chunk_size >= len(text):
                 if i > 0:  # Only add the last chunk if it's not the only chunk
-                    chunks.append(text[i:].strip())
+                    yield text[i:].strip()
                 break
 
-            chunks.append(text[i : i + chunk_size].strip())
+            yield text[i : i + chunk_size].strip()
 
-    return chunks
+
+def smart_chunk_text(
+    text: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    overlap: int = DEFAULT_OVERLAP,
+    semantic_boundaries: bool = True,
+) -> list[str]:
+    """Split text into overlapping chunks using semantic boundaries.
+
+    Args:
+        text: Text to chunk
+        chunk_size: Maximum chunk size in characters
+        overlap: Overlap between chunks in characters
+        semantic_boundaries: Whether to use semantic boundaries (paragraphs, sentences)
+
+    Returns:
+        List of text chunks
+
+    """
+    return list(chunk_iter(text, chunk_size, overlap, semantic_boundaries))
 
 
 def batch_process_documents(
@@ -38,20 +38,25 @@ class DuplicateDetector:
         return hashlib.sha256(normalized_text.encode()).hexdigest()
 
     def is_duplicate(
-        self, text: str, metadata: dict[str, Any]
+        self,
+        text: str,
+        metadata: dict[str, Any],
+        precomputed_hash: str | None = None,
     ) -> tuple[bool, str | None, str]:
         """Check if a document is a duplicate.
 
         Args:
             text: Document text
             metadata: Document metadata
+            precomputed_hash: Hash of the text already computed by the caller,
+                used when metadata has no "hash" to avoid hashing it again
 
         Returns:
             Tuple of (is_duplicate, existing_doc_id, method)
 
         """
         # Check by hash if provided in metadata
-        doc_hash = metadata.get("hash")
+        doc_hash = metadata.get("hash") or precomputed_hash
         if not doc_hash:
             doc_hash = self.generate_document_hash(text)
 
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+try:
+    import src.processing.concept_extractor as concept_extractor_module
+    from src.processing.concept_extractor import ConceptExtractor
+except ImportError:
+    pytest.fail(
+        "Could not import ConceptExtractor. Make sure src.processing.concept_extractor exists."
+    )
+
+
+@pytest.fixture
+def mock_llm_manager():
+    """Patch the module-level LLM manager used by ConceptExtractor."""
+    manager = MagicMock()
+    with patch.object(concept_extractor_module, "llm_manager", manager):
+        yield manager
+
+
+def test_extract_concepts_llm_batch_single_request(mock_llm_manager):
+    """All chunks should be sent to the LLM in one generate_batch call."""
+    mock_llm_manager.generate_batch.return_value = [
+        '[{"name": "Neural Network"}, {"name": "Backpropagation"}]',
+        '[{"name": "Transformer"}]',
+    ]
+    extractor = ConceptExtractor(use_nlp=False, use_llm=True)
+
+    results = extractor.extract_concepts_llm_batch(["chunk one", "chunk two"])
+
+    assert mock_llm_manager.generate_batch.call_count == 1
+    assert mock_llm_manager.generate.call_count == 0
+    prompts = mock_llm_manager.generate_batch.call_args[0][0]
+    assert len(prompts) == 2
+    assert [[c["name"] for c in r] for r in results] == [
+        ["Neural Network", "Backpropagation"],
+        ["Transformer"],
+    ]
+
+
+def test_extract_concepts_llm_batch_errors_and_limit(mock_llm_manager):
+    """Error responses yield empty lists and max_concepts caps each chunk."""
+    mock_llm_manager.generate_batch.return_value = [
+        '[{"name": "A"}, {"name": "B"}, {"name": "C"}]',
+        "Error: rate limited",
+    ]
+    extractor = ConceptExtractor(use_nlp=False, use_llm=True)
+
+    results = extractor.extract_concepts_llm_batch(["x", "y", "z"], max_concepts=2)
+
+    assert results == [[{"name": "A"}, {"name": "B"}], [], []]
+
+
+def test_two_pass_merges_repeated_concepts(mock_llm_manager):
+    """Concepts repeated across chunks are merged once with deduplicated fields."""
+    mock_llm_manager.generate_batch.return_value = [
+        '[{"name": "GPU", "description": "Graphics processor", "related_concepts": ["CUDA"]}]',
+        '[{"name": "gpu", "description": "Graphics processor"}, {"name": "CUDA"}]',
+        '[{"name": "GPU", "description": "Parallel hardware", "related_concepts": ["CUDA", "VRAM"]}]',
+    ]
+    extractor = ConceptExtractor(use_nlp=False, use_llm=True)
+
+    with (
+        patch.object(extractor, "_chunk_text", return_value=["a", "b", "c"]),
+        patch.object(extractor, "_llm_pass2_analyze_relationships", return_value=[]),
+    ):
+        result = extractor._extract_concepts_and_relationships_with_llm_manager("abc")
+
+    gpu, cuda = result["concepts"]
+    assert gpu["name"] == "GPU"
+    assert gpu["description"] == "Graphics processor; Parallel hardware"
+    assert gpu["related_concepts"] == ["CUDA", "VRAM"]
+    assert gpu["source_chunk_indices"] == [0, 1, 2]
+    assert cuda == {"name": "CUDA"}
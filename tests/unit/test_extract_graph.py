@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+try:
+    import src.processing.concept_extractor as concept_extractor_module
+    from scripts.document_processing.add_document_core import extract_graph
+    from src.processing.concept_extractor import ConceptExtractor
+except ImportError:
+    pytest.fail(
+        "Could not import extract_graph. Make sure scripts.document_processing.add_document_core exists."
+    )
+
+
+@pytest.fixture
+def mock_llm_manager():
+    """Patch the module-level LLM manager used by ConceptExtractor."""
+    manager = MagicMock()
+    with patch.object(concept_extractor_module, "llm_manager", manager):
+        yield manager
+
+
+def test_batched_chunks_make_one_llm_round_each(mock_llm_manager):
+    """Each chunk costs one Pass 1 and one Pass 2 prompt, both batched."""
+    chunks = [
+        "A neural network is trained with backpropagation.",
+        "A transformer is built on attention.",
+    ]
+    mock_llm_manager.generate_batch.side_effect = [
+        [
+            '[{"name": "Neural Network"}, {"name": "Backpropagation"}]',
+            '[{"name": "Transformer"}, {"name": "Attention"}]',
+        ],
+        [
+            '[{"source": "Neural Network", "target": "Backpropagation", "type": "USES"}]',
+            '[{"source": "Transformer", "target": "Attention", "type": "USES"}]',
+        ],
+    ]
+    extractor = ConceptExtractor(use_nlp=False, use_llm=True)
+
+    concepts = extractor.extract_concepts_llm_batch(chunks)
+    relationships = extractor.extract_relationships_llm_batch(concepts)
+    results = [
+        extract_graph(
+            chunk,
+            {},
+            extractor,
+            llm_concepts=chunk_concepts,
+            llm_relationships=chunk_relationships,
+        )
+        for chunk, chunk_concepts, chunk_relationships in zip(
+            chunks, concepts, relationships, strict=True
+        )
+    ]
+
+    assert mock_llm_manager.generate.call_count == 0
+    assert [
+        len(call[0][0]) for call in mock_llm_manager.generate_batch.call_args_list
+    ] == [
+        len(chunks),
+        len(chunks),
+    ]
+    for _, chunk_relationships in results:
+        assert [r["method"] for r in chunk_relationships if r["type"] == "USES"] == [
+            "llm"
+        ]
+
+
+def test_batched_concepts_without_relationships_make_no_llm_call(mock_llm_manager):
+    """Concepts from a batched call never trigger a per-chunk two-pass extraction."""
+    extractor = ConceptExtractor(use_nlp=False, use_llm=True)
+
+    with patch.object(extractor, "extract_concepts_llm") as extract_concepts_llm:
+        extract_graph(
+            "A neural network is trained with backpropagation.",
+            {},
+            extractor,
+            llm_concepts=[{"name": "Neural Network"}, {"name": "Backpropagation"}],
+        )
+
+    extract_concepts_llm.assert_not_called()
+    assert mock_llm_manager.generate.call_count == 0
+    assert mock_llm_manager.generate_batch.call_count == 0
@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    from src.llm.llm_provider import LLM_BATCH_CONCURRENCY, LLMManager
+except ImportError:
+    pytest.fail("Could not import LLMManager. Make sure src.llm.llm_provider exists.")
+
+
+def test_generate_batch_stops_using_failed_primary():
+    """Once the primary fails, unsent prompts in the batch go to the fallback."""
+    primary = MagicMock()
+    primary.generate.return_value = "Error: rate limited"
+    fallback = MagicMock()
+    fallback.generate.side_effect = lambda prompt, **kwargs: f"ok {prompt}"
+    manager = LLMManager(primary, fallback)
+    prompts = [f"p{i}" for i in range(20)]
+
+    results = manager.generate_batch(prompts)
+
+    assert results == [f"ok {prompt}" for prompt in prompts]
+    # Only prompts already in flight when the first failure came back reach it
+    assert primary.generate.call_count <= max(1, LLM_BATCH_CONCURRENCY)
+
+
+def test_generate_batch_keeps_primary_when_it_succeeds():
+    """Without a primary failure, the fallback provider is never used."""
+    primary = MagicMock()
+    primary.generate.side_effect = lambda prompt, **kwargs: f"ok {prompt}"
+    fallback = MagicMock()
+    manager = LLMManager(primary, fallback)
+
+    assert manager.generate_batch(["a", "b", "c"]) == ["ok a", "ok b", "ok c"]
+    fallback.generate.assert_not_called()
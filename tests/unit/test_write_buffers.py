@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    from scripts.document_processing.add_document_core import (
+        GraphWriteBuffer,
+        VectorWriteBuffer,
+        mark_unwritten_documents_failed,
+    )
+except ImportError:
+    pytest.fail(
+        "Could not import the write buffers. Make sure scripts.document_processing.add_document_core exists."
+    )
+
+
+class FakeVectorDatabase:
+    """Records add_documents calls and fails any call containing a bad document."""
+
+    def __init__(self, bad_document_ids=()):
+        self.bad_document_ids = set(bad_document_ids)
+        self.calls = []
+
+    def add_documents(self, documents, metadatas, ids):
+        self.calls.append(list(ids))
+        return not any(m["document_id"] in self.bad_document_ids for m in metadatas)
+
+
+class FakeNeo4jDatabase:
+    """Records execute_write batches and fails any batch containing a bad document."""
+
+    def __init__(self, bad_document_ids=()):
+        self.bad_document_ids = set(bad_document_ids)
+        self.batches = []
+
+    def execute_write(self, work, documents):
+        ids = [doc_props["id"] for doc_props, _, _ in documents]
+        self.batches.append(ids)
+        if self.bad_document_ids.intersection(ids):
+            raise RuntimeError("write failed")
+
+
+def _vector_row(doc_id):
+    return (f"text of {doc_id}", {"document_id": doc_id}, doc_id)
+
+
+def test_vector_buffer_retries_failed_batch_per_document():
+    """Only the document that fails on its own is reported as failed."""
+    vector_db = FakeVectorDatabase(bad_document_ids={"doc-2"})
+
+    with VectorWriteBuffer(vector_db, batch_size=3) as buffer:
+        for doc_id in ("doc-1", "doc-2", "doc-3"):
+            buffer.add(*_vector_row(doc_id))
+
+    assert vector_db.calls == [
+        ["doc-1", "doc-2", "doc-3"],
+        ["doc-1"],
+        ["doc-2"],
+        ["doc-3"],
+    ]
+    assert buffer.failed_document_ids == {"doc-2"}
+    assert buffer.flush() is False
+
+
+def test_vector_buffer_tracks_pending_documents():
+    """Queued rows stay pending until the buffer flushes."""
+    vector_db = FakeVectorDatabase()
+    buffer = VectorWriteBuffer(vector_db, batch_size=10)
+    buffer.add(*_vector_row("doc-1"))
+
+    assert buffer.pending_document_ids() == {"doc-1"}
+    assert buffer.flush() is True
+    assert buffer.pending_document_ids() == set()
+
+
+def test_graph_buffer_retries_failed_batch_and_skips_its_vectors():
+    """A bad document neither rolls back its batch nor gets vector rows."""
+    neo4j_db = FakeNeo4jDatabase(bad_document_ids={"doc-2"})
+    vector_db = FakeVectorDatabase()
+
+    with VectorWriteBuffer(vector_db, batch_size=10) as vector_buffer:
+        with GraphWriteBuffer(neo4j_db, vector_buffer, batch_size=3) as graph_buffer:
+            for doc_id in ("doc-1", "doc-2", "doc-3"):
+                graph_buffer.add({"id": doc_id}, [], [], [_vector_row(doc_id)])
+
+    assert neo4j_db.batches == [
+        ["doc-1", "doc-2", "doc-3"],
+        ["doc-1"],
+        ["doc-2"],
+        ["doc-3"],
+    ]
+    assert graph_buffer.failed_document_ids == {"doc-2"}
+    assert vector_db.calls == [["doc-1", "doc-3"]]
+
+
+def test_graph_buffer_reports_failed_background_batch():
+    """A failure in a batch committed on the writer thread reaches flush()."""
+    neo4j_db = FakeNeo4jDatabase(bad_document_ids={"doc-1"})
+    vector_buffer = VectorWriteBuffer(FakeVectorDatabase())
+
+    graph_buffer = GraphWriteBuffer(neo4j_db, vector_buffer, batch_size=1)
+    graph_buffer.add({"id": "doc-1"}, [], [], [])
+    graph_buffer.add({"id": "doc-2"}, [], [], [])
+
+    assert graph_buffer.flush() is False
+    assert graph_buffer.failed_document_ids == {"doc-1"}
+    graph_buffer.__exit__(None, None, None)
+
+
+def test_mark_unwritten_documents_failed():
+    """Successful results of failed documents become failures and are discarded."""
+    neo4j_db = MagicMock()
+    vector_db = MagicMock()
+    results = [
+        {"status": "success", "document_id": "doc-1"},
+        {"status": "success", "document_id": "doc-2"},
+        {"status": "duplicate", "document_id": "doc-3"},
+        None,
+    ]
+
+    count = mark_unwritten_documents_failed(
+        results, {"doc-2", "doc-3"}, neo4j_db, vector_db
+    )
+
+    assert count == 1
+    assert [r and r["status"] for r in results] == [
+        "success",
+        "failure",
+        "duplicate",
+        None,
+    ]
+    neo4j_db.execute_write.assert_called_once()
+    assert neo4j_db.execute_write.call_args[0][1] == ["doc-2"]
+    vector_db.delete.assert_called_once_with(where={"document_id": {"$in": ["doc-2"]}})